@@ -0,0 +1,47 @@
+"""Create course_read_model table
+
+Revision ID: 151ad679fdd2
+Revises: 5b21009d9445
+Create Date: 2026-10-19 12:24:57.093415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '151ad679fdd2'
+down_revision: Union[str, Sequence[str], None] = '5b21009d9445'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows are rendered by the API (ReadModelService.ensure_built) on the
+    # first read after this migration, since rendering uses the API schemas
+    op.create_table('course_read_model',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('department', sa.String(), nullable=False),
+    sa.Column('level', sa.String(), nullable=False),
+    sa.Column('language', sa.String(), nullable=True),
+    sa.Column('semester_mask', sa.Integer(), nullable=False),
+    sa.Column('search_text', sa.Text(), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_course_read_model_department'), 'course_read_model', ['department'], unique=False)
+    op.create_index(op.f('ix_course_read_model_language'), 'course_read_model', ['language'], unique=False)
+    op.create_index(op.f('ix_course_read_model_level'), 'course_read_model', ['level'], unique=False)
+    op.create_index(op.f('ix_course_read_model_semester_mask'), 'course_read_model', ['semester_mask'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_course_read_model_semester_mask'), table_name='course_read_model')
+    op.drop_index(op.f('ix_course_read_model_level'), table_name='course_read_model')
+    op.drop_index(op.f('ix_course_read_model_language'), table_name='course_read_model')
+    op.drop_index(op.f('ix_course_read_model_department'), table_name='course_read_model')
+    op.drop_table('course_read_model')
@@ -0,0 +1,59 @@
+"""Create course_statistics table
+
+Revision ID: 1988398706eb
+Revises: 44ddb1b6a825
+Create Date: 2026-10-19 10:12:31.507214
+
+"""
+from collections import Counter
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1988398706eb'
+down_revision: Union[str, Sequence[str], None] = '44ddb1b6a825'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    statistics = op.create_table('course_statistics',
+    sa.Column('dimension', sa.String(), nullable=False),
+    sa.Column('value', sa.String(), nullable=False),
+    sa.Column('course_count', sa.Integer(), nullable=False),
+    sa.Column('credits_sum', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('dimension', 'value')
+    )
+
+    # Backfill counters from the active courses
+    rows = op.get_bind().execute(sa.text(
+        "SELECT department, level, language, semester, credits FROM courses WHERE is_active"
+    )).fetchall()
+    counts = Counter()
+    credits = Counter()
+    counts[('overview', 'total')] += 0
+    for department, level, language, semester, course_credits in rows:
+        keys = [
+            ('overview', 'total'),
+            ('department', department),
+            ('level', level.lower()),
+            ('language', language or 'Norwegian'),
+        ]
+        keys.extend(('semester', s) for s in sorted({s.lower() for s in semester or []}))
+        for key in keys:
+            counts[key] += 1
+            credits[key] += course_credits or 0
+
+    op.bulk_insert(statistics, [
+        {'dimension': d, 'value': v, 'course_count': counts[(d, v)], 'credits_sum': credits[(d, v)]}
+        for d, v in counts
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('course_statistics')
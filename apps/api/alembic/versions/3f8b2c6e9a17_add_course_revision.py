@@ -0,0 +1,31 @@
+"""Add course revision column
+
+Revision ID: 3f8b2c6e9a17
+Revises: 9c3e5a7d21f4
+Create Date: 2026-10-19 14:47:12.904561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8b2c6e9a17'
+down_revision: Union[str, Sequence[str], None] = '9c3e5a7d21f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing courses start at revision 0, which a full sync (since=0) returns
+    op.add_column('courses', sa.Column('revision', sa.Integer(), server_default='0', nullable=False))
+    op.create_index(op.f('ix_courses_revision'), 'courses', ['revision'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_courses_revision'), table_name='courses')
+    op.drop_column('courses', 'revision')
@@ -0,0 +1,56 @@
+"""Add partial listing indexes and reverse prerequisite index
+
+Revision ID: 5b21009d9445
+Revises: e8e29b993083
+Create Date: 2026-10-19 11:41:05.628340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b21009d9445'
+down_revision: Union[str, Sequence[str], None] = 'e8e29b993083'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match models.active_index
+ACTIVE_INDEXES = {
+    'ix_courses_active_department_level': ['department', 'level'],
+    'ix_courses_active_level': ['level'],
+    'ix_courses_active_language': ['language'],
+    'ix_courses_active_semester_mask': ['semester_mask'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Duplicates the primary key index
+    op.drop_index('ix_courses_id', table_name='courses')
+    # Replaced by the partial indexes below
+    op.drop_index('ix_courses_department', table_name='courses')
+    op.drop_index('ix_courses_level', table_name='courses')
+    op.drop_index('ix_courses_semester_mask', table_name='courses')
+
+    for name, columns in ACTIVE_INDEXES.items():
+        op.create_index(
+            name, 'courses', columns, unique=False,
+            postgresql_where=sa.text('is_active'),
+            sqlite_where=sa.text('is_active = 1'),
+        )
+    op.create_index('ix_prerequisites_prerequisite_id', 'prerequisites', ['prerequisite_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_prerequisites_prerequisite_id', table_name='prerequisites')
+    for name in ACTIVE_INDEXES:
+        op.drop_index(name, table_name='courses')
+
+    op.create_index('ix_courses_semester_mask', 'courses', ['semester_mask'], unique=False)
+    op.create_index('ix_courses_level', 'courses', ['level'], unique=False)
+    op.create_index('ix_courses_department', 'courses', ['department'], unique=False)
+    op.create_index('ix_courses_id', 'courses', ['id'], unique=False)
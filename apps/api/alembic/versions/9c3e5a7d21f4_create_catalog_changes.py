@@ -0,0 +1,34 @@
+"""Create catalog_changes table
+
+Revision ID: 9c3e5a7d21f4
+Revises: 151ad679fdd2
+Create Date: 2026-10-19 14:02:31.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e5a7d21f4'
+down_revision: Union[str, Sequence[str], None] = '151ad679fdd2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('catalog_changes',
+    sa.Column('revision', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('course_id', sa.String(), nullable=True),
+    sa.Column('operation', sa.String(), nullable=False),
+    sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('revision')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('catalog_changes')
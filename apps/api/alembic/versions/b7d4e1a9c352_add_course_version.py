@@ -0,0 +1,28 @@
+"""Add course version column
+
+Revision ID: b7d4e1a9c352
+Revises: 3f8b2c6e9a17
+Create Date: 2026-10-19 16:05:41.218377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d4e1a9c352'
+down_revision: Union[str, Sequence[str], None] = '3f8b2c6e9a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('courses', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('courses', 'version')
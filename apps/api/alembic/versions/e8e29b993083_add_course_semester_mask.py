@@ -0,0 +1,47 @@
+"""Add semester_mask to courses
+
+Revision ID: e8e29b993083
+Revises: 1988398706eb
+Create Date: 2026-10-19 11:02:48.113906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8e29b993083'
+down_revision: Union[str, Sequence[str], None] = '1988398706eb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match models.SEMESTER_BITS
+SEMESTER_BITS = {'fall': 1, 'spring': 2}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('courses', sa.Column('semester_mask', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill the mask from the semester array
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, semester FROM courses")).fetchall()
+    updates = []
+    for course_id, semesters in rows:
+        mask = 0
+        for semester in semesters or []:
+            mask |= SEMESTER_BITS.get(semester.lower(), 0)
+        if mask:
+            updates.append({'id': course_id, 'mask': mask})
+    if updates:
+        bind.execute(sa.text("UPDATE courses SET semester_mask = :mask WHERE id = :id"), updates)
+
+    op.create_index(op.f('ix_courses_semester_mask'), 'courses', ['semester_mask'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_courses_semester_mask'), table_name='courses')
+    op.drop_column('courses', 'semester_mask')
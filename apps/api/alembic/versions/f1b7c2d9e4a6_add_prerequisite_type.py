@@ -0,0 +1,29 @@
+"""Add prerequisite edge type
+
+Revision ID: f1b7c2d9e4a6
+Revises: e8c3a5b71f04
+Create Date: 2026-10-20 09:14:52.381027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b7c2d9e4a6'
+down_revision: Union[str, Sequence[str], None] = 'e8c3a5b71f04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing edges predate edge types and are all mandatory
+    op.add_column('prerequisites', sa.Column('type', sa.String(), server_default='mandatory', nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('prerequisites', 'type')
@@ -0,0 +1,60 @@
+"""
+Import time of the API, measured with `python -X importtime`.
+
+Imports `src.main` in fresh interpreters and reports the median cumulative
+import time plus the slowest modules. Importing must not touch the
+database, so this also fails if the import created an engine.
+
+Run with: cd apps/api && python -m benchmarks.import_time [--runs 5] [--budget-ms 1500]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE = "src.main"
+IMPORT = f"import {MODULE}, src.database as d; assert d._engine is None, 'import created an engine'"
+
+
+def import_times():
+    """{module: cumulative microseconds} for one fresh import of MODULE"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT],
+        cwd=API_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(result.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, help="Exit with an error above this median")
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    total = statistics.median(run[MODULE] for run in runs) / 1000
+    print(f"{MODULE}: {total:.1f} ms (median of {args.runs} runs)")
+
+    last = runs[-1]
+    top_level = {name: us for name, us in last.items() if "." not in name or name.startswith("src.")}
+    for name, us in sorted(top_level.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    if args.budget_ms is not None and total > args.budget_ms:
+        raise SystemExit(f"Import time {total:.1f} ms is over the {args.budget_ms:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Memory held per 10k courses by the different in-memory representations.
+
+Loads a synthetic catalog into an in-memory SQLite database and measures,
+with tracemalloc, what stays allocated while each representation is held:
+ORM instances in a session, pydantic CourseRead models, CourseRecords, and
+the filter engine's columns. The filter engine is measured again with one
+very long description, which must not grow the other rows.
+
+Run with: cd apps/api && python -m benchmarks.memory_footprint [--courses 10000]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from src.database import Base
+from src.models import Course, semester_mask
+from src.schemas import CourseRead
+from src.services.course_record import load_course_records
+from src.services.filter_engine import FilterEngine
+from src.services.read_model_service import COURSE_COLUMNS
+
+DEPARTMENTS = ["Informatics", "Mathematics", "Physics", "Chemistry", "Biosciences",
+               "Geosciences", "Pharmacy", "Economics"]
+LEVELS = ["bachelor", "master", "phd"]
+SEMESTERS = [["fall"], ["spring"], ["fall", "spring"]]
+# Characters in the outlier description, and how much it may add in all
+LONG_DESCRIPTION = 100_000
+LONG_DESCRIPTION_BUDGET = 4 * LONG_DESCRIPTION
+
+
+def synthetic_courses(count: int):
+    for n in range(count):
+        semester = SEMESTERS[n % len(SEMESTERS)]
+        yield {
+            "id": f"BM{chr(ord('A') + n // 10000)}{n % 10000:04d}",
+            "title": f"Course number {n}",
+            "title_english": f"Course number {n} (English)",
+            "description": f"Course {n} covers topics " + "in depth " * 20,
+            "instructor": f"Instructor {n % 300}",
+            "credits": (5, 10, 15, 20)[n % 4],
+            "department": DEPARTMENTS[n % len(DEPARTMENTS)],
+            "level": LEVELS[n % len(LEVELS)],
+            "language": "English" if n % 3 == 0 else "Norwegian",
+            "semester": semester,
+            "semester_mask": semester_mask(semester),
+            "is_active": True,
+        }
+
+
+def measure(build):
+    """Bytes still allocated while the result of `build()` is alive"""
+    gc.collect()
+    tracemalloc.start()
+    held = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, held
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courses", type=int, default=10000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.execute(insert(Course), list(synthetic_courses(args.courses)))
+        db.commit()
+
+    def orm_instances():
+        db = Session(engine)
+        return db, db.scalars(select(Course)).all()
+
+    def pydantic_models():
+        with Session(engine) as db:
+            rows = db.execute(select(*COURSE_COLUMNS)).mappings().all()
+            return [CourseRead.model_validate(dict(row)) for row in rows]
+
+    def course_records():
+        with Session(engine) as db:
+            return load_course_records(db)
+
+    def filter_engine():
+        with Session(engine) as db:
+            return FilterEngine.from_records(load_course_records(db))
+
+    sizes = {}
+    print(f"{'representation':<20}{'total MiB':>12}{'bytes/course':>15}{'MiB per 10k':>14}")
+    for name, build in (
+        ("ORM instances", orm_instances),
+        ("pydantic CourseRead", pydantic_models),
+        ("CourseRecord", course_records),
+        ("FilterEngine", filter_engine),
+    ):
+        size, held = measure(build)
+        sizes[name] = size
+        per_course = size / args.courses
+        print(f"{name:<20}{size / 2**20:>12.2f}{per_course:>15.0f}{per_course * 10000 / 2**20:>14.2f}")
+        del held
+
+    with Session(engine) as db:
+        first = db.scalar(select(Course.id).order_by(Course.id).limit(1))
+        db.execute(Course.__table__.update().where(Course.id == first).values(description="x" * LONG_DESCRIPTION))
+        db.commit()
+    size, held = measure(filter_engine)
+    del held
+    grown = size - sizes["FilterEngine"]
+    print(f"FilterEngine with one {LONG_DESCRIPTION}-character description: {grown / 2**20:+.2f} MiB")
+    # A fixed-width text column would pad every row to the long one
+    assert grown < LONG_DESCRIPTION_BUDGET, f"one long description added {grown} bytes"
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,21 @@
 import os
 import secrets
+from typing import Optional
 from fastapi import HTTPException, Security
 from fastapi.security import APIKeyHeader
 
 _api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
-async def require_api_key(api_key: str = Security(_api_key_header)):
+def is_valid_api_key(api_key: Optional[str]) -> bool:
+    """Constant-time check of `api_key` against the configured API_KEY"""
     expected_key = os.getenv("API_KEY")
-    if not expected_key:
+    # compare_digest only takes ASCII strings; header values may be any Latin-1
+    return bool(api_key and expected_key) and secrets.compare_digest(api_key.encode(), expected_key.encode())
+
+
+async def require_api_key(api_key: str = Security(_api_key_header)):
+    if not os.getenv("API_KEY"):
         raise HTTPException(status_code=500, detail="API_KEY not configured on server")
-    if not api_key or not secrets.compare_digest(api_key, expected_key):
+    if not is_valid_api_key(api_key):
         raise HTTPException(status_code=403, detail="Invalid or missing API key")
@@ -0,0 +1,54 @@
+"""
+Course data files bundled with the API, in JSON Lines (one course object
+per line, in the bulk upsert item format).
+
+Files are read as a stream and identified by the hash of their content,
+so an import can tell a file it has already applied from a changed one
+without parsing it.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Union
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+# The catalog loaded by /seed and seed_server
+SEED_FILE = DATA_DIR / "courses.jsonl"
+# Courses added on top of the seed by add_new_courses
+NEW_COURSES_FILE = DATA_DIR / "new_courses.jsonl"
+
+PathLike = Union[str, Path]
+
+
+class CatalogDataError(ValueError):
+    """A data file line that is not a JSON object"""
+
+
+def file_hash(path: PathLike) -> str:
+    """SHA-256 of the file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_courses(path: PathLike) -> Iterator[Dict[str, Any]]:
+    """The file's courses one at a time; blank lines are ignored"""
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                course = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise CatalogDataError(f"{path}:{number}: {e.msg}") from e
+            if not isinstance(course, dict):
+                raise CatalogDataError(f"{path}:{number}: expected a JSON object")
+            yield course
+
+
+def count_courses(path: PathLike) -> int:
+    """Courses in the file, without parsing them"""
+    with open(path, encoding="utf-8") as f:
+        return sum(1 for line in f if line.strip())
@@ -0,0 +1,334 @@
+"""
+Columnar binary snapshot of the course catalog.
+
+The snapshot is one contiguous buffer that can be memory-mapped and read
+without parsing: fixed-width columns per course, an offset-indexed string
+heap, and the prerequisite edges in CSR form (course i's prerequisites are
+prerequisite_targets[prerequisite_offsets[i]:prerequisite_offsets[i + 1]]).
+Courses are sorted by ID so lookups are a binary search over the ID column.
+"""
+import struct
+import sys
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .models import Course, CourseLevel, CourseReadModel, masks_with_semester, prerequisite_table
+from .schemas import COURSE_ID_MAX_LENGTH
+from .services.prerequisite_graph import PrerequisiteGraph
+
+MAGIC = b"CCAT"
+FORMAT_VERSION = 2
+
+ID_WIDTH = COURSE_ID_MAX_LENGTH
+LEVELS = tuple(CourseLevel)
+EDGE_TYPES = ("mandatory", "recommended")
+
+# Per-course strings, stored at heap index course * len(STRING_FIELDS) + field
+STRING_FIELDS = ("title", "title_english", "description", "instructor", "payload")
+
+# Searched case-insensitively by the listing filters
+SEARCH_FIELDS = ("title", "title_english", "description", "instructor")
+
+# How deep the dependency graph of a course is expanded
+DEPENDENCY_DEPTH = 3
+
+# (section name, array typecode); "B" sections are raw bytes
+SECTIONS = (
+    ("ids", "B"),
+    ("credits", "H"),
+    ("level", "B"),
+    ("department", "H"),
+    ("language", "H"),
+    ("semester_mask", "B"),
+    ("active", "B"),
+    ("transitive_count", "I"),
+    ("dependent_count", "I"),
+    ("prerequisite_offsets", "I"),
+    ("prerequisite_targets", "I"),
+    ("prerequisite_types", "B"),
+    ("string_offsets", "I"),
+    ("string_heap", "B"),
+)
+
+# magic, format version, reserved, revision, courses, edges, departments, languages
+HEADER = struct.Struct("<4sHHQIIII")
+SECTION_ENTRY = struct.Struct("<QQ")
+ALIGNMENT = 8
+
+
+class SnapshotFormatError(ValueError):
+    pass
+
+
+def _check_platform() -> None:
+    # Sections are native arrays, which must match the little-endian header
+    if sys.byteorder != "little" or array("I").itemsize != 4:
+        raise SnapshotFormatError("Catalog snapshots require little-endian 32-bit unsigned ints")
+
+
+def encode_snapshot(
+    courses: Sequence[dict],
+    edges: Sequence[Tuple[str, str, Optional[str]]],
+    revision: int = 0,
+) -> bytes:
+    """
+    Encode courses (dicts with Course columns plus an optional `payload`)
+    and (course_id, prerequisite_id, type) edges into a snapshot.
+    """
+    _check_platform()
+    courses = sorted(courses, key=lambda c: c["id"])
+    position = {course["id"]: i for i, course in enumerate(courses)}
+    graph = PrerequisiteGraph.from_edges(
+        (prerequisite_id, course_id) for course_id, prerequisite_id, _ in edges
+    )
+
+    departments = sorted({c["department"] for c in courses})
+    languages = sorted({c["language"] or "Norwegian" for c in courses})
+    department_codes = {name: i for i, name in enumerate(departments)}
+    language_codes = {name: i for i, name in enumerate(languages)}
+
+    by_course: Dict[int, List[Tuple[int, int]]] = {}
+    for course_id, prerequisite_id, edge_type in edges:
+        if course_id in position and prerequisite_id in position:
+            by_course.setdefault(position[course_id], []).append(
+                (position[prerequisite_id], EDGE_TYPES.index(edge_type or "mandatory"))
+            )
+
+    columns = {name: array(code) for name, code in SECTIONS}
+    ids = bytearray()
+    strings: List[bytes] = []
+    columns["prerequisite_offsets"].append(0)
+    for i, course in enumerate(courses):
+        course_id = course["id"].encode("ascii")
+        if len(course_id) > ID_WIDTH:
+            # A longer ID would shift every later entry of the ID column
+            raise ValueError(f"Course ID {course['id']!r} is longer than {ID_WIDTH} bytes")
+        ids += course_id.ljust(ID_WIDTH, b"\0")
+        columns["credits"].append(course["credits"])
+        columns["level"].append(LEVELS.index(CourseLevel(getattr(course["level"], "value", course["level"]))))
+        columns["department"].append(department_codes[course["department"]])
+        columns["language"].append(language_codes[course["language"] or "Norwegian"])
+        columns["semester_mask"].append(course.get("semester_mask") or 0)
+        columns["active"].append(1 if course["is_active"] else 0)
+        columns["transitive_count"].append(len(graph.ancestors(course["id"])))
+        columns["dependent_count"].append(len(graph.dependents_of(course["id"])))
+        for target, edge_type in sorted(by_course.get(i, [])):
+            columns["prerequisite_targets"].append(target)
+            columns["prerequisite_types"].append(edge_type)
+        columns["prerequisite_offsets"].append(len(columns["prerequisite_targets"]))
+        strings.extend((course.get(field) or "").encode() for field in STRING_FIELDS)
+    strings.extend(name.encode() for name in departments + languages)
+
+    heap = bytearray()
+    columns["string_offsets"].append(0)
+    for value in strings:
+        heap += value
+        columns["string_offsets"].append(len(heap))
+
+    sections = []
+    for name, _ in SECTIONS:
+        if name == "ids":
+            sections.append(bytes(ids))
+        elif name == "string_heap":
+            sections.append(bytes(heap))
+        else:
+            sections.append(columns[name].tobytes())
+
+    offset = HEADER.size + SECTION_ENTRY.size * len(SECTIONS)
+    table = bytearray()
+    body = bytearray()
+    for data in sections:
+        padding = -(offset + len(body)) % ALIGNMENT
+        body += b"\0" * padding
+        table += SECTION_ENTRY.pack(offset + len(body), len(data))
+        body += data
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0, revision,
+        len(courses), len(columns["prerequisite_targets"]), len(departments), len(languages),
+    )
+    return header + bytes(table) + bytes(body)
+
+
+def build_snapshot(db: Session, revision: int = 0) -> bytes:
+    """Encode the current database state into a snapshot"""
+    courses = [
+        dict(row) for row in db.execute(
+            select(
+                Course.id, Course.title, Course.title_english, Course.description,
+                Course.instructor, Course.credits, Course.department, Course.level,
+                Course.language, Course.semester_mask, Course.is_active,
+                CourseReadModel.payload,
+            ).outerjoin(CourseReadModel, CourseReadModel.id == Course.id)
+        ).mappings()
+    ]
+    edges = db.execute(
+        select(prerequisite_table.c.course_id, prerequisite_table.c.prerequisite_id, prerequisite_table.c.type)
+    ).all()
+    return encode_snapshot(courses, edges, revision)
+
+
+def read_revision(buffer) -> int:
+    """Revision stored in a snapshot header"""
+    magic, version, _, revision, *_ = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise SnapshotFormatError("Not a catalog snapshot")
+    return revision
+
+
+class CatalogSnapshot:
+    """
+    Read-only view over an encoded snapshot (bytes, mmap or shared memory).
+    Columns are memoryviews into the buffer, so nothing is copied on open.
+    """
+
+    def __init__(self, buffer):
+        _check_platform()
+        view = memoryview(buffer)
+        (magic, version, _, self.revision, self.course_count, self.edge_count,
+         department_count, language_count) = HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise SnapshotFormatError("Not a catalog snapshot")
+        if version != FORMAT_VERSION:
+            raise SnapshotFormatError(f"Unsupported snapshot format version {version}")
+
+        self._buffer = buffer
+        for index, (name, code) in enumerate(SECTIONS):
+            offset, length = SECTION_ENTRY.unpack_from(view, HEADER.size + index * SECTION_ENTRY.size)
+            section = view[offset:offset + length]
+            setattr(self, name, section.cast(code) if code != "B" else section)
+
+        first_name = self.course_count * len(STRING_FIELDS)
+        self.departments = [self.string(first_name + i) for i in range(department_count)]
+        self.languages = [
+            self.string(first_name + department_count + i) for i in range(language_count)
+        ]
+
+    def string(self, index: int) -> str:
+        return bytes(self._string_view(index)).decode()
+
+    def _string_view(self, index: int) -> memoryview:
+        return self.string_heap[self.string_offsets[index]:self.string_offsets[index + 1]]
+
+    def field(self, course: int, field: str) -> Optional[str]:
+        """A per-course string; empty strings read back as None"""
+        return self.string(course * len(STRING_FIELDS) + STRING_FIELDS.index(field)) or None
+
+    def payload(self, course: int) -> memoryview:
+        """The course's pre-rendered JSON, without copying it out of the buffer"""
+        return self._string_view(course * len(STRING_FIELDS) + STRING_FIELDS.index("payload"))
+
+    def course_id(self, course: int) -> str:
+        start = course * ID_WIDTH
+        return bytes(self.ids[start:start + ID_WIDTH]).rstrip(b"\0").decode("ascii")
+
+    def index_of(self, course_id: str) -> Optional[int]:
+        """Position of a course, found by binary search over the ID column"""
+        key = course_id.encode("ascii").ljust(ID_WIDTH, b"\0")
+        low, high = 0, self.course_count
+        while low < high:
+            middle = (low + high) // 2
+            current = bytes(self.ids[middle * ID_WIDTH:(middle + 1) * ID_WIDTH])
+            if current < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.course_count and bytes(self.ids[low * ID_WIDTH:(low + 1) * ID_WIDTH]) == key:
+            return low
+        return None
+
+    def prerequisites(self, course: int) -> memoryview:
+        """Positions of the direct prerequisites of a course"""
+        return self.prerequisite_targets[self.prerequisite_offsets[course]:self.prerequisite_offsets[course + 1]]
+
+    def edges(self) -> Iterator[Tuple[str, str]]:
+        """All (prerequisite_id, course_id) pairs"""
+        for course in range(self.course_count):
+            course_id = self.course_id(course)
+            for prerequisite in self.prerequisites(course):
+                yield self.course_id(prerequisite), course_id
+
+    def prerequisite_counts(self) -> Dict[str, int]:
+        """Transitive prerequisite counts of the active courses"""
+        return {
+            self.course_id(course): self.transitive_count[course]
+            for course in range(self.course_count) if self.active[course]
+        }
+
+    def matching(
+        self,
+        department: Optional[str] = None,
+        level: Optional[str] = None,
+        language: Optional[str] = None,
+        semester: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> List[int]:
+        """Positions of the active courses matching the listing filters, in ID order"""
+        codes = []
+        for column, names, value in (
+            (self.department, self.departments, department),
+            (self.language, self.languages, language),
+        ):
+            if value:
+                if value not in names:
+                    return []
+                codes.append((column, names.index(value)))
+        if level:
+            try:
+                codes.append((self.level, LEVELS.index(CourseLevel(level.lower()))))
+            except ValueError:
+                return []
+        masks = set(masks_with_semester(semester)) if semester else None
+        term = search.lower() if search else None
+
+        result = []
+        for course in range(self.course_count):
+            if not self.active[course]:
+                continue
+            if any(column[course] != code for column, code in codes):
+                continue
+            if masks is not None and self.semester_mask[course] not in masks:
+                continue
+            if term and not self._contains(course, term):
+                continue
+            result.append(course)
+        return result
+
+    def _contains(self, course: int, term: str) -> bool:
+        if term in self.course_id(course).lower():
+            return True
+        return any(term in (self.field(course, field) or "").lower() for field in SEARCH_FIELDS)
+
+    def dependencies(self, course_id: str) -> Optional[dict]:
+        """Prerequisite graph of a course for visualisation, `DEPENDENCY_DEPTH` levels deep"""
+        root = self.index_of(course_id)
+        if root is None or not self.active[root]:
+            return None
+        nodes, edges, visited = [], [], set()
+
+        def visit(course: int, depth: int) -> None:
+            if course in visited or depth > DEPENDENCY_DEPTH:
+                return
+            visited.add(course)
+            nodes.append({
+                "id": self.course_id(course),
+                "label": self.field(course, "title"),
+                "department": self.departments[self.department[course]],
+                "credits": self.credits[course],
+                "level": LEVELS[self.level[course]].value,
+            })
+            start = self.prerequisite_offsets[course]
+            for offset in range(start, self.prerequisite_offsets[course + 1]):
+                prerequisite = self.prerequisite_targets[offset]
+                visit(prerequisite, depth + 1)
+                edges.append({
+                    "source": self.course_id(prerequisite),
+                    "target": self.course_id(course),
+                    "type": EDGE_TYPES[self.prerequisite_types[offset]],
+                })
+
+        visit(root, 0)
+        return {"nodes": nodes, "edges": edges, "total_prerequisite_count": len(nodes) - 1}
@@ -1,19 +1,50 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
 import os
-from dotenv import load_dotenv
+import threading
+from typing import Optional
 
-load_dotenv()
-
-DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./courses.db')
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from dotenv import load_dotenv
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+_session_factory = sessionmaker(autocommit=False, autoflush=False)
 
 
 class Base(DeclarativeBase):
     pass
 
+
+def database_url() -> str:
+    load_dotenv()
+    return os.getenv('DATABASE_URL', 'sqlite:///./courses.db')
+
+
+def get_engine() -> Engine:
+    """Return the engine, creating it (without connecting) on first use"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(database_url())
+    return _engine
+
+
+def dispose_engine() -> None:
+    """Close the pooled connections; the next session creates a new engine"""
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
+
+
+def SessionLocal() -> Session:
+    """New session bound to the engine"""
+    return _session_factory(bind=get_engine())
+
+
 def get_db():
     db = SessionLocal()
     try:
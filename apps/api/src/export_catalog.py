@@ -0,0 +1,42 @@
+"""
+Export the catalog to a memory-mapped snapshot file.
+
+Point the API at the file with CATALOG_SNAPSHOT_PATH and it answers listing,
+detail and dependency queries from the mapping instead of the database.
+Exporting again to the same path publishes the next generation to running
+workers.
+
+Run with: cd apps/api && python -m src.export_catalog /dev/shm/ifi-course-catalog.bin
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database import SessionLocal
+from src.services.read_model_service import ReadModelService
+from src.shared_catalog import SharedCatalog
+
+
+def export_catalog(path: str) -> int:
+    """Write the catalog to `path` and return the generation written"""
+    db = SessionLocal()
+    try:
+        # Snapshots embed the rendered course payloads
+        ReadModelService.ensure_built(db)
+    finally:
+        db.close()
+    return SharedCatalog(path).publish_from_database()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the course catalog to a snapshot file")
+    parser.add_argument("path")
+    args = parser.parse_args()
+    revision = export_catalog(args.path)
+    print(f"Exported catalog snapshot generation {revision} to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
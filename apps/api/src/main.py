@@ -1,35 +1,100 @@
-
-from fastapi import FastAPI, HTTPException, Query, Depends, Path
+import json
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Depends, Path, Request, Response, Header
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, text
 from typing import List, Optional
 
-from .models import Course, Base
-from .schemas import CourseCreate, CourseUpdate
+from .models import Course
+from .schemas import CourseCreate, CoursePatch, CourseUpdate, CourseRead
+from .schemas import CourseBulkRequest, CourseBulkResponse, CourseSearchResponse
+from .schemas import CatalogChangesResponse, CourseDeltaResponse, CourseImportRequest, JobRead
 from .schemas import Course as CourseSchema
-from .database import engine, get_db
-from .services.course_service import CourseService
+from . import schemas
+from .database import SessionLocal, dispose_engine, get_db, get_engine
+from .services.course_service import CourseService, VersionMismatchError
+from .services.prerequisite_graph import PrerequisiteCycleError, reset_prerequisite_graph
+from .services.statistics_service import StatisticsService
+from .services.read_model_service import ReadModelService, json_array
+from .services.response_store import RenderedResponse, response_store
+from .services.health_monitor import health_monitor
+from .services.change_log_service import CHANGES_PAGE_SIZE, ChangeLogService
+from .services.change_feed import change_feed
+from .services.single_flight import flight_key, single_flight
+from .services.import_service import ImportService
+from .services.job_runner import job_runner
+from .shared_catalog import shared_catalog
+from .catalog_data import SEED_FILE, count_courses
 from .auth import require_api_key
+from .rate_limit import listing_cost, rate_limited
+from . import startup
+
+# The schema's course ID pattern, in either case
+COURSE_ID_PATTERN = "(?i)" + schemas.COURSE_ID_PATTERN
+
+# Rate limit weights, relative to a detail lookup; heavy routes also queue
+# for a slot under HEAVY_CONCURRENCY
+read_limit = Depends(rate_limited())
+write_limit = Depends(rate_limited(2))
+listing_limit = Depends(rate_limited(listing_cost, heavy=True))
+search_limit = Depends(rate_limited(lambda request: listing_cost(request) + 2, heavy=True))
+# A full copy (since=0) renders every course
+delta_limit = Depends(rate_limited(
+    lambda request: 10 if request.query_params.get("since", "0") in ("", "0") else 2, heavy=True
+))
+counts_limit = Depends(rate_limited(10, heavy=True))
+bulk_limit = Depends(rate_limited(20, heavy=True))
+seed_limit = Depends(rate_limited(50, heavy=True))
+# Walks the dependency graph both ways from one course
+dependencies_limit = Depends(rate_limited(2))
+
+# A comment line is sent on idle change streams so proxies keep them open
+KEEPALIVE_INTERVAL = 15.0
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup.start()
+    if shared_catalog:
+        # Mapping the snapshot only reads its header and section table
+        shared_catalog.current()
+    health_monitor.start()
+    yield
+    health_monitor.stop()
+    dispose_engine()
 
-Base.metadata.create_all(bind=engine)
-
-COURSE_ID_PATTERN = r"^[A-Za-z]{2,4}\d{4}$"
 
 app = FastAPI(
     title="IFI Course Catalog API",
     description="API for course lookup at the Institute of Informatics",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
     )
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173", "http://127.0.0.1:5173", "https://didriksi.com", "http://didriksi.com"],
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["Content-Type", "X-API-Key"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "X-API-Key", "If-Match"],
+    expose_headers=["ETag"],
 )
 
+if shared_catalog:
+    # Another worker published a new catalog generation: drop local caches
+    shared_catalog.on_swap(reset_prerequisite_graph)
+    shared_catalog.on_swap(CourseService.invalidate_local_caches)
+
+    @app.middleware("http")
+    async def refresh_shared_catalog(request: Request, call_next):
+        shared_catalog.current()
+        return await call_next(request)
+
+
 @app.get("/")
 async def read_route():
     return {
@@ -37,22 +102,71 @@ async def read_route():
         "endpoints": {
             "courses": "/courses",
             "docs": "/docs",
-            "health": "/health"
+            "health": "/health",
+            "statistics": "/statistics/overview",
+            "changes": "/changes"
         }
     }
 
 @app.get("/health")
-def health_check(db: Session = Depends(get_db)):
-    try:
-        db.execute(text("SELECT 1"))
-        return {"status": "healthy", "database": "connected"}
-    except Exception:
+def health_check():
+    database = health_monitor.status().get("database")
+    if not database or not database["reachable"]:
         raise HTTPException(status_code=503, detail="Database connection failed")
+    return {"status": "healthy", "database": "connected"}
+
+
+@app.get("/health/live")
+def liveness():
+    """Liveness probe: the process is serving requests (no I/O)"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+def readiness():
+    """
+    Readiness probe: database reachability, pool saturation, cache warmup
+    and catalog revision age, as last checked by the background monitor
+    """
+    status = health_monitor.status()
+    if not status["ready"]:
+        raise HTTPException(status_code=503, detail=status)
+    return status
+
+
+def prerequisite_cycle_conflict(error: PrerequisiteCycleError) -> HTTPException:
+    return HTTPException(
+        status_code=409,
+        detail={"message": "Prerequisites would create a cycle", "path": error.path},
+    )
+
+
+def render_course(db: Session, course_id: str) -> Optional[bytes]:
+    payload = ReadModelService.get_payload(db, course_id)
+    return payload.encode() if payload is not None else None
+
+
+def render_dependencies(db: Session, course_id: str) -> Optional[bytes]:
+    result = CourseService.get_course_dependencies(db, course_id)
+    return json.dumps(result, separators=(",", ":")).encode() if result is not None else None
+
+
+response_store.register("course", render_course)
+response_store.register("dependencies", render_dependencies)
+
+
+def stored_response(request: Request, rendered: RenderedResponse) -> Response:
+    """Serve stored bytes, using the gzip variant when the client accepts it"""
+    headers = {"Vary": "Accept-Encoding"}
+    if rendered.gzip is not None and "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=rendered.gzip, media_type="application/json", headers=headers)
+    return Response(content=rendered.body, media_type="application/json", headers=headers)
 
 
 # Course endpoints (read - no auth required)
-@app.get("/courses/", response_model=List[CourseSchema])
-def get_courses(
+@app.get("/courses/", response_model=List[CourseRead], dependencies=[listing_limit])
+async def get_courses(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     department: Optional[str] = None,
@@ -60,6 +174,9 @@ def get_courses(
     language: Optional[str] = None,
     semester: Optional[str] = None,
     search: Optional[str] = None,
+    min_credits: Optional[int] = Query(None, ge=0),
+    max_credits: Optional[int] = Query(None, ge=0),
+    sort: str = Query("id", pattern=r"^(id|credits|-credits)$"),
     db: Session = Depends(get_db)
 ):
     """
@@ -70,88 +187,335 @@ def get_courses(
     - **language**: Filter by language (Norwegian, English)
     - **semester**: Filter by semester (fall, spring)
     - **search**: Search in course ID, title, or description
+    - **min_credits** / **max_credits**: Filter by credit range
+    - **sort**: Order by `id` (default), `credits` or `-credits`
+    """
+    def render() -> str:
+        return json_array(ReadModelService.list_payloads(
+            db, skip, limit, department, level, language, semester, search,
+            min_credits, max_credits, sort
+        ))
+
+    # Identical listings requested at the same time are rendered once
+    key = flight_key(
+        "courses", skip=skip, limit=limit, department=department, level=level, language=language,
+        semester=semester, search=search, min_credits=min_credits, max_credits=max_credits, sort=sort,
+    )
+    content = await single_flight.do_async(key, render)
+    return Response(content=content, media_type="application/json")
+
+
+@app.get("/courses/search", response_model=CourseSearchResponse, dependencies=[search_limit])
+def search_courses(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    department: Optional[str] = None,
+    level: Optional[str] = None,
+    language: Optional[str] = None,
+    semester: Optional[str] = None,
+    search: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Search courses and get facet counts in one response.
+
+    Takes the same filters as `/courses/`. `facets` holds, for every filter
+    dimension, how many results each value would give with the other filters
+    applied.
     """
-    return CourseService.get_courses(
-        db, skip, limit, department, level, language, semester, search
+    def render() -> str:
+        result = CourseService.search_courses(
+            db, skip, limit, department, level, language, semester, search
+        )
+        return '{"total":%d,"items":%s,"facets":%s}' % (
+            result["total"], json_array(result["items"]), json.dumps(result["facets"])
+        )
+
+    key = flight_key(
+        "courses/search", skip=skip, limit=limit, department=department, level=level,
+        language=language, semester=semester, search=search,
     )
+    return Response(content=single_flight.do(key, render), media_type="application/json")
 
 
-@app.get("/courses/prerequisite-counts")
-def get_prerequisite_counts(db: Session = Depends(get_db)):
+@app.get("/courses/delta", response_model=CourseDeltaResponse, dependencies=[delta_limit])
+def get_course_delta(since: int = Query(0, ge=0), db: Session = Depends(get_db)):
+    """
+    Get the courses changed since revision **since** (from a previous
+    delta, `/changes` or the change stream). Start with since=0 for a full
+    copy; when `reset` is true, replace the local copy instead of merging.
+    """
+    def render() -> str:
+        result = CourseService.get_course_delta(db, since)
+        return '{"revision":%d,"reset":%s,"courses":%s,"deleted":%s,"prerequisites":%s}' % (
+            result["revision"],
+            "true" if result["reset"] else "false",
+            json_array(result["courses"]),
+            json.dumps(result["deleted"]),
+            json.dumps(result["prerequisites"], separators=(",", ":")),
+        )
+
+    # Clients starting up together all ask for the same full copy (since=0)
+    content = single_flight.do(flight_key("courses/delta", since=since), render)
+    return Response(content=content, media_type="application/json")
+
+
+@app.get("/courses/prerequisite-counts", dependencies=[counts_limit])
+async def get_prerequisite_counts(db: Session = Depends(get_db)):
     """Get transitive prerequisite counts for all courses"""
-    return CourseService.get_all_prerequisite_counts(db)
+    def render() -> str:
+        return json.dumps(CourseService.get_all_prerequisite_counts(db), separators=(",", ":"))
 
+    content = await single_flight.do_async(flight_key("courses/prerequisite-counts"), render)
+    return Response(content=content, media_type="application/json")
 
-@app.get("/courses/{course_id}", response_model=CourseSchema)
+
+@app.get("/courses/{course_id}", response_model=CourseRead, dependencies=[read_limit])
 def get_course(
+    request: Request,
     course_id: str = Path(pattern=COURSE_ID_PATTERN),
     db: Session = Depends(get_db),
 ):
     """Get a specific course by ID"""
-    course = CourseService.get_course(db, course_id.upper())
-    if not course:
+    rendered = response_store.get(db, "course", course_id.upper())
+    if rendered is None:
         raise HTTPException(status_code=404, detail="Course not found")
-    return course
+    return stored_response(request, rendered)
 
 
 # Course endpoints (write - API key required)
-@app.post("/courses/", response_model=CourseSchema, status_code=201, dependencies=[Depends(require_api_key)])
+@app.post(
+    "/courses/", response_model=CourseSchema, status_code=201,
+    dependencies=[Depends(require_api_key), write_limit],
+)
 def create_course(course: CourseCreate, db: Session = Depends(get_db)):
     """Create a new course"""
-    return CourseService.create_course(db, course)
+    try:
+        return CourseService.create_course(db, course)
+    except PrerequisiteCycleError as e:
+        raise prerequisite_cycle_conflict(e)
 
 
-@app.put("/courses/{course_id}", response_model=CourseSchema, dependencies=[Depends(require_api_key)])
+@app.post(
+    "/courses:bulk", response_model=CourseBulkResponse,
+    dependencies=[Depends(require_api_key), bulk_limit],
+)
+def bulk_upsert_courses(
+    request: CourseBulkRequest,
+    atomic: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Create or update many courses in one transaction.
+
+    Existing course IDs are updated, new ones are created. Invalid items are
+    reported in `results` and skipped, unless **atomic** is set, in which case
+    nothing is written and the response is a 422.
+    """
+    result = CourseService.bulk_upsert_courses(db, request.items, atomic)
+    if atomic and result["failed"]:
+        raise HTTPException(status_code=422, detail=result)
+    return result
+
+
+@app.put(
+    "/courses/{course_id}", response_model=CourseSchema,
+    dependencies=[Depends(require_api_key), write_limit],
+)
 def update_course(
     course: CourseUpdate,
     course_id: str = Path(pattern=COURSE_ID_PATTERN),
     db: Session = Depends(get_db),
 ):
     """Update an existing course"""
-    return CourseService.update_course(db, course_id.upper(), course)
+    try:
+        course = CourseService.update_course(db, course_id.upper(), course)
+    except PrerequisiteCycleError as e:
+        raise prerequisite_cycle_conflict(e)
+    if not course:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return course
+
 
+def parse_if_match(header: Optional[str]) -> Optional[List[int]]:
+    """Versions named by an If-Match header; None when any version matches"""
+    if header is None or header.strip() == "*":
+        return None
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip().removeprefix("W/").strip('"')
+        if tag.isdigit():
+            versions.append(int(tag))
+    return versions
 
-@app.delete("/courses/{course_id}", dependencies=[Depends(require_api_key)])
+
+@app.patch(
+    "/courses/{course_id}", response_model=CourseRead,
+    dependencies=[Depends(require_api_key), write_limit],
+)
+def patch_course(
+    patch: CoursePatch,
+    course_id: str = Path(pattern=COURSE_ID_PATTERN),
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Apply a JSON Merge Patch (application/merge-patch+json) to a course.
+
+    Members left out are unchanged and null clears a member. The response
+    carries the course's version as its ETag; send it back in **If-Match** to
+    get a 412 instead of overwriting someone else's change.
+    """
+    course_id = course_id.upper()
+    try:
+        version = CourseService.patch_course(db, course_id, patch, parse_if_match(if_match))
+    except PrerequisiteCycleError as e:
+        raise prerequisite_cycle_conflict(e)
+    except VersionMismatchError as e:
+        raise HTTPException(
+            status_code=412,
+            detail={"message": "Course was modified", "version": e.version},
+            headers={"ETag": f'"{e.version}"'},
+        )
+    if version is None:
+        raise HTTPException(status_code=404, detail="Course not found")
+    headers = {"ETag": f'"{version}"'}
+    payload = render_course(db, course_id)
+    if payload is None:
+        # The patch deactivated the course
+        return Response(status_code=204, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+@app.delete("/courses/{course_id}", dependencies=[Depends(require_api_key), write_limit])
 def delete_course(
     course_id: str = Path(pattern=COURSE_ID_PATTERN),
     db: Session = Depends(get_db),
 ):
     """Soft delete a course (mark as inactive)"""
-    course = CourseService.get_course(db, course_id.upper())
-    if not course:
+    if not CourseService.delete_course(db, course_id.upper()):
         raise HTTPException(status_code=404, detail="Course not found")
-
-    course.is_active = False
-    db.commit()
     return {"message": "Course deleted successfully"}
 
 
-@app.get("/courses/{course_id}/dependencies")
+@app.get("/courses/{course_id}/dependencies", dependencies=[dependencies_limit])
 def get_course_dependencies(
+    request: Request,
     course_id: str = Path(pattern=COURSE_ID_PATTERN),
     db: Session = Depends(get_db),
 ):
     """Get course dependency graph for visualization"""
-    result = CourseService.get_course_dependencies(db, course_id.upper())
-    if result is None:
+    rendered = response_store.get(db, "dependencies", course_id.upper())
+    if rendered is None:
         raise HTTPException(status_code=404, detail="Course not found")
-    return result
+    return stored_response(request, rendered)
+
+
+# Change feed endpoints
+@app.get("/changes", response_model=CatalogChangesResponse, dependencies=[read_limit])
+def get_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(CHANGES_PAGE_SIZE, ge=1, le=CHANGES_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """
+    Get catalog changes after revision **since**, oldest first.
+
+    Each change names the course and the operation: create, update, delete,
+    refresh (the course's rendered view changed because a related course
+    did) or seed (reload everything).
+    """
+    return ChangeLogService.since(db, since, limit)
+
+
+def read_changes(since: Optional[int]):
+    db = SessionLocal()
+    try:
+        if since is None:
+            # New subscribers only get changes made after they connected
+            since = ChangeLogService.latest_revision(db)
+        return since, ChangeLogService.since(db, since)
+    finally:
+        db.close()
+
+
+async def change_events(request: Request, since: Optional[int]):
+    """Server-Sent Events for every change after `since`"""
+    since, page = await run_in_threadpool(read_changes, since)
+    last_sent = time.monotonic()
+    while not await request.is_disconnected():
+        for change in page["changes"]:
+            since = change["revision"]
+            data = json.dumps(jsonable_encoder(change), separators=(",", ":"))
+            yield f"id: {since}\nevent: change\ndata: {data}\n\n"
+            last_sent = time.monotonic()
+        if not page["has_more"]:
+            latest = await change_feed.wait_after(since, KEEPALIVE_INTERVAL)
+            if latest is None or latest <= since:
+                if time.monotonic() - last_sent >= KEEPALIVE_INTERVAL:
+                    yield ": keepalive\n\n"
+                    last_sent = time.monotonic()
+                page = {"changes": [], "has_more": False}
+                continue
+        _, page = await run_in_threadpool(read_changes, since)
+
+
+@app.get("/changes/stream", dependencies=[read_limit])
+async def stream_changes(
+    request: Request,
+    since: Optional[int] = Query(None, ge=0),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Stream catalog changes as Server-Sent Events (`event: change`, the
+    revision as the event ID). Starts after **since**, or after the
+    Last-Event-ID a reconnecting client sends, or at the current revision.
+    """
+    if since is None and last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    return StreamingResponse(
+        change_events(request, since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # Statistics endpoints
-@app.get("/statistics/departments")
+@app.get("/statistics/departments", dependencies=[read_limit])
 def get_department_statistics(db: Session = Depends(get_db)):
     """Get course count by department"""
-    stats = db.query(
-        Course.department,
-        func.count(Course.id).label('count')
-    ).filter(
-        Course.is_active
-    ).group_by(
-        Course.department
-    ).all()
+    return StatisticsService.get_dimension(db, "department")
+
 
-    return [{"department": dept, "count": count} for dept, count in stats]
+@app.get("/statistics/levels", dependencies=[read_limit])
+def get_level_statistics(db: Session = Depends(get_db)):
+    """Get course count by level"""
+    return StatisticsService.get_dimension(db, "level")
+
+
+@app.get("/statistics/languages", dependencies=[read_limit])
+def get_language_statistics(db: Session = Depends(get_db)):
+    """Get course count by language"""
+    return StatisticsService.get_dimension(db, "language")
+
+
+@app.get("/statistics/semesters", dependencies=[read_limit])
+def get_semester_statistics(db: Session = Depends(get_db)):
+    """Get course count by semester"""
+    return StatisticsService.get_dimension(db, "semester")
+
+
+@app.get("/statistics/overview", dependencies=[read_limit])
+def get_statistics_overview(db: Session = Depends(get_db)):
+    """Get catalog totals and counts per level, language and semester"""
+    return StatisticsService.get_overview(db)
+
+
+# Debug endpoint - identical requests sharing one computation
+@app.get("/debug/coalescing")
+def debug_coalescing():
+    """Per endpoint: computations run, requests that shared one, and computations running now"""
+    return single_flight.stats()
 
 
 # Debug endpoint - check database state
@@ -165,7 +529,7 @@ def debug_db(db: Session = Depends(get_db)):
 
     # Check if tables exist
     from sqlalchemy import inspect
-    inspector = inspect(engine)
+    inspector = inspect(get_engine())
     tables = inspector.get_table_names()
 
     # Sample course IDs
@@ -182,48 +546,64 @@ def debug_db(db: Session = Depends(get_db)):
 
 
 # Seed endpoint - populate database via HTTP (API key required)
-@app.post("/seed", dependencies=[Depends(require_api_key)])
-def seed_database(db: Session = Depends(get_db)):
-    """Seed the database with course data"""
-    from .seed_server import all_courses_data
-    from .models import prerequisite_table
-
-    # First pass: create courses
-    created = 0
-    skipped = 0
-    course_prereqs = {}
-
-    for course_data in all_courses_data:
-        existing = db.query(Course).filter(Course.id == course_data["id"]).first()
-        if existing:
-            skipped += 1
-            course_prereqs[course_data["id"]] = course_data.get("prerequisite_ids", [])
-            continue
-
-        prereq_ids = course_data.pop("prerequisite_ids", [])
-        course = Course(**course_data)
-        db.add(course)
-        course_prereqs[course.id] = prereq_ids
-        created += 1
-
-    db.commit()
-
-    # Second pass: add prerequisites
-    prereq_count = 0
-    for course_id, prereq_ids in course_prereqs.items():
-        course = db.query(Course).filter(Course.id == course_id).first()
-        for prereq_id in prereq_ids:
-            prereq = db.query(Course).filter(Course.id == prereq_id).first()
-            if prereq and prereq not in course.prerequisites:
-                course.prerequisites.append(prereq)
-                prereq_count += 1
-
-    db.commit()
+@app.post("/seed", dependencies=[Depends(require_api_key), seed_limit])
+def seed_database(
+    force: bool = Query(False, description="Import the data file even if it has not changed"),
+    db: Session = Depends(get_db),
+):
+    """Seed the database with course data (prefer `POST /jobs/seed`, which does not hold the request)"""
+    return ImportService.seed(db, force=force)
 
-    total = db.query(Course).count()
-    return {
-        "created": created,
-        "skipped": skipped,
-        "prerequisites_added": prereq_count,
-        "total_courses": total
-    }
+
+# Background jobs (API key required to start)
+@app.post(
+    "/jobs/seed", response_model=JobRead, status_code=202,
+    dependencies=[Depends(require_api_key), write_limit],
+)
+def start_seed_job(
+    response: Response,
+    force: bool = Query(False, description="Import the data file even if it has not changed"),
+    db: Session = Depends(get_db),
+):
+    """
+    Seed the database in the background; poll `GET /jobs/{id}` for progress.
+    A seed interrupted by a restart continues where it stopped when started again.
+    """
+    job = job_runner.submit(
+        db, "seed", lambda job_db, progress: ImportService.seed(job_db, progress, force),
+        total=count_courses(SEED_FILE),
+    )
+    response.headers["Location"] = f"/jobs/{job['id']}"
+    return job
+
+
+@app.post(
+    "/jobs/import", response_model=JobRead, status_code=202,
+    dependencies=[Depends(require_api_key), bulk_limit],
+)
+def start_import_job(request: CourseImportRequest, response: Response, db: Session = Depends(get_db)):
+    """
+    Create or update courses in the background, committing in chunks.
+
+    Items are validated like `POST /courses:bulk`; invalid items are counted
+    and reported in the job's `result`, the rest are written. Submitting
+    the same items again after an interrupted import resumes it.
+    """
+    items = request.items
+    checkpoint = "import:" + ImportService.fingerprint(items)[:16]
+    job = job_runner.submit(
+        db, "import",
+        lambda job_db, progress: ImportService.import_courses(job_db, items, progress, checkpoint=checkpoint),
+        total=len(items),
+    )
+    response.headers["Location"] = f"/jobs/{job['id']}"
+    return job
+
+
+@app.get("/jobs/{job_id}", response_model=JobRead, dependencies=[read_limit])
+def get_job(job_id: str, db: Session = Depends(get_db)):
+    """Status, rows processed and throughput of a background job"""
+    job = job_runner.get(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
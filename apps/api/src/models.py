@@ -1,7 +1,6 @@
-
-from sqlalchemy import Column, String, Integer, Text, JSON, Enum, DateTime, Boolean, Table, ForeignKey, ARRAY
+from sqlalchemy import Column, String, Integer, Text, JSON, Enum, DateTime, Boolean, Table, ForeignKey, ARRAY, Index, text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 import enum
 from .database import Base
 
@@ -20,6 +19,25 @@ class Semester(str, enum.Enum):
     FALL = "fall"
     SPRING = "spring"
 
+# Bit per semester, so "offered in fall" can be answered by an indexed
+# integer column instead of looking inside the semester array
+SEMESTER_BITS = {Semester.FALL: 1, Semester.SPRING: 2}
+
+def semester_mask(semesters) -> int:
+    """Bitmask for a list of semester values (enum members or strings)"""
+    mask = 0
+    for semester in semesters or []:
+        mask |= SEMESTER_BITS.get(Semester(str(getattr(semester, "value", semester)).lower()), 0)
+    return mask
+
+def masks_with_semester(semester: str) -> list:
+    """All semester masks that include the given semester"""
+    try:
+        bit = SEMESTER_BITS[Semester(semester.lower())]
+    except ValueError:
+        return []
+    return [mask for mask in range(1 << len(SEMESTER_BITS)) if mask & bit]
+
 # Table for prerequisites
 # Many to many relation
 # Each course can be PR to many other courses,
@@ -29,11 +47,31 @@ prerequisite_table = Table(
     Base.metadata,
     Column('course_id', String, ForeignKey('courses.id'), primary_key=True),
     Column('prerequisite_id', String, ForeignKey('courses.id'), primary_key=True),
-    Column('type', String, default='mandatory')  # "mandatory" or "recommended"
+    Column('type', String, default='mandatory', server_default='mandatory'),  # "mandatory" or "recommended"
+    # Reverse lookups: which courses depend on a given course
+    Index('ix_prerequisites_prerequisite_id', 'prerequisite_id'),
 )
 
+# Filtered SQL over the catalog (CourseService.listing_query, reporting)
+# always filters on is_active, so these indexes only cover active rows. The
+# API listing does not use them: it filters in memory (FilterEngine).
+# SQLite renders the boolean filter as "is_active = 1" and only uses a
+# partial index whose condition is written the same way.
+def active_index(name: str, *columns: str) -> Index:
+    return Index(
+        name, *columns,
+        postgresql_where=text("is_active"),
+        sqlite_where=text("is_active = 1"),
+    )
+
 class Course(Base):
     __tablename__ = "courses"
+    __table_args__ = (
+        active_index("ix_courses_active_department_level", "department", "level"),
+        active_index("ix_courses_active_level", "level"),
+        active_index("ix_courses_active_language", "language"),
+        active_index("ix_courses_active_semester_mask", "semester_mask"),
+    )
 
     # index: can be searched for
     # Text: larger field of text
@@ -41,7 +79,7 @@ class Course(Base):
 
 
     # Course-code: "IN1000"
-    id = Column(String, primary_key=True, index=True)
+    id = Column(String, primary_key=True)
 
     # Basic attributes for the course
     title = Column(String, nullable=False, index=True)
@@ -51,15 +89,22 @@ class Course(Base):
     credits = Column(Integer, nullable=False)
 
     # Classification
-    department = Column(String, nullable=False, index=True)
-    level = Column(Enum(CourseLevel), nullable=False, index=True)
+    department = Column(String, nullable=False)
+    level = Column(Enum(CourseLevel), nullable=False)
 
     # When offered
     semester = Column(SemesterArrayType, default=[])  # List of semester values
+    semester_mask = Column(Integer, nullable=False, default=0, server_default="0")
     language = Column(String, default="Norwegian")
 
     # Status
     is_active = Column(Boolean, default=True)
+    # catalog_changes revision of the last change to this course or its
+    # rendered view; clients sync with "revision > last seen"
+    revision = Column(Integer, nullable=False, default=0, server_default="0", index=True)
+    # Bumped by every write to the course itself; served as its ETag and
+    # checked against If-Match
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -78,3 +123,89 @@ class Course(Base):
     exam_form = Column(String)  # "Written", "Oral", "Project"
     teaching_form = Column(String)  # "Lectures", "Lectures + Lab"
     weekly_hours = Column(Integer)  # Hours per week
+
+    @validates("semester")
+    def _sync_semester_mask(self, key, value):
+        self.semester_mask = semester_mask(value)
+        return value
+
+
+class CourseStatistic(Base):
+    """Materialised course counters, kept up to date by CourseService writes"""
+    __tablename__ = "course_statistics"
+
+    # dimension: "department", "level", "language", "semester" or "overview"
+    dimension = Column(String, primary_key=True)
+    value = Column(String, primary_key=True)
+    course_count = Column(Integer, nullable=False, default=0)
+    credits_sum = Column(Integer, nullable=False, default=0)
+
+
+class CourseReadModel(Base):
+    """
+    Denormalised listing row per active course, refreshed by CourseService
+    writes. `payload` holds the course rendered as JSON, including its
+    prerequisite stubs and dependency counts.
+    """
+    __tablename__ = "course_read_model"
+
+    id = Column(String, primary_key=True)
+    department = Column(String, nullable=False, index=True)
+    level = Column(String, nullable=False, index=True)
+    language = Column(String, index=True)
+    semester_mask = Column(Integer, nullable=False, default=0, index=True)
+    search_text = Column(Text, nullable=False, default="")
+    payload = Column(Text, nullable=False)
+
+
+class CatalogChange(Base):
+    """
+    Append-only log of catalog writes. `revision` increases with every
+    change, so readers can ask for everything after the last one they saw.
+    """
+    __tablename__ = "catalog_changes"
+
+    revision = Column(Integer, primary_key=True, autoincrement=True)
+    # NULL for changes that touch the whole catalog (seeding)
+    course_id = Column(String)
+    # "create", "update", "delete", "refresh" (rendered view changed) or "seed"
+    operation = Column(String, nullable=False)
+    changed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class Job(Base):
+    """
+    A background job (seed or import) and its progress. Kept in the
+    database so every worker can report on jobs started by another.
+    """
+    __tablename__ = "jobs"
+
+    id = Column(String(32), primary_key=True)
+    # "seed" or "import"
+    kind = Column(String, nullable=False)
+    # "queued", "running", "succeeded" or "failed"
+    status = Column(String, nullable=False, default="queued")
+    # Rows to process, once known
+    total = Column(Integer)
+    processed = Column(Integer, nullable=False, default=0, server_default="0")
+    result = Column(JSON)
+    error = Column(Text)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+
+class ImportCheckpoint(Base):
+    """
+    How far a named import got, so a rerun of the same course list
+    continues after the last committed chunk instead of starting over
+    """
+    __tablename__ = "import_checkpoints"
+
+    name = Column(String, primary_key=True)
+    # Hash of the course list and chunk size the position refers to
+    fingerprint = Column(String(64), nullable=False)
+    # Rows (in import order) committed so far
+    position = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
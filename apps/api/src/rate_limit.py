@@ -0,0 +1,201 @@
+"""
+Per-client token buckets with per-route costs, and a concurrency cap for
+the expensive routes.
+
+Settings (from the environment):
+  - RATE_LIMIT_RATE (default 20): tokens per second added to each client's bucket
+  - RATE_LIMIT_BURST (default 100): bucket size; a request costs its route's weight
+  - RATE_LIMIT_REDIS_URL: share the buckets between workers and hosts
+    through Redis (needs the `redis` package); in-process buckets otherwise
+  - RATE_LIMIT_TRUST_PROXY=1: key anonymous clients by the first
+    X-Forwarded-For address instead of the peer address
+  - HEAVY_CONCURRENCY (default 8): heavy requests running at once; keep it
+    below the database pool size so cheap requests still get a connection
+"""
+import hashlib
+import logging
+import math
+import os
+import threading
+import time
+from typing import Callable, Dict, Protocol, Tuple, Union
+
+from fastapi import HTTPException, Request
+
+from .auth import is_valid_api_key
+
+logger = logging.getLogger(__name__)
+
+RATE_ENV = "RATE_LIMIT_RATE"
+BURST_ENV = "RATE_LIMIT_BURST"
+REDIS_URL_ENV = "RATE_LIMIT_REDIS_URL"
+TRUST_PROXY_ENV = "RATE_LIMIT_TRUST_PROXY"
+HEAVY_CONCURRENCY_ENV = "HEAVY_CONCURRENCY"
+
+# In-process buckets kept before idle (full) ones are dropped
+MAX_LOCAL_BUCKETS = 10_000
+# How long a heavy request waits for a slot before it is shed
+HEAVY_WAIT = 0.5
+
+Cost = Union[float, Callable[[Request], float]]
+
+
+class BucketStore(Protocol):
+    def take(self, key: str, cost: float, rate: float, burst: float) -> float:
+        """Take `cost` tokens; 0 if admitted, otherwise seconds until they would be"""
+
+
+class LocalBucketStore:
+    """Buckets in this process; each worker limits on its own"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str, cost: float, rate: float, burst: float) -> float:
+        now = self._clock()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            wait = 0.0 if tokens >= cost else (cost - tokens) / rate
+            if not wait:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > MAX_LOCAL_BUCKETS:
+                self._prune(now, rate, burst)
+            return wait
+
+    def _prune(self, now: float, rate: float, burst: float) -> None:
+        # A bucket that has refilled is the same as no bucket
+        self._buckets = {
+            key: (tokens, updated) for key, (tokens, updated) in self._buckets.items()
+            if tokens + (now - updated) * rate < burst
+        }
+
+
+# Same algorithm as LocalBucketStore, atomic on the Redis server and using
+# its clock. The wait is returned as a string: Lua numbers become integers.
+_TAKE_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local cost, rate, burst = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= cost then tokens = tokens - cost else wait = (cost - tokens) / rate end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisBucketStore:
+    """Buckets shared by every worker using the same Redis"""
+
+    def __init__(self, url: str, prefix: str = "coursecatalog:ratelimit:"):
+        import redis  # optional dependency, only needed with RATE_LIMIT_REDIS_URL
+
+        self._prefix = prefix
+        self._take = redis.Redis.from_url(url).register_script(_TAKE_SCRIPT)
+
+    def take(self, key: str, cost: float, rate: float, burst: float) -> float:
+        return float(self._take(keys=[self._prefix + key], args=[cost, rate, burst]))
+
+
+class RateLimiter:
+    def __init__(self, store: BucketStore, rate: float, burst: float):
+        self.store = store
+        self.rate = rate
+        self.burst = burst
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        redis_url = os.getenv(REDIS_URL_ENV)
+        store = RedisBucketStore(redis_url) if redis_url else LocalBucketStore()
+        return cls(store, float(os.getenv(RATE_ENV) or 20), float(os.getenv(BURST_ENV) or 100))
+
+    def check(self, key: str, cost: float) -> float:
+        """0 if the client may proceed, otherwise seconds to wait"""
+        try:
+            # A request costing more than the bucket holds is still allowed when it is full
+            return self.store.take(key, min(cost, self.burst), self.rate, self.burst)
+        except Exception:
+            # The limiter must not take the API down with it
+            logger.exception("Rate limit store failed; admitting request")
+            return 0.0
+
+
+class ConcurrencyGate:
+    """Caps how many heavy requests run at once"""
+
+    def __init__(self, limit: int, wait: float = HEAVY_WAIT):
+        self.limit = limit
+        self.wait = wait
+        self._semaphore = threading.Semaphore(limit)
+
+    def acquire(self) -> bool:
+        return self._semaphore.acquire(timeout=self.wait)
+
+    def release(self) -> None:
+        self._semaphore.release()
+
+
+rate_limiter = RateLimiter.from_env()
+heavy_gate = ConcurrencyGate(int(os.getenv(HEAVY_CONCURRENCY_ENV) or 8))
+
+
+def client_key(request: Request) -> str:
+    """Clients with a valid API key are limited per key, others per address"""
+    api_key = request.headers.get("x-api-key")
+    # An unchecked header would let anyone pick a fresh bucket per request
+    if is_valid_api_key(api_key):
+        return "key:" + hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded and os.getenv(TRUST_PROXY_ENV, "").lower() in ("1", "true", "yes"):
+        return "ip:" + forwarded.split(",")[0].strip()
+    return "ip:" + (request.client.host if request.client else "unknown")
+
+
+def listing_cost(request: Request) -> float:
+    """Listings and searches cost more the larger the page, and more with a text search"""
+    try:
+        limit = int(request.query_params.get("limit") or 100)
+    except ValueError:
+        limit = 100
+    return 1 + limit / 250 + (2 if request.query_params.get("search") else 0)
+
+
+def rate_limited(cost: Cost = 1, heavy: bool = False):
+    """
+    Dependency charging `cost` tokens (a number, or a function of the
+    request) to the client. Answers 429 when the bucket is empty. `heavy`
+    routes also need a slot under HEAVY_CONCURRENCY, or get a 503.
+    """
+    def dependency(request: Request):
+        weight = cost(request) if callable(cost) else cost
+        wait = rate_limiter.check(client_key(request), weight)
+        if wait:
+            raise HTTPException(
+                status_code=429,
+                detail="Rate limit exceeded",
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+        if not heavy:
+            yield
+            return
+        gate = heavy_gate
+        if not gate.acquire():
+            raise HTTPException(
+                status_code=503,
+                detail="Server busy, try again shortly",
+                headers={"Retry-After": "1"},
+            )
+        try:
+            yield
+        finally:
+            gate.release()
+
+    return dependency
@@ -1,8 +1,14 @@
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 from datetime import datetime
 from .models import CourseLevel, Semester
 
+BULK_MAX_ITEMS = 500
+# Course IDs are 2-6 letters and 4 digits, e.g. "IN1000" or "DIGHEL4350"
+COURSE_ID_PATTERN = "^[A-Z]{2,6}[0-9]{4}$"
+COURSE_ID_MAX_LENGTH = 10
+IMPORT_MAX_ITEMS = 50_000
+
 class CourseBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
     title_english: Optional[str] = None
@@ -23,9 +29,26 @@ class CourseBase(BaseModel):
         """Handle uppercase values from PostgreSQL enum storage."""
         return [s.lower() if isinstance(s, str) else s for s in v]
 
+class PrerequisiteEdge(BaseModel):
+    id: str
+    type: Literal["mandatory", "recommended"] = "mandatory"
+
+# A prerequisite given as a bare course ID is mandatory
+PrerequisiteRef = Union[str, PrerequisiteEdge]
+
+def prerequisite_edges(refs: List[PrerequisiteRef]) -> Dict[str, str]:
+    """Prerequisite ID -> edge type, in the given order (a later duplicate wins)"""
+    edges: Dict[str, str] = {}
+    for ref in refs:
+        if isinstance(ref, str):
+            edges[ref.upper()] = "mandatory"
+        else:
+            edges[ref.id.upper()] = ref.type
+    return edges
+
 class CourseCreate(CourseBase):
-    id: str = Field(..., pattern="^[A-Z]{2,4}[0-9]{4}$")  # Validates format like "IN1000"
-    prerequisite_ids: List[str] = []
+    id: str = Field(..., pattern=COURSE_ID_PATTERN)
+    prerequisite_ids: List[PrerequisiteRef] = []
     
     @field_validator('id')
     @classmethod
@@ -44,16 +67,133 @@ class CourseUpdate(BaseModel):
     level: Optional[CourseLevel] = None
     semester: Optional[List[Semester]] = None # Should be enum Semester not String
     language: Optional[str] = None
-    prerequisite_ids: Optional[List[str]] = None
+    prerequisite_ids: Optional[List[PrerequisiteRef]] = None
     is_active: Optional[bool] = None
     exam_form: Optional[str] = None
     teaching_form: Optional[str] = None
     weekly_hours: Optional[int] = None
 
+class CoursePatch(BaseModel):
+    """
+    JSON Merge Patch (RFC 7396) of a course: absent members are left alone,
+    null clears a member, lists are replaced whole.
+    """
+    model_config = ConfigDict(extra="forbid")
+
+    title: Optional[str] = Field(None, min_length=1, max_length=200)
+    title_english: Optional[str] = None
+    description: Optional[str] = None
+    instructor: Optional[str] = None
+    credits: Optional[int] = Field(None, ge=0, le=60)
+    department: Optional[str] = None
+    level: Optional[CourseLevel] = None
+    semester: Optional[List[Semester]] = None
+    language: Optional[str] = None
+    prerequisite_ids: Optional[List[PrerequisiteRef]] = None
+    is_active: Optional[bool] = None
+    exam_form: Optional[str] = None
+    teaching_form: Optional[str] = None
+    weekly_hours: Optional[int] = Field(None, ge=0, le=40)
+
+    @field_validator('title', 'credits', 'department', 'level', 'language', 'is_active')
+    @classmethod
+    def required_not_null(cls, v: Any) -> Any:
+        if v is None:
+            raise ValueError('Field cannot be removed')
+        return v
+
+    def changes(self) -> Dict[str, Any]:
+        """Members set by the patch; a removed list becomes empty"""
+        data = {field: getattr(self, field) for field in self.model_fields_set}
+        for field in ('semester', 'prerequisite_ids'):
+            if field in data and data[field] is None:
+                data[field] = []
+        return data
+
 class Course(CourseBase):
     id: str
+    version: int = 1
     is_active: bool
     created_at: datetime
     updated_at: Optional[datetime]
     prerequisites: List['Course'] = []
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class PrerequisiteStub(BaseModel):
+    id: str
+    title: str
+    title_english: Optional[str] = None
+    type: str = "mandatory"
+
+class CourseRead(CourseBase):
+    """Course as served by the listing and detail endpoints"""
+    id: str
+    version: int = 1
+    is_active: bool
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    prerequisites: List[PrerequisiteStub] = []
+    dependent_count: int = 0
+    transitive_prerequisite_count: int = 0
+
+class CourseSearchResponse(BaseModel):
+    total: int
+    items: List[CourseRead]
+    # facet -> value -> number of results if that value were selected
+    facets: Dict[str, Dict[str, int]]
+
+class CourseBulkRequest(BaseModel):
+    # Items are validated one by one so a bad item does not reject the batch
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class CourseBulkItemResult(BaseModel):
+    index: int
+    id: Optional[str] = None
+    status: str  # "created", "updated", "skipped" or "error"
+    errors: List[Any] = []
+
+class CourseBulkResponse(BaseModel):
+    created: int
+    updated: int
+    failed: int
+    results: List[CourseBulkItemResult]
+
+class CourseImportRequest(BaseModel):
+    # Validated item by item like bulk upserts, and committed in chunks
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=IMPORT_MAX_ITEMS)
+
+class JobRead(BaseModel):
+    id: str
+    kind: str
+    status: str  # "queued", "running", "succeeded" or "failed"
+    total: Optional[int] = None
+    processed: int
+    rows_per_second: Optional[float] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+
+class CatalogChangeRead(BaseModel):
+    revision: int
+    course_id: Optional[str] = None
+    operation: str
+    changed_at: datetime
+
+class CatalogChangesResponse(BaseModel):
+    # Latest revision in the log. Poll again with `since` set to the last
+    # change's revision while `has_more`, otherwise to this revision.
+    revision: int
+    changes: List[CatalogChangeRead]
+    has_more: bool
+
+class CourseDeltaResponse(BaseModel):
+    # Pass as `since` on the next sync
+    revision: int
+    # Replace the local copy instead of merging (first sync or re-seed)
+    reset: bool
+    courses: List[CourseRead]
+    deleted: List[str]
+    # course ID -> its complete, current prerequisite list
+    prerequisites: Dict[str, List[PrerequisiteEdge]]
@@ -0,0 +1,50 @@
+"""
+Production entry point: pre-forks uvicorn workers that share one catalog
+snapshot instead of each building their own.
+
+Run with: cd apps/api && python -m src.serve --workers 4
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uvicorn
+
+from src.export_catalog import export_catalog
+from src.shared_catalog import CATALOG_SNAPSHOT_ENV, DEFAULT_SNAPSHOT_PATH
+from src.startup import WARMUP_ENV
+
+
+def default_snapshot_path() -> str:
+    if os.getenv(CATALOG_SNAPSHOT_ENV):
+        return os.environ[CATALOG_SNAPSHOT_ENV]
+    if os.path.isdir(os.path.dirname(DEFAULT_SNAPSHOT_PATH)):
+        return DEFAULT_SNAPSHOT_PATH
+    return os.path.join(tempfile.gettempdir(), os.path.basename(DEFAULT_SNAPSHOT_PATH))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the course catalog API with several workers")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)))
+    parser.add_argument("--snapshot-path", default=default_snapshot_path())
+    parser.add_argument("--warmup", action="store_true", help="Preload caches in every worker on startup")
+    args = parser.parse_args()
+
+    # Workers are started as fresh processes and read their settings from the environment
+    os.environ[CATALOG_SNAPSHOT_ENV] = args.snapshot_path
+    if args.warmup:
+        os.environ[WARMUP_ENV] = "1"
+
+    revision = export_catalog(args.snapshot_path)
+    print(f"Published catalog snapshot generation {revision} to {args.snapshot_path}")
+
+    uvicorn.run("src.main:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from ..database import SessionLocal
+from .change_log_service import ChangeLogService
+
+logger = logging.getLogger(__name__)
+
+# How often the latest revision is read from the database
+POLL_INTERVAL = 1.0
+
+
+def _latest_revision() -> int:
+    db = SessionLocal()
+    try:
+        return ChangeLogService.latest_revision(db)
+    finally:
+        db.close()
+
+
+class ChangeFeed:
+    """
+    One poller per process that watches the latest change revision and wakes
+    the waiting change streams, so idle streams cost one query per interval
+    in total instead of one per client.
+    """
+
+    def __init__(self, interval: float = POLL_INTERVAL):
+        self.interval = interval
+        self.revision: Optional[int] = None
+        self._condition: Optional[asyncio.Condition] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._condition = asyncio.Condition()
+            self._task = loop.create_task(self._poll())
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                revision = await run_in_threadpool(_latest_revision)
+            except Exception:
+                logger.exception("Failed to read the latest catalog revision")
+            else:
+                if revision != self.revision:
+                    self.revision = revision
+                    async with self._condition:
+                        self._condition.notify_all()
+            await asyncio.sleep(self.interval)
+
+    async def wait_after(self, revision: int, timeout: float) -> Optional[int]:
+        """Wait until the log has moved past `revision`; returns the latest revision seen"""
+        self._ensure_started()
+        condition = self._condition
+        try:
+            async with condition:
+                await asyncio.wait_for(
+                    condition.wait_for(lambda: self.revision is not None and self.revision > revision),
+                    timeout,
+                )
+        except asyncio.TimeoutError:
+            pass
+        return self.revision
+
+
+change_feed = ChangeFeed()
@@ -0,0 +1,87 @@
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import func, insert, select, text, update
+from sqlalchemy.orm import Session
+
+from ..models import CatalogChange, Course
+
+# Most changes returned by one poll
+CHANGES_PAGE_SIZE = 500
+
+
+class ChangeLogService:
+    """
+    Appends catalog writes to `catalog_changes` in the writer's transaction,
+    stamps the changed courses with the new revision, and serves the log to
+    pollers, the change stream and delta sync.
+    """
+
+    @staticmethod
+    def record(
+        db: Session,
+        operation: str,
+        course_ids: Iterable[Optional[str]],
+        affected: Iterable[str] = (),
+    ) -> None:
+        """
+        Log `operation` for each of `course_ids`, and a "refresh" for the
+        other `affected` courses whose rendered view changed (does not commit)
+        """
+        course_ids = list(dict.fromkeys(course_ids))
+        rows = [{"course_id": course_id, "operation": operation} for course_id in course_ids]
+        rows.extend(
+            {"course_id": course_id, "operation": "refresh"}
+            for course_id in sorted(set(affected) - set(course_ids))
+        )
+        if not rows:
+            return
+        if db.get_bind().dialect.name == "postgresql":
+            # Concurrent writers would otherwise commit revisions out of
+            # order, and a poller could skip one that becomes visible later
+            db.execute(text("LOCK TABLE catalog_changes IN EXCLUSIVE MODE"))
+        db.execute(insert(CatalogChange), rows)
+        course_ids = [row["course_id"] for row in rows if row["course_id"]]
+        if course_ids:
+            revision = db.scalar(select(func.max(CatalogChange.revision)))
+            # Keep updated_at: a refresh is not a change to the course itself
+            db.execute(
+                update(Course)
+                .where(Course.id.in_(course_ids))
+                .values(revision=revision, updated_at=Course.updated_at)
+            )
+
+    @staticmethod
+    def latest_revision(db: Session) -> int:
+        return db.scalar(select(func.max(CatalogChange.revision))) or 0
+
+    @staticmethod
+    def changed_courses(db: Session, revision: int, operations: Iterable[str]) -> Set[Optional[str]]:
+        """Courses with one of `operations` logged after `revision` (None for catalog-wide changes)"""
+        return set(db.scalars(
+            select(CatalogChange.course_id).distinct()
+            .where(CatalogChange.revision > revision, CatalogChange.operation.in_(list(operations)))
+        ))
+
+    @staticmethod
+    def since(db: Session, revision: int, limit: int = CHANGES_PAGE_SIZE) -> Dict[str, Any]:
+        """Changes after `revision`, oldest first"""
+        rows = db.execute(
+            select(CatalogChange)
+            .where(CatalogChange.revision > revision)
+            .order_by(CatalogChange.revision)
+            .limit(limit + 1)
+        ).scalars().all()
+        changes: List[Dict[str, Any]] = [
+            {
+                "revision": row.revision,
+                "course_id": row.course_id,
+                "operation": row.operation,
+                "changed_at": row.changed_at,
+            }
+            for row in rows[:limit]
+        ]
+        return {
+            "revision": ChangeLogService.latest_revision(db),
+            "changes": changes,
+            "has_more": len(rows) > limit,
+        }
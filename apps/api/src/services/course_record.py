@@ -0,0 +1,110 @@
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..catalog_snapshot import LEVELS
+from ..models import SEMESTER_BITS, Course, CourseLevel, Semester
+from ..shared_catalog import current_snapshot
+from .swr_cache import SwrCache
+
+SEARCH_FIELDS = ("id", "title", "title_english", "description", "instructor")
+
+
+def search_text(row) -> str:
+    """Lower-cased search fields of a course, one per line so a term cannot span two"""
+    return "\n".join((row[f] or "").lower() for f in SEARCH_FIELDS)
+
+
+@dataclass(frozen=True, slots=True)
+class CourseRecord:
+    """
+    Immutable in-memory copy of the course columns the read services use.
+
+    Department and language are interned, so the thousands of records that
+    share a value point at one string; level is the enum member and the
+    semesters are the bitmask.
+    """
+
+    id: str
+    title: str
+    title_english: Optional[str]
+    description: Optional[str]
+    instructor: Optional[str]
+    credits: int
+    department: str
+    level: CourseLevel
+    language: str
+    semester_mask: int
+    is_active: bool
+
+    @classmethod
+    def from_row(cls, row) -> "CourseRecord":
+        return cls(
+            id=row["id"],
+            title=row["title"],
+            title_english=row["title_english"],
+            description=row["description"],
+            instructor=row["instructor"],
+            credits=row["credits"],
+            department=sys.intern(row["department"]),
+            level=CourseLevel(row["level"]),
+            language=sys.intern(row["language"] or "Norwegian"),
+            semester_mask=row["semester_mask"] or 0,
+            is_active=bool(row["is_active"]),
+        )
+
+    def __getitem__(self, field: str):
+        # Lets records go wherever a row mapping is accepted, e.g. search_text
+        return getattr(self, field)
+
+    @property
+    def semesters(self) -> List[Semester]:
+        return [semester for semester, bit in SEMESTER_BITS.items() if self.semester_mask & bit]
+
+
+RECORD_COLUMNS = [getattr(Course, name) for name in CourseRecord.__slots__]
+
+
+def load_course_records(db: Session) -> List[CourseRecord]:
+    """All courses, active or not, ordered by ID"""
+    snapshot = current_snapshot()
+    if snapshot:
+        return records_from_snapshot(snapshot)
+    rows = db.execute(select(*RECORD_COLUMNS).order_by(Course.id)).mappings()
+    return [CourseRecord.from_row(row) for row in rows]
+
+
+def records_from_snapshot(snapshot) -> List[CourseRecord]:
+    """Records for every course in the shared catalog snapshot"""
+    return [
+        CourseRecord(
+            id=snapshot.course_id(course),
+            title=snapshot.field(course, "title") or "",
+            title_english=snapshot.field(course, "title_english"),
+            description=snapshot.field(course, "description"),
+            instructor=snapshot.field(course, "instructor"),
+            credits=snapshot.credits[course],
+            department=sys.intern(snapshot.departments[snapshot.department[course]]),
+            level=LEVELS[snapshot.level[course]],
+            language=sys.intern(snapshot.languages[snapshot.language[course]]),
+            semester_mask=snapshot.semester_mask[course],
+            is_active=bool(snapshot.active[course]),
+        )
+        for course in range(snapshot.course_count)
+    ]
+
+
+_records: SwrCache[List[CourseRecord]] = SwrCache("course records", load_course_records)
+
+
+def get_course_records(db: Session, fresh: bool = False) -> List[CourseRecord]:
+    """Return the process-wide course records, loading them on first use"""
+    return _records.get(db, fresh)
+
+
+def reset_course_records() -> None:
+    """Mark the course records stale after a write"""
+    _records.invalidate()
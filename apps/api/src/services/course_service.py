@@ -1,8 +1,36 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func, select, cast, String
-from typing import List, Optional, Dict
-from ..models import Course, prerequisite_table
-from ..schemas import CourseCreate, CourseUpdate
+from sqlalchemy import and_, or_, func, select, insert, text, update, delete, bindparam, tuple_
+from pydantic import ValidationError
+from typing import Any, Iterable, List, Optional, Dict, Tuple
+from ..models import Course, prerequisite_table, masks_with_semester, semester_mask
+from ..schemas import CourseCreate, CoursePatch, CourseUpdate, prerequisite_edges
+from .prerequisite_graph import (
+    EdgeDiff, PrerequisiteCycleError, get_prerequisite_graph, reset_prerequisite_graph,
+    stored_dependents, stored_descendants,
+)
+from .statistics_service import StatisticsService
+from .change_log_service import ChangeLogService
+from .course_record import reset_course_records
+from .facet_index import get_facet_index, reset_facet_index
+from .read_model_service import ReadModelService
+from .response_store import response_store
+from .single_flight import single_flight
+from .swr_cache import SwrCache
+from ..shared_catalog import current_snapshot, shared_catalog
+
+# Columns the statistics counters are derived from
+FOOTPRINT_COLUMNS = [
+    Course.department, Course.level, Course.language, Course.semester, Course.credits, Course.is_active,
+]
+
+
+class VersionMismatchError(Exception):
+    """Raised when a conditional write finds the course at another version"""
+
+    def __init__(self, version: int):
+        self.version = version
+        super().__init__(f"Course is at version {version}")
+
 
 class CourseService:
     @staticmethod
@@ -14,11 +42,41 @@ class CourseService:
         level: Optional[str] = None,
         language: Optional[str] = None,
         semester: Optional[str] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        min_credits: Optional[int] = None,
+        max_credits: Optional[int] = None,
+        sort: str = "id"
     ) -> List[Course]:
         """
-        Get courses with filtering and search functionality
+        Filtered courses straight from the courses table. The API lists
+        through ReadModelService.list_payloads; this is the reference the
+        filter engine is tested against.
         """
+        query = CourseService.listing_query(
+            db, department, level, language, semester, search, min_credits, max_credits
+        )
+        if sort == "credits":
+            query = query.order_by(Course.credits, Course.id)
+        elif sort == "-credits":
+            query = query.order_by(Course.credits.desc(), Course.id)
+        else:
+            query = query.order_by(Course.id)
+
+        # Apply pagination and return results
+        return query.offset(skip).limit(limit).all()
+
+    @staticmethod
+    def listing_query(
+        db: Session,
+        department: Optional[str] = None,
+        level: Optional[str] = None,
+        language: Optional[str] = None,
+        semester: Optional[str] = None,
+        search: Optional[str] = None,
+        min_credits: Optional[int] = None,
+        max_credits: Optional[int] = None
+    ):
+        """Build the filtered course query for get_courses (without pagination)"""
         # Start with base query and eagerly load prerequisites
         query = db.query(Course).options(joinedload(Course.prerequisites)).filter(Course.is_active)
         
@@ -33,7 +91,13 @@ class CourseService:
             query = query.filter(Course.language == language)
         
         if semester:
-            query = query.filter(cast(Course.semester, String).contains(semester))
+            query = query.filter(Course.semester_mask.in_(masks_with_semester(semester)))
+
+        if min_credits is not None:
+            query = query.filter(Course.credits >= min_credits)
+
+        if max_credits is not None:
+            query = query.filter(Course.credits <= max_credits)
         
         # Search functionality - search across multiple fields
         if search:
@@ -48,9 +112,35 @@ class CourseService:
                 )
             )
         
-        # Apply pagination and return results
-        return query.offset(skip).limit(limit).all()
+        return query
     
+    @staticmethod
+    def search_courses(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        department: Optional[str] = None,
+        level: Optional[str] = None,
+        language: Optional[str] = None,
+        semester: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a page of courses plus facet counts for every filter dimension,
+        answered from the in-memory facet index. Items are the pre-rendered
+        JSON documents from the read model.
+        """
+        index = get_facet_index(db)
+        ids, facets = index.search(
+            {"department": department, "level": level, "language": language, "semester": semester},
+            search,
+        )
+        return {
+            "total": len(ids),
+            "items": ReadModelService.get_payloads(db, ids[skip:skip + limit]),
+            "facets": facets,
+        }
+
     @staticmethod
     def get_course(db: Session, course_id: str) -> Optional[Course]:
         """Get a single course by ID with prerequisites"""
@@ -63,20 +153,16 @@ class CourseService:
     def create_course(db: Session, course: CourseCreate) -> Course:
         """Create a new course"""
         # Extract prerequisite IDs
-        prerequisite_ids = course.prerequisite_ids
+        prerequisites = CourseService._known_prerequisites(db, course.prerequisite_ids)
         course_data = course.model_dump(exclude={'prerequisite_ids'})
         
         # Create course
         db_course = Course(**course_data)
         db.add(db_course)
         db.flush()  # Flush to get the ID
+        StatisticsService.apply_change(db, {}, StatisticsService.footprint(db_course))
         
-        # Add prerequisites
-        if prerequisite_ids:
-            prerequisites = db.query(Course).filter(Course.id.in_(prerequisite_ids)).all()
-            db_course.prerequisites.extend(prerequisites)
-        
-        db.commit()
+        CourseService._commit_prerequisites(db, db_course.id, prerequisites, operation="create")
         db.refresh(db_course)
         return db_course
     
@@ -92,25 +178,501 @@ class CourseService:
         update_data = course_update.model_dump(exclude={'prerequisite_ids'}, exclude_unset=True)
         
         # Update course fields
+        before = StatisticsService.footprint(db_course)
         for field, value in update_data.items():
             setattr(db_course, field, value)
+        db_course.version = Course.version + 1
+        StatisticsService.apply_change(db, before, StatisticsService.footprint(db_course))
         
         # Update prerequisites if provided
         if prerequisite_ids is not None:
-            # Clear existing prerequisites
-            db_course.prerequisites.clear()
-            # Add new prerequisites
-            if prerequisite_ids:
-                prerequisites = db.query(Course).filter(Course.id.in_(prerequisite_ids)).all()
-                db_course.prerequisites.extend(prerequisites)
-        
-        db.commit()
+            CourseService._commit_prerequisites(
+                db, db_course.id, CourseService._known_prerequisites(db, prerequisite_ids),
+                fields_changed=bool(update_data),
+            )
+        else:
+            CourseService._commit_course(db, db_course.id)
+
         db.refresh(db_course)
         return db_course
+
+    @staticmethod
+    def patch_course(
+        db: Session, course_id: str, patch: CoursePatch, versions: Optional[Iterable[int]] = None
+    ) -> Optional[int]:
+        """
+        Apply a merge patch with a single UPDATE ... RETURNING for the scalar
+        fields; prerequisites are only read when the patch replaces them.
+        With `versions` (from If-Match) the course must be at one of them,
+        otherwise VersionMismatchError is raised. Returns the new version, or
+        None if the course does not exist.
+        """
+        changes = patch.changes()
+        prerequisite_refs = changes.pop("prerequisite_ids", None)
+        if "semester" in changes:
+            # Core updates bypass the ORM validator on semester
+            changes["semester_mask"] = semester_mask(changes["semester"])
+        conditions = [Course.id == course_id, Course.is_active]
+        if versions is not None:
+            conditions.append(Course.version.in_(list(versions)))
+
+        if not changes and prerequisite_refs is None:
+            version = db.scalar(select(Course.version).where(*conditions))
+            return version if version is not None else CourseService._missing_or_mismatch(db, course_id)
+
+        counted = changes.keys() & {column.key for column in FOOTPRINT_COLUMNS}
+        before = None
+        if counted:
+            # Only the statistics need the old values; RETURNING gives the new ones
+            before = db.execute(
+                select(*FOOTPRINT_COLUMNS).where(*conditions).with_for_update()
+            ).mappings().first()
+        row = db.execute(
+            update(Course)
+            .where(*conditions)
+            .values(**changes, version=Course.version + 1)
+            .returning(Course.version, *FOOTPRINT_COLUMNS)
+            .execution_options(synchronize_session=False)
+        ).mappings().first()
+        if row is None:
+            db.rollback()
+            return CourseService._missing_or_mismatch(db, course_id)
+        if before is not None:
+            StatisticsService.apply_change(
+                db, StatisticsService.footprint(dict(before)), StatisticsService.footprint(dict(row))
+            )
+
+        operation = "delete" if changes.get("is_active") is False else "update"
+        if prerequisite_refs is not None:
+            CourseService._commit_prerequisites(
+                db, course_id, CourseService._known_prerequisites(db, prerequisite_refs),
+                operation=operation, fields_changed=bool(changes),
+            )
+        else:
+            CourseService._commit_course(db, course_id, operation=operation)
+        return row["version"]
+
+    @staticmethod
+    def _missing_or_mismatch(db: Session, course_id: str) -> None:
+        """Return None for a missing course, raise VersionMismatchError for a stale one"""
+        version = db.scalar(select(Course.version).where(Course.id == course_id, Course.is_active))
+        if version is not None:
+            raise VersionMismatchError(version)
+        return None
+
+    @staticmethod
+    def delete_course(db: Session, course_id: str) -> bool:
+        """Soft delete a course (mark as inactive)"""
+        db_course = CourseService.get_course(db, course_id)
+        if not db_course:
+            return False
+
+        StatisticsService.apply_change(db, StatisticsService.footprint(db_course), {})
+        db_course.is_active = False
+        db_course.version = Course.version + 1
+        CourseService._commit_course(db, course_id, operation="delete")
+        return True
+
+    @staticmethod
+    def invalidate_caches(course_ids: Optional[Iterable[str]] = None, fields: bool = True) -> None:
+        """
+        Drop in-memory read structures after a committed write. `course_ids`
+        are the courses whose rendered responses changed (all when None);
+        `fields=False` means only prerequisite edges changed, which the
+        course records, facet index and filter engine do not hold.
+        """
+        if shared_catalog:
+            # Mark the snapshot stale first, so rebuilt structures read the database
+            shared_catalog.request_publish()
+        CourseService.invalidate_local_caches(course_ids, fields)
+
+    @staticmethod
+    def invalidate_local_caches(course_ids: Optional[Iterable[str]] = None, fields: bool = True) -> None:
+        """Drop this process's in-memory read structures"""
+        from .filter_engine import reset_filter_engine
+
+        if fields:
+            reset_course_records()
+            reset_facet_index()
+            reset_filter_engine()
+        _prerequisite_counts.invalidate()
+        response_store.invalidate(course_ids)
+        single_flight.reset()
+
+    @staticmethod
+    def _commit_course(db: Session, course_id: str, operation: str = "update") -> None:
+        """Commit a change to a course's own fields along with its read model rows"""
+        graph = get_prerequisite_graph(db)
+        with graph.lock:
+            # Dependents render this course's title in their prerequisite stubs
+            ReadModelService.refresh(db, {course_id} | stored_dependents(db, [course_id]))
+            # Dependency graphs of all descendants show this course as a node
+            affected = {course_id} | stored_descendants(db, [course_id])
+            ChangeLogService.record(db, operation, [course_id], affected)
+            db.commit()
+        CourseService.invalidate_caches(affected)
+
+    @staticmethod
+    def _known_prerequisites(db: Session, refs) -> Dict[str, str]:
+        """Prerequisite ID -> edge type for the referenced courses that exist"""
+        edges = prerequisite_edges(refs or [])
+        if not edges:
+            return {}
+        known = set(db.scalars(select(Course.id).where(Course.id.in_(list(edges)))))
+        return {
+            prerequisite_id: edge_type for prerequisite_id, edge_type in edges.items()
+            if prerequisite_id in known
+        }
+
+    @staticmethod
+    def _stored_edges(db: Session, course_ids: Iterable[str]) -> Dict[tuple, Optional[str]]:
+        """(course_id, prerequisite_id) -> type of the stored edges of `course_ids`"""
+        return {
+            (row.course_id, row.prerequisite_id): row.type
+            for row in db.execute(
+                select(prerequisite_table).where(prerequisite_table.c.course_id.in_(list(course_ids)))
+            )
+        }
+
+    @staticmethod
+    def _write_edges(db: Session, diff: EdgeDiff) -> None:
+        """
+        Apply an edge diff with one delete, one insert and one type update
+        (does not commit). Added edges are checked for cycles against the
+        stored edges, since the in-memory graph of this worker can miss a
+        concurrent write by another; raises PrerequisiteCycleError.
+        """
+        table = prerequisite_table
+        if diff.added and db.get_bind().dialect.name == "postgresql":
+            # Serialise edge writers until commit, so two writers cannot each
+            # add half of a cycle (reads are not blocked)
+            db.execute(text("LOCK TABLE prerequisites IN SHARE ROW EXCLUSIVE MODE"))
+        if diff.removed:
+            db.execute(
+                delete(table).where(
+                    tuple_(table.c.course_id, table.c.prerequisite_id).in_(sorted(diff.removed))
+                )
+            )
+        if diff.added:
+            db.execute(insert(table), [
+                {"course_id": course_id, "prerequisite_id": prerequisite_id, "type": edge_type}
+                for (course_id, prerequisite_id), edge_type in diff.added.items()
+            ])
+        if diff.retyped:
+            db.execute(
+                update(table)
+                .where(
+                    table.c.course_id == bindparam("b_course_id"),
+                    table.c.prerequisite_id == bindparam("b_prerequisite_id"),
+                )
+                .values(type=bindparam("b_type")),
+                [
+                    {"b_course_id": course_id, "b_prerequisite_id": prerequisite_id, "b_type": edge_type}
+                    for (course_id, prerequisite_id), edge_type in diff.retyped.items()
+                ],
+            )
+        if diff.added:
+            cycle = CourseService._stored_cycle(db, diff.added)
+            if cycle:
+                raise PrerequisiteCycleError(cycle)
+
+    @staticmethod
+    def _stored_cycle(db: Session, added: Iterable[Tuple[str, str]]) -> Optional[List[str]]:
+        """
+        A cycle through one of the `added` (course, prerequisite) edges in the
+        stored edges, loading only the prerequisite chains above them
+        """
+        table = prerequisite_table
+        prerequisites: Dict[str, List[str]] = {}
+        for course_id, prerequisite_id in added:
+            if prerequisite_id == course_id:
+                return [course_id, course_id]
+            # Each visited course -> the course it is a prerequisite of
+            parent: Dict[str, Optional[str]] = {prerequisite_id: None}
+            frontier = [prerequisite_id]
+            while frontier:
+                unknown = [c for c in frontier if c not in prerequisites]
+                if unknown:
+                    for c in unknown:
+                        prerequisites[c] = []
+                    for row in db.execute(
+                        select(table.c.course_id, table.c.prerequisite_id).where(table.c.course_id.in_(unknown))
+                    ):
+                        prerequisites[row.course_id].append(row.prerequisite_id)
+                next_frontier = []
+                for node in frontier:
+                    for prerequisite in prerequisites[node]:
+                        if prerequisite == course_id:
+                            path = [node]
+                            while parent[path[-1]] is not None:
+                                path.append(parent[path[-1]])
+                            return [course_id, *path, course_id]
+                        if prerequisite not in parent:
+                            parent[prerequisite] = node
+                            next_frontier.append(prerequisite)
+                frontier = next_frontier
+        return None
+
+    @staticmethod
+    def _commit_prerequisites(
+        db: Session,
+        course_id: str,
+        prerequisites: Dict[str, str],
+        operation: str = "update",
+        fields_changed: bool = True,
+    ) -> None:
+        """
+        Commit pending changes after checking the course's new prerequisites
+        (ID -> edge type) against the in-memory graph and then the stored
+        edges, writing only the edges that changed. Raises
+        PrerequisiteCycleError (and rolls back) if the new edges would create
+        a cycle.
+        """
+        graph = get_prerequisite_graph(db)
+        with graph.lock:
+            diff = EdgeDiff.between(CourseService._stored_edges(db, [course_id]), {course_id: prerequisites})
+            moved = diff.moved(course_id)
+            if moved:
+                try:
+                    graph.set_prerequisites(course_id, prerequisites)
+                except Exception:
+                    db.rollback()
+                    raise
+
+            try:
+                CourseService._write_edges(db, diff)
+                # The course's own row shows its stubs with their edge types
+                refresh = {course_id}
+                if fields_changed:
+                    # Dependents render this course's title in their prerequisite stubs
+                    refresh |= stored_dependents(db, [course_id])
+                if moved:
+                    # Transitive counts of descendants, dependent counts of the
+                    # gained and lost prerequisites
+                    refresh |= ReadModelService.affected_by(db, [course_id], moved)
+                # Dependency graphs of all descendants show this course and its edges
+                affected = refresh | stored_descendants(db, [course_id]) if fields_changed or diff else refresh
+                ReadModelService.refresh(db, refresh)
+                ChangeLogService.record(db, operation, [course_id], affected)
+                db.commit()
+            except Exception:
+                db.rollback()
+                reset_prerequisite_graph()
+                raise
+        CourseService.invalidate_caches(affected, fields=fields_changed)
     
+    @staticmethod
+    def bulk_upsert_courses(db: Session, items: List[Dict[str, Any]], atomic: bool = False) -> Dict[str, Any]:
+        """
+        Create or update many courses in a single transaction.
+
+        Items whose ID already exists are validated as CourseUpdate, the rest
+        as CourseCreate. Prerequisites are resolved with one IN query and rows
+        are written with executemany. Invalid items are reported per item and
+        skipped; with `atomic` any invalid item means nothing is written.
+        """
+        results: List[Dict[str, Any]] = [
+            {"index": index, "id": None, "status": None, "errors": []}
+            for index in range(len(items))
+        ]
+
+        def fail(index: int, *errors: Any) -> None:
+            results[index]["status"] = "error"
+            results[index]["errors"].extend(errors)
+
+        # Collect IDs so courses and prerequisites are resolved with one query
+        item_ids: Dict[int, str] = {}
+        seen_ids = set()
+        referenced_ids = set()
+        for index, item in enumerate(items):
+            course_id = item.get("id")
+            if not isinstance(course_id, str) or not course_id:
+                fail(index, "Course ID is required")
+                continue
+            course_id = course_id.upper()
+            results[index]["id"] = course_id
+            if course_id in seen_ids:
+                fail(index, "Duplicate course ID in batch")
+                continue
+            seen_ids.add(course_id)
+            item_ids[index] = course_id
+            prerequisite_ids = item.get("prerequisite_ids")
+            if isinstance(prerequisite_ids, list):
+                for ref in prerequisite_ids:
+                    if isinstance(ref, dict):
+                        ref = ref.get("id")
+                    if isinstance(ref, str):
+                        referenced_ids.add(ref.upper())
+
+        lookup_ids = seen_ids | referenced_ids
+        existing = {
+            row["id"]: dict(row) for row in db.execute(
+                select(
+                    Course.id, Course.department, Course.level, Course.language,
+                    Course.semester, Course.credits, Course.is_active,
+                ).where(Course.id.in_(lookup_ids))
+            ).mappings()
+        } if lookup_ids else {}
+        existing_ids = set(existing)
+
+        # Validate each item against the schema matching its operation
+        creates: Dict[int, CourseCreate] = {}
+        updates: Dict[int, CourseUpdate] = {}
+        for index, course_id in item_ids.items():
+            data = dict(items[index])
+            try:
+                if course_id in existing_ids:
+                    data.pop("id", None)
+                    updates[index] = CourseUpdate.model_validate(data)
+                else:
+                    data["id"] = course_id
+                    creates[index] = CourseCreate.model_validate(data)
+            except ValidationError as e:
+                fail(index, *e.errors(include_url=False, include_context=False))
+
+        known_ids = existing_ids | {creates[i].id for i in creates}
+        edges: Dict[str, Dict[str, str]] = {}
+        graph = get_prerequisite_graph(db)
+        with graph.lock:
+            for index in sorted(creates.keys() | updates.keys()):
+                course = creates.get(index) or updates[index]
+                if course.prerequisite_ids is None:
+                    continue
+                course_id = item_ids[index]
+                prerequisites = prerequisite_edges(course.prerequisite_ids)
+                unknown = [p for p in prerequisites if p not in known_ids]
+                if unknown:
+                    fail(index, f"Unknown prerequisites: {', '.join(unknown)}")
+                    continue
+                try:
+                    graph.set_prerequisites(course_id, prerequisites)
+                except PrerequisiteCycleError as e:
+                    fail(index, {"message": "Prerequisites would create a cycle", "path": e.path})
+                    continue
+                edges[course_id] = prerequisites
+
+            # A course that failed cannot be a prerequisite of a written item
+            cascaded = False
+            index_of = {course_id: index for index, course_id in item_ids.items()}
+            failed_ids = {item_ids[i] for i in item_ids if results[i]["errors"]}
+            while failed_ids:
+                newly_failed = set()
+                for course_id, prerequisite_ids in list(edges.items()):
+                    missing = [p for p in prerequisite_ids if p in failed_ids and p not in existing_ids]
+                    if missing:
+                        fail(index_of[course_id], f"Prerequisites failed in this batch: {', '.join(missing)}")
+                        del edges[course_id]
+                        newly_failed.add(course_id)
+                cascaded = cascaded or bool(newly_failed)
+                failed_ids = newly_failed
+
+            valid = sorted(
+                index for index in creates.keys() | updates.keys()
+                if not results[index]["errors"]
+            )
+            if not valid or (atomic and len(valid) < len(items)):
+                # The graph may hold edges of items that will not be written
+                reset_prerequisite_graph()
+                for index in valid:
+                    results[index]["status"] = "skipped"
+                return CourseService._bulk_summary(results)
+
+            create_rows = []
+            update_rows = []
+            for index in valid:
+                if index in creates:
+                    row = creates[index].model_dump(exclude={"prerequisite_ids"})
+                    create_rows.append(row)
+                    results[index]["status"] = "created"
+                else:
+                    row = updates[index].model_dump(exclude={"prerequisite_ids"}, exclude_unset=True)
+                    if row:
+                        row = {"id": item_ids[index], **row}
+                        update_rows.append(row)
+                    results[index]["status"] = "updated"
+                # Core inserts and updates bypass the ORM validator on semester
+                if "semester" in row:
+                    row["semester_mask"] = semester_mask(row["semester"])
+
+            stat_changes = [({}, StatisticsService.footprint(row)) for row in create_rows]
+            stat_changes.extend(
+                (
+                    StatisticsService.footprint(existing[row["id"]]),
+                    StatisticsService.footprint({**existing[row["id"]], **row}),
+                )
+                for row in update_rows
+            )
+
+            try:
+                StatisticsService.apply_changes(db, stat_changes)
+                if create_rows:
+                    db.execute(insert(Course), create_rows)
+                if update_rows:
+                    db.execute(update(Course), update_rows)
+                updated_ids = [item_ids[i] for i in valid if i in updates]
+                if updated_ids:
+                    db.execute(
+                        update(Course)
+                        .where(Course.id.in_(updated_ids))
+                        .values(version=Course.version + 1)
+                        .execution_options(synchronize_session=False)
+                    )
+                diff = EdgeDiff.between(CourseService._stored_edges(db, edges), edges) if edges else EdgeDiff()
+                CourseService._write_edges(db, diff)
+
+                if cascaded:
+                    # Edges of items failed by the cascade are still in the
+                    # graph; reload it from this transaction's view
+                    reset_prerequisite_graph()
+                    db.flush()
+                    get_prerequisite_graph(db)
+                valid_ids = [item_ids[index] for index in valid]
+                affected = ReadModelService.affected_by(
+                    db, valid_ids, *(diff.moved(course_id) for course_id in valid_ids)
+                )
+                ReadModelService.refresh(db, affected)
+                created = [item_ids[i] for i in valid if results[i]["status"] == "created"]
+                updated = [item_ids[i] for i in valid if results[i]["status"] == "updated"]
+                # Updates that deactivate a course are logged as deletes, like PATCH does
+                deleted = [item_ids[i] for i in valid if i in updates and updates[i].is_active is False]
+                ChangeLogService.record(db, "create", created)
+                ChangeLogService.record(db, "delete", deleted)
+                ChangeLogService.record(
+                    db, "update", [c for c in updated if c not in deleted], affected - set(created) - set(deleted)
+                )
+                db.commit()
+            except PrerequisiteCycleError as e:
+                # Another worker's committed edges close a cycle with this batch
+                db.rollback()
+                reset_prerequisite_graph()
+                for index in valid:
+                    fail(index, {"message": "Prerequisites would create a cycle", "path": e.path})
+                return CourseService._bulk_summary(results)
+            except Exception:
+                db.rollback()
+                reset_prerequisite_graph()
+                raise
+            CourseService.invalidate_caches(affected)
+
+        return CourseService._bulk_summary(results)
+
+    @staticmethod
+    def _bulk_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        statuses = [result["status"] for result in results]
+        return {
+            "created": statuses.count("created"),
+            "updated": statuses.count("updated"),
+            "failed": statuses.count("error"),
+            "results": results,
+        }
+
     @staticmethod
     def get_course_dependencies(db: Session, course_id: str):
         """Get course dependency graph for visualization"""
+        snapshot = current_snapshot()
+        if snapshot:
+            return snapshot.dependencies(course_id)
+
         course = CourseService.get_course(db, course_id)
         if not course:
             return None
@@ -164,9 +726,62 @@ class CourseService:
             "total_prerequisite_count": total_prerequisite_count
         }
 
+    @staticmethod
+    def get_course_delta(db: Session, since: int) -> Dict[str, Any]:
+        """
+        Courses changed after revision `since`: rendered active courses,
+        IDs of soft-deleted ones, and the full prerequisite list of every
+        course whose prerequisites may have changed. With `reset` the
+        client should replace its copy (first sync, or the catalog was
+        re-seeded).
+        """
+        # Read first: rows changed after this point are sent again next time
+        revision = ChangeLogService.latest_revision(db)
+        edge_changes = ChangeLogService.changed_courses(db, since, ("create", "update", "seed"))
+        reset = since == 0 or None in edge_changes
+
+        query = select(Course.id, Course.is_active).order_by(Course.id)
+        if not reset:
+            query = query.where(Course.revision > since)
+        rows = db.execute(query).all()
+        active_ids = [row.id for row in rows if row.is_active]
+        if reset:
+            edge_changes = set(active_ids)
+
+        prerequisites: Dict[str, List[Dict[str, str]]] = {
+            course_id: [] for course_id in sorted(edge_changes)
+        }
+        if prerequisites:
+            edges = db.execute(
+                select(prerequisite_table)
+                .where(prerequisite_table.c.course_id.in_(list(prerequisites)))
+                .order_by(prerequisite_table.c.course_id, prerequisite_table.c.prerequisite_id)
+            )
+            for edge in edges:
+                prerequisites[edge.course_id].append(
+                    {"id": edge.prerequisite_id, "type": edge.type or "mandatory"}
+                )
+
+        return {
+            "revision": revision,
+            "reset": reset,
+            "courses": ReadModelService.get_payloads(db, active_ids),
+            "deleted": [] if reset else [row.id for row in rows if not row.is_active],
+            "prerequisites": prerequisites,
+        }
+
     @staticmethod
     def get_all_prerequisite_counts(db: Session) -> Dict[str, int]:
         """Get transitive prerequisite counts for all courses"""
+        return _prerequisite_counts.get(db)
+
+    @staticmethod
+    def compute_prerequisite_counts(db: Session) -> Dict[str, int]:
+        """Count transitive prerequisites of every active course"""
+        snapshot = current_snapshot()
+        if snapshot:
+            return snapshot.prerequisite_counts()
+
         courses = db.query(Course).options(joinedload(Course.prerequisites)).filter(Course.is_active).all()
 
         # Build adjacency list: course_id -> list of direct prerequisite ids
@@ -207,4 +822,9 @@ class CourseService:
         for course in courses:
             counts[course.id] = count_transitive(course.id, set())
 
-        return counts
\ No newline at end of file
+        return counts
+
+
+_prerequisite_counts: SwrCache[Dict[str, int]] = SwrCache(
+    "prerequisite counts", CourseService.compute_prerequisite_counts
+)
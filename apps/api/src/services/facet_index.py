@@ -0,0 +1,112 @@
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from ..models import SEMESTER_BITS
+from .course_record import CourseRecord, get_course_records, search_text
+from .swr_cache import SwrCache
+
+FACETS = ("department", "level", "language", "semester")
+
+
+class FacetIndex:
+    """
+    Bitmaps of the active courses for every facet value.
+
+    Course number i in `ids` is bit i of each bitmap, so a filter combination
+    is the AND of a few Python ints and a facet count is a popcount.
+    """
+
+    def __init__(self, records: Sequence[CourseRecord]):
+        records = sorted(records, key=lambda record: record.id)
+        self.ids: List[str] = [record.id for record in records]
+        self.all = (1 << len(records)) - 1
+        self.bitmaps: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+        self._text: List[str] = []
+
+        for position, record in enumerate(records):
+            bit = 1 << position
+            values = {
+                "department": [record.department],
+                "level": [record.level.value],
+                "language": [record.language],
+                "semester": [
+                    semester.value for semester, semester_bit in SEMESTER_BITS.items()
+                    if record.semester_mask & semester_bit
+                ],
+            }
+            for facet, facet_values in values.items():
+                bitmaps = self.bitmaps[facet]
+                for value in facet_values:
+                    bitmaps[value] = bitmaps.get(value, 0) | bit
+            self._text.append(search_text(record))
+
+    @classmethod
+    def load(cls, db: Session) -> "FacetIndex":
+        return cls([record for record in get_course_records(db, fresh=True) if record.is_active])
+
+    def _filter_bitmap(self, facet: str, value: str) -> int:
+        if facet in ("level", "semester"):
+            value = value.lower()
+        return self.bitmaps[facet].get(value, 0)
+
+    def _search_bitmap(self, search: Optional[str]) -> int:
+        if not search:
+            return self.all
+        term = search.lower()
+        bitmap = 0
+        for position, text in enumerate(self._text):
+            if term in text:
+                bitmap |= 1 << position
+        return bitmap
+
+    def search(self, filters: Dict[str, Optional[str]], search: Optional[str] = None):
+        """
+        Return (matching course IDs, facet counts).
+
+        Counts for a facet apply every filter except that facet's own, so
+        they tell how many results picking each value would give.
+        """
+        base = self._search_bitmap(search)
+        selected = {
+            facet: self._filter_bitmap(facet, value)
+            for facet, value in filters.items() if value
+        }
+
+        match = base
+        for bitmap in selected.values():
+            match &= bitmap
+
+        facets: Dict[str, Dict[str, int]] = {}
+        for facet in FACETS:
+            others = base
+            for other, bitmap in selected.items():
+                if other != facet:
+                    others &= bitmap
+            facets[facet] = {
+                value: (others & bitmap).bit_count()
+                for value, bitmap in sorted(self.bitmaps[facet].items())
+            }
+
+        ids = [self.ids[position] for position in _bits(match)]
+        return ids, facets
+
+
+def _bits(bitmap: int):
+    while bitmap:
+        lowest = bitmap & -bitmap
+        yield lowest.bit_length() - 1
+        bitmap ^= lowest
+
+
+_index: SwrCache[FacetIndex] = SwrCache("facet index", FacetIndex.load)
+
+
+def get_facet_index(db: Session) -> FacetIndex:
+    """Return the process-wide facet index, building it on first use"""
+    return _index.get(db)
+
+
+def reset_facet_index() -> None:
+    """Mark the facet index stale after a write"""
+    _index.invalidate()
@@ -0,0 +1,172 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from ..catalog_snapshot import ID_WIDTH, LEVELS
+from ..models import CourseLevel, masks_with_semester
+from ..shared_catalog import current_snapshot
+from .course_record import SEARCH_FIELDS, CourseRecord, get_course_records, search_text
+from .swr_cache import SwrCache
+
+# Listing orders; ties are broken by course ID
+SORT_KEYS = ("id", "credits", "-credits")
+
+
+def text_column(texts: List[str]) -> np.ndarray:
+    """
+    Search texts as an object array of the strings themselves: a fixed-width
+    str array would pad every row to the longest text, at 4 bytes a character
+    """
+    column = np.empty(len(texts), dtype=object)
+    column[:] = texts
+    return column
+
+class FilterEngine:
+    """
+    The catalog as NumPy columns, sorted by course ID.
+
+    Department, level and language are stored as integer codes, so a filter
+    combination is a few vectorised comparisons ANDed into one boolean mask.
+    Sort orders are precomputed position arrays; a page is the masked order
+    sliced with skip/limit.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        departments: List[str],
+        department: np.ndarray,
+        level: np.ndarray,
+        languages: List[str],
+        language: np.ndarray,
+        semester_mask: np.ndarray,
+        credits: np.ndarray,
+        active: np.ndarray,
+        text: np.ndarray,
+    ):
+        self.ids = ids
+        self.departments = {name: code for code, name in enumerate(departments)}
+        self.department = department
+        self.level = level
+        self.languages = {name: code for code, name in enumerate(languages)}
+        self.language = language
+        self.semester_mask = semester_mask
+        self.credits = credits
+        self.active = active
+        self.text = text
+
+        positions = np.arange(len(ids))
+        self.orders = {
+            "id": positions,
+            "credits": np.argsort(credits, kind="stable"),
+            "-credits": np.lexsort((positions, -credits.astype(np.int64))),
+        }
+
+    @classmethod
+    def from_records(cls, records: Sequence[CourseRecord]) -> "FilterEngine":
+        records = sorted(records, key=lambda record: record.id)
+        departments = sorted({record.department for record in records})
+        languages = sorted({record.language for record in records})
+        department_codes = {name: code for code, name in enumerate(departments)}
+        language_codes = {name: code for code, name in enumerate(languages)}
+        return cls(
+            ids=np.array([record.id for record in records], dtype=object),
+            departments=departments,
+            department=np.array([department_codes[r.department] for r in records], dtype=np.uint16),
+            level=np.array([LEVELS.index(record.level) for record in records], dtype=np.uint8),
+            languages=languages,
+            language=np.array([language_codes[r.language] for r in records], dtype=np.uint16),
+            semester_mask=np.array([record.semester_mask for record in records], dtype=np.uint8),
+            credits=np.array([record.credits for record in records], dtype=np.int32),
+            active=np.array([record.is_active for record in records], dtype=bool),
+            text=text_column([search_text(record) for record in records]),
+        )
+
+    @classmethod
+    def load(cls, db: Session) -> "FilterEngine":
+        snapshot = current_snapshot()
+        if snapshot:
+            return cls.from_snapshot(snapshot)
+        return cls.from_records(get_course_records(db, fresh=True))
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> "FilterEngine":
+        """Wrap the snapshot's columns without copying them"""
+        raw_ids = np.frombuffer(snapshot.ids, dtype=f"S{ID_WIDTH}")
+        text = [
+            search_text({
+                "id": snapshot.course_id(course),
+                **{field: snapshot.field(course, field) for field in SEARCH_FIELDS if field != "id"},
+            })
+            for course in range(snapshot.course_count)
+        ]
+        return cls(
+            ids=np.char.decode(raw_ids, "ascii").astype(object),
+            departments=snapshot.departments,
+            department=np.frombuffer(snapshot.department, dtype=np.uint16),
+            level=np.frombuffer(snapshot.level, dtype=np.uint8),
+            languages=snapshot.languages,
+            language=np.frombuffer(snapshot.language, dtype=np.uint16),
+            semester_mask=np.frombuffer(snapshot.semester_mask, dtype=np.uint8),
+            credits=np.frombuffer(snapshot.credits, dtype=np.uint16).astype(np.int32),
+            active=np.frombuffer(snapshot.active, dtype=np.uint8).astype(bool),
+            text=text_column(text),
+        )
+
+    def mask(
+        self,
+        department: Optional[str] = None,
+        level: Optional[str] = None,
+        language: Optional[str] = None,
+        semester: Optional[str] = None,
+        search: Optional[str] = None,
+        min_credits: Optional[int] = None,
+        max_credits: Optional[int] = None,
+    ) -> np.ndarray:
+        """Boolean mask of the active courses matching every given filter"""
+        mask = self.active.copy()
+        if department:
+            mask &= self.department == self.departments.get(department, -1)
+        if level:
+            try:
+                mask &= self.level == LEVELS.index(CourseLevel(level.lower()))
+            except ValueError:
+                mask[:] = False
+        if language:
+            mask &= self.language == self.languages.get(language, -1)
+        if semester:
+            mask &= np.isin(self.semester_mask, masks_with_semester(semester))
+        if min_credits is not None:
+            mask &= self.credits >= min_credits
+        if max_credits is not None:
+            mask &= self.credits <= max_credits
+        if search:
+            # Only the rows that passed the cheap filters are scanned
+            candidates = np.flatnonzero(mask)
+            needle = search.lower()
+            found = np.fromiter(
+                (needle in text for text in self.text[candidates]), dtype=bool, count=len(candidates)
+            )
+            mask[candidates[~found]] = False
+        return mask
+
+    def query(self, skip: int = 0, limit: int = 100, sort: str = "id", **filters) -> List[str]:
+        """IDs of one page of matching courses in the given order"""
+        mask = self.mask(**filters)
+        order = self.orders[sort]
+        page = order[mask[order]][skip:skip + limit]
+        return self.ids[page].tolist()
+
+
+_engine: SwrCache[FilterEngine] = SwrCache("filter engine", FilterEngine.load)
+
+
+def get_filter_engine(db: Session) -> FilterEngine:
+    """Return the process-wide filter engine, building it on first use"""
+    return _engine.get(db)
+
+
+def reset_filter_engine() -> None:
+    """Mark the filter engine stale after a write"""
+    _engine.invalidate()
@@ -0,0 +1,161 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select, text
+
+from ..database import get_engine
+from ..models import CatalogChange
+from ..shared_catalog import shared_catalog
+from ..startup import startup_state
+
+logger = logging.getLogger(__name__)
+
+# How often the background thread re-checks the dependencies
+REFRESH_INTERVAL = 5.0
+# A status older than this means the checker itself is stuck
+STALE_AFTER = 3 * REFRESH_INTERVAL
+# Share of pool connections in use above which the app reports not ready
+POOL_SATURATION_LIMIT = 0.9
+# How long a probe waits for the very first check after startup
+FIRST_CHECK_TIMEOUT = 2.0
+
+
+def _pool_status(engine) -> Dict[str, Any]:
+    pool = engine.pool
+    checked_out = pool.checkedout() if hasattr(pool, "checkedout") else 0
+    size = pool.size() if hasattr(pool, "size") else 0
+    capacity = size + max(getattr(pool, "_max_overflow", 0), 0)
+    return {
+        "checked_out": checked_out,
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+    }
+
+
+def _change_log_status(conn) -> Dict[str, Any]:
+    """Revision and age of the catalog from its newest change log row"""
+    latest = conn.execute(
+        select(CatalogChange.revision, CatalogChange.changed_at)
+        .order_by(CatalogChange.revision.desc())
+        .limit(1)
+    ).first()
+    if latest is None:
+        return {"revision": None, "age_seconds": None}
+    changed_at = latest.changed_at
+    if changed_at.tzinfo is None:
+        # SQLite keeps the UTC timestamp without a zone
+        changed_at = changed_at.replace(tzinfo=timezone.utc)
+    age = (datetime.now(timezone.utc) - changed_at).total_seconds()
+    return {"revision": latest.revision, "age_seconds": round(max(age, 0.0), 1)}
+
+
+def _snapshot_status() -> Dict[str, Any]:
+    snapshot = shared_catalog.current()
+    try:
+        published_at = os.stat(shared_catalog.path).st_mtime
+    except FileNotFoundError:
+        return {"revision": None, "age_seconds": None}
+    return {
+        "revision": snapshot.revision if snapshot else None,
+        "age_seconds": round(time.time() - published_at, 1),
+    }
+
+
+class HealthMonitor:
+    """
+    Checks the database, connection pool and catalog revision on a
+    background thread, so health probes only read the last result.
+    """
+
+    def __init__(self, interval: float = REFRESH_INTERVAL):
+        self.interval = interval
+        self._status: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._first_check = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="health-monitor", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        stop = self._stop
+        while not stop.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Health check failed")
+            stop.wait(self.interval)
+
+    def refresh(self) -> Dict[str, Any]:
+        """Run every check now and store the result"""
+        engine = get_engine()
+        # Read before our own check borrows a connection
+        pool = _pool_status(engine)
+
+        started = time.monotonic()
+        catalog = _snapshot_status() if shared_catalog else {"revision": None, "age_seconds": None}
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                database = {"reachable": True, "latency_ms": round((time.monotonic() - started) * 1000, 1)}
+                if not shared_catalog:
+                    # Without a snapshot the change log says how current the catalog is
+                    try:
+                        catalog = _change_log_status(conn)
+                    except Exception:
+                        logger.exception("Reading the catalog revision failed")
+        except Exception as e:
+            database = {"reachable": False, "error": str(e).splitlines()[0]}
+
+        status = {
+            "database": database,
+            "pool": pool,
+            "catalog": catalog,
+        }
+        self._status = status
+        self._checked_at = time.monotonic()
+        self._first_check.set()
+        return status
+
+    def status(self) -> Dict[str, Any]:
+        """The last stored result, with the overall verdict and its age"""
+        self.start()
+        self._first_check.wait(FIRST_CHECK_TIMEOUT)
+        if self._status is None:
+            return {"ready": False, "reasons": ["no health check has completed"], "checked_seconds_ago": None}
+
+        age = time.monotonic() - self._checked_at
+        reasons = []
+        if not self._status["database"]["reachable"]:
+            reasons.append("database unreachable")
+        if self._status["pool"]["saturation"] >= POOL_SATURATION_LIMIT:
+            reasons.append("connection pool saturated")
+        if startup_state.warmup in ("running", "failed"):
+            reasons.append(f"cache warmup {startup_state.warmup}")
+        if age > STALE_AFTER:
+            reasons.append("health status is stale")
+        return {
+            "ready": not reasons,
+            "reasons": reasons,
+            "checked_seconds_ago": round(age, 1),
+            **self._status,
+            # Read live: the warmup finishing should not wait for the next check
+            "caches": {"warmup": startup_state.warmup, "error": startup_state.warmup_error},
+        }
+
+
+health_monitor = HealthMonitor()
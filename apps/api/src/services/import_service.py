@@ -0,0 +1,280 @@
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ..catalog_data import SEED_FILE, PathLike, file_hash, read_courses
+from ..models import Course, ImportCheckpoint, prerequisite_table
+from ..schemas import BULK_MAX_ITEMS
+from ..shared_catalog import deferred_publish
+from .change_log_service import ChangeLogService
+from .course_service import CourseService
+
+logger = logging.getLogger(__name__)
+
+# Rows committed per transaction
+IMPORT_CHUNK_SIZE = 200
+# Item errors kept in an import's result
+IMPORT_MAX_ERRORS = 100
+
+
+@dataclass
+class ChunkReport:
+    """One committed chunk: rows [start, start + rows) of `total` in import order"""
+    start: int
+    rows: int
+    total: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+    def __str__(self) -> str:
+        return (
+            f"rows {self.start + 1}-{self.start + self.rows} of {self.total}: "
+            f"{self.seconds:.2f}s ({self.rows_per_second:.0f} rows/s)"
+        )
+
+
+# Called after each committed chunk
+Progress = Callable[[ChunkReport], None]
+
+
+def _course_id(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        value = value.get("id")
+    return value.upper() if isinstance(value, str) else None
+
+
+class ImportService:
+    """
+    Imports course lists in chunks through the bulk upsert path, so each
+    chunk is validated, written and committed on its own and readers see
+    the catalog fill in while the import runs.
+
+    A named import records a checkpoint after every chunk. Running it again
+    with the same list continues after the last committed chunk; a chunk
+    that was committed but not yet checkpointed is simply written again,
+    since upserts are idempotent. Data file imports keep their finished
+    checkpoint, so an unchanged file is skipped without being read.
+    """
+
+    @staticmethod
+    def dependency_order(items: List[Dict[str, Any]]) -> List[int]:
+        """
+        Item indexes with each course after the prerequisites it shares the
+        list with, so no chunk refers to a course a later chunk creates
+        """
+        index_of: Dict[str, int] = {}
+        for index, item in enumerate(items):
+            course_id = _course_id(item)
+            if course_id:
+                index_of.setdefault(course_id, index)
+
+        def prerequisites(index: int) -> List[int]:
+            refs = items[index].get("prerequisite_ids")
+            if not isinstance(refs, list):
+                return []
+            found = (index_of.get(_course_id(ref)) for ref in refs)
+            return [i for i in found if i is not None and i != index]
+
+        order: List[int] = []
+        seen = set()
+        for root in range(len(items)):
+            if root in seen:
+                continue
+            seen.add(root)
+            stack = [(root, iter(prerequisites(root)))]
+            while stack:
+                index, pending = stack[-1]
+                child = next(pending, None)
+                if child is None:
+                    stack.pop()
+                    order.append(index)
+                elif child not in seen:
+                    # A cycle just stops here; bulk upsert reports it
+                    seen.add(child)
+                    stack.append((child, iter(prerequisites(child))))
+        return order
+
+    @staticmethod
+    def fingerprint(items: List[Dict[str, Any]], chunk_size: int = IMPORT_CHUNK_SIZE) -> str:
+        """Identifies a course list and chunking, so a checkpoint is only reused for the same import"""
+        data = json.dumps([min(chunk_size, BULK_MAX_ITEMS), items], sort_keys=True, default=str)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    @staticmethod
+    def _merge_items(db: Session, items: List[Dict[str, Any]]) -> Tuple[List[Optional[Dict[str, Any]]], List[int]]:
+        """
+        What merging `items` writes: new courses as given, and for existing
+        courses only the prerequisites they lack (None when there are none),
+        with the number of edges each item adds
+        """
+        ids = {course_id for course_id in map(_course_id, items) if course_id}
+        existing = set(db.scalars(select(Course.id).where(Course.id.in_(ids)))) if ids else set()
+        stored: Dict[str, Dict[str, str]] = {}
+        if existing:
+            for edge in db.execute(
+                select(prerequisite_table).where(prerequisite_table.c.course_id.in_(existing))
+            ):
+                stored.setdefault(edge.course_id, {})[edge.prerequisite_id] = edge.type or "mandatory"
+
+        writes: List[Optional[Dict[str, Any]]] = []
+        new_edges: List[int] = []
+        for item in items:
+            refs = item.get("prerequisite_ids")
+            refs = refs if isinstance(refs, list) else []
+            course_id = _course_id(item)
+            if course_id not in existing:
+                writes.append(item)
+                new_edges.append(len(refs))
+                continue
+            current = stored.get(course_id, {})
+            missing = [ref for ref in refs if _course_id(ref) not in current]
+            if missing:
+                # Updates replace the prerequisite list, so keep the current edges
+                writes.append({
+                    "id": course_id,
+                    "prerequisite_ids": [{"id": p, "type": t} for p, t in current.items()] + missing,
+                })
+            else:
+                writes.append(None)
+            new_edges.append(len(missing))
+        return writes, new_edges
+
+    @staticmethod
+    def import_courses(
+        db: Session,
+        items: List[Dict[str, Any]],
+        progress: Optional[Progress] = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        checkpoint: Optional[str] = None,
+        merge: bool = False,
+        fingerprint: Optional[str] = None,
+        keep_checkpoint: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Create or update `items`, committing every `chunk_size` rows. With
+        `merge`, existing courses are left as they are apart from gaining
+        missing prerequisites. With a `checkpoint` name the import resumes
+        where an interrupted run of the same list (or `fingerprint`) stopped.
+        """
+        chunk_size = min(chunk_size, BULK_MAX_ITEMS)
+        order = ImportService.dependency_order(items)
+        summary: Dict[str, Any] = {
+            "created": 0, "updated": 0, "skipped": 0, "failed": 0,
+            "prerequisites_added": 0, "resumed_from": 0, "total": len(order), "errors": [],
+        }
+
+        saved = None
+        if checkpoint:
+            fingerprint = fingerprint or ImportService.fingerprint(items, chunk_size)
+            saved = db.get(ImportCheckpoint, checkpoint)
+            if saved is not None and saved.fingerprint == fingerprint:
+                summary["resumed_from"] = saved.position
+                logger.info("Import %s resuming after row %d of %d", checkpoint, saved.position, len(order))
+            else:
+                saved = db.merge(ImportCheckpoint(
+                    name=checkpoint, fingerprint=fingerprint, position=0, total=len(order),
+                ))
+                db.commit()
+
+        # One snapshot publish for the whole import rather than one per chunk
+        with deferred_publish():
+            for start in range(summary["resumed_from"], len(order), chunk_size):
+                started = time.perf_counter()
+                indexes = order[start:start + chunk_size]
+                chunk = [items[i] for i in indexes]
+                new_edges = [0] * len(chunk)
+                if merge:
+                    writes, new_edges = ImportService._merge_items(db, chunk)
+                    summary["skipped"] += sum(write is None for write in writes)
+                    indexes = [i for i, write in zip(indexes, writes) if write is not None]
+                    new_edges = [n for n, write in zip(new_edges, writes) if write is not None]
+                    chunk = [write for write in writes if write is not None]
+
+                result = CourseService.bulk_upsert_courses(db, chunk) if chunk else {"results": []}
+                for item, edges in zip(result["results"], new_edges):
+                    if item["status"] == "error":
+                        summary["failed"] += 1
+                        if len(summary["errors"]) < IMPORT_MAX_ERRORS:
+                            # Report the position in the caller's list, not in the chunk
+                            summary["errors"].append({**item, "index": indexes[item["index"]]})
+                    elif item["status"] in ("created", "updated"):
+                        summary[item["status"]] += 1
+                        summary["prerequisites_added"] += edges
+
+                rows = min(chunk_size, len(order) - start)
+                if saved is not None:
+                    saved.position = start + rows
+                    db.commit()
+                report = ChunkReport(start, rows, len(order), time.perf_counter() - started)
+                logger.info("Import %s: %s", checkpoint or "", report)
+                if progress:
+                    progress(report)
+
+        if saved is not None and not keep_checkpoint:
+            # Finished: the next run of this list starts from the top again
+            db.delete(saved)
+            db.commit()
+        return summary
+
+    @staticmethod
+    def import_file(
+        db: Session,
+        path: PathLike,
+        progress: Optional[Progress] = None,
+        merge: bool = True,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Import a course data file, resuming an interrupted import of the same
+        content. A file whose content was already imported in full is
+        skipped (`unchanged`) unless `force` is set.
+        """
+        name = f"file:{Path(path).name}"
+        content_hash = file_hash(path)
+        saved = db.get(ImportCheckpoint, name)
+        if force and saved is not None:
+            db.delete(saved)
+            db.commit()
+        elif saved is not None and saved.fingerprint == content_hash and saved.position >= saved.total:
+            return {
+                "created": 0, "updated": 0, "skipped": saved.total, "failed": 0,
+                "prerequisites_added": 0, "resumed_from": 0, "total": saved.total,
+                "errors": [], "unchanged": True,
+            }
+        summary = ImportService.import_courses(
+            db, list(read_courses(path)), progress, checkpoint=name, merge=merge,
+            fingerprint=content_hash, keep_checkpoint=True,
+        )
+        return {**summary, "unchanged": False}
+
+    @staticmethod
+    def seed(db: Session, progress: Optional[Progress] = None, force: bool = False) -> Dict[str, Any]:
+        """
+        Add the bundled course data (idempotent; skipped while the data file
+        is unchanged). A seed that ran is logged as a catalog-wide "seed"
+        change, which tells delta clients to replace their copy.
+        """
+        summary = ImportService.import_file(db, SEED_FILE, progress, force=force)
+        if not summary["unchanged"]:
+            ChangeLogService.record(db, "seed", [None])
+            db.commit()
+        return {
+            "created": summary["created"],
+            "skipped": summary["total"] - summary["created"],
+            "prerequisites_added": summary["prerequisites_added"],
+            "failed": summary["failed"],
+            "errors": summary["errors"],
+            "resumed_from": summary["resumed_from"],
+            "unchanged": summary["unchanged"],
+            "total_courses": db.scalar(select(func.count()).select_from(Course)),
+        }
@@ -0,0 +1,124 @@
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from ..models import Job
+from .import_service import ChunkReport
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS_ENV = "JOB_WORKERS"
+
+# Runs a job: gets its own session and a progress reporter, returns the result
+Work = Callable[[Session, "JobProgress"], Dict[str, Any]]
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _update_job(job_id: str, **values: Any) -> None:
+    # Own short transaction, so progress is visible while the job's
+    # session is between chunk commits
+    db = SessionLocal()
+    try:
+        db.execute(update(Job).where(Job.id == job_id).values(**values))
+        db.commit()
+    finally:
+        db.close()
+
+
+class JobProgress:
+    """Reports a running job's progress to its row"""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+
+    def __call__(self, chunk: ChunkReport) -> None:
+        """Record the rows committed so far (including those of a resumed run)"""
+        _update_job(self.job_id, processed=chunk.start + chunk.rows)
+
+
+class JobRunner:
+    """
+    Runs seeds and imports on a small background pool (JOB_WORKERS threads,
+    1 by default) so they hold neither a request thread nor the request's
+    connection. Jobs queue when every worker is busy.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                workers = self.workers or int(os.getenv(JOB_WORKERS_ENV) or 1)
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+            return self._executor
+
+    def submit(self, db: Session, kind: str, work: Work, total: Optional[int] = None) -> Dict[str, Any]:
+        """Record a queued job and start it; returns the job as JobRead fields"""
+        job = Job(id=uuid.uuid4().hex, kind=kind, status="queued", total=total, processed=0)
+        db.add(job)
+        db.commit()
+        job_id = job.id
+        self._pool().submit(self._run, job_id, work)
+        return JobRunner.get(db, job_id)
+
+    def _run(self, job_id: str, work: Work) -> None:
+        _update_job(job_id, status="running", started_at=_now())
+        db = SessionLocal()
+        try:
+            result = work(db, JobProgress(job_id))
+        except Exception as e:
+            logger.exception("Job %s failed", job_id)
+            db.rollback()
+            _update_job(job_id, status="failed", error=str(e), finished_at=_now())
+        else:
+            _update_job(job_id, status="succeeded", result=result, finished_at=_now())
+        finally:
+            db.close()
+
+    @staticmethod
+    def get(db: Session, job_id: str) -> Optional[Dict[str, Any]]:
+        """The job with its throughput, or None"""
+        job = db.get(Job, job_id, populate_existing=True)
+        if job is None:
+            return None
+        rows_per_second = None
+        if job.started_at is not None:
+            started = job.started_at
+            finished = job.finished_at or _now()
+            if started.tzinfo is None:
+                # SQLite drops the zone; the timestamps were written in UTC
+                started = started.replace(tzinfo=timezone.utc)
+                finished = finished if finished.tzinfo else finished.replace(tzinfo=timezone.utc)
+            elapsed = (finished - started).total_seconds()
+            if elapsed > 0:
+                rows_per_second = round(job.processed / elapsed, 1)
+        return {
+            "id": job.id,
+            "kind": job.kind,
+            "status": job.status,
+            "total": job.total,
+            "processed": job.processed,
+            "rows_per_second": rows_per_second,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at,
+            "error": job.error,
+            "result": job.result,
+        }
+
+
+job_runner = JobRunner()
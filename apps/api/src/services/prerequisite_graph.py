@@ -0,0 +1,291 @@
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ..models import prerequisite_table
+
+logger = logging.getLogger(__name__)
+
+
+class PrerequisiteCycleError(Exception):
+    """Raised when a prerequisite edge would close a cycle.
+
+    `path` lists course IDs where each course is a prerequisite of the next,
+    starting and ending with the same course.
+    """
+
+    def __init__(self, path: List[str]):
+        self.path = path
+        super().__init__("Prerequisite cycle: " + " -> ".join(path))
+
+
+EdgeKey = Tuple[str, str]
+
+
+@dataclass
+class EdgeDiff:
+    """
+    Changes between stored and wanted prerequisite edges, keyed by
+    (course_id, prerequisite_id). Added and retyped edges map to their type.
+    """
+
+    added: Dict[EdgeKey, str] = field(default_factory=dict)
+    removed: Set[EdgeKey] = field(default_factory=set)
+    retyped: Dict[EdgeKey, str] = field(default_factory=dict)
+
+    @classmethod
+    def between(cls, stored: Dict[EdgeKey, Optional[str]], wanted: Dict[str, Dict[str, str]]) -> "EdgeDiff":
+        """Diff the stored edges against the complete wanted prerequisites of the courses in `wanted`"""
+        diff = cls()
+        for course_id, prerequisites in wanted.items():
+            for prerequisite_id, edge_type in prerequisites.items():
+                key = (course_id, prerequisite_id)
+                if key not in stored:
+                    diff.added[key] = edge_type
+                elif (stored[key] or "mandatory") != edge_type:
+                    diff.retyped[key] = edge_type
+        diff.removed = {
+            key for key in stored
+            if key[0] in wanted and key[1] not in wanted[key[0]]
+        }
+        return diff
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.retyped)
+
+    def moved(self, course_id: str) -> Set[str]:
+        """Prerequisites gained or lost by `course_id` (their dependent counts changed)"""
+        return {
+            prerequisite_id for owner, prerequisite_id in [*self.added, *self.removed]
+            if owner == course_id
+        }
+
+
+class PrerequisiteGraph:
+    """
+    In-memory prerequisite graph with a dynamic topological order.
+
+    Edges point from a prerequisite to the course that requires it. Every
+    course has a position in `_ord` such that prerequisites always come
+    first. Adding an edge uses the Pearce-Kelly algorithm: only courses whose
+    position lies between the two endpoints are visited, and those are
+    re-ordered in place when needed.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._ord: Dict[str, int] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._prerequisites: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str]]) -> "PrerequisiteGraph":
+        """Build a graph from (prerequisite_id, course_id) pairs"""
+        graph = cls()
+        for prerequisite_id, course_id in edges:
+            try:
+                graph.add_edge(prerequisite_id, course_id)
+            except PrerequisiteCycleError as e:
+                # Legacy data may already contain a cycle; keep the graph a DAG
+                logger.warning("Ignoring stored prerequisite edge: %s", e)
+        return graph
+
+    def _add_node(self, course_id: str) -> None:
+        if course_id not in self._ord:
+            self._ord[course_id] = len(self._ord)
+            self._dependents[course_id] = set()
+            self._prerequisites[course_id] = set()
+
+    def prerequisites_of(self, course_id: str) -> Set[str]:
+        return set(self._prerequisites.get(course_id, ()))
+
+    def dependents_of(self, course_id: str) -> Set[str]:
+        return set(self._dependents.get(course_id, ()))
+
+    def ancestors(self, course_id: str) -> Set[str]:
+        """All direct and transitive prerequisites of a course"""
+        return self._reachable(course_id, self._prerequisites)
+
+    def descendants(self, course_id: str) -> Set[str]:
+        """All courses that have this course as a direct or transitive prerequisite"""
+        return self._reachable(course_id, self._dependents)
+
+    @staticmethod
+    def _reachable(start: str, neighbours: Dict[str, Set[str]]) -> Set[str]:
+        seen: Set[str] = set()
+        stack = list(neighbours.get(start, ()))
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.add(node)
+                stack.extend(neighbours[node])
+        return seen
+
+    def has_edge(self, prerequisite_id: str, course_id: str) -> bool:
+        return course_id in self._dependents.get(prerequisite_id, ())
+
+    def add_edge(self, prerequisite_id: str, course_id: str) -> None:
+        """Add an edge, raising PrerequisiteCycleError if it closes a cycle"""
+        if prerequisite_id == course_id:
+            raise PrerequisiteCycleError([course_id, course_id])
+
+        self._add_node(prerequisite_id)
+        self._add_node(course_id)
+        if self.has_edge(prerequisite_id, course_id):
+            return
+
+        lower = self._ord[course_id]
+        upper = self._ord[prerequisite_id]
+        if lower < upper:
+            forward = self._forward_region(course_id, prerequisite_id, upper)
+            backward = self._backward_region(prerequisite_id, lower)
+            self._reorder(backward, forward)
+
+        self._dependents[prerequisite_id].add(course_id)
+        self._prerequisites[course_id].add(prerequisite_id)
+
+    def remove_edge(self, prerequisite_id: str, course_id: str) -> None:
+        # Removing an edge never invalidates the current order
+        self._dependents.get(prerequisite_id, set()).discard(course_id)
+        self._prerequisites.get(course_id, set()).discard(prerequisite_id)
+
+    def set_prerequisites(self, course_id: str, prerequisite_ids: Iterable[str]) -> None:
+        """
+        Replace the prerequisites of a course.
+
+        Either all new edges are applied or, if one of them closes a cycle,
+        the graph is restored and PrerequisiteCycleError is raised.
+        """
+        self._add_node(course_id)
+        wanted = set(prerequisite_ids)
+        current = self._prerequisites[course_id]
+        removed = current - wanted
+        added = []
+
+        for prerequisite_id in removed:
+            self.remove_edge(prerequisite_id, course_id)
+        try:
+            for prerequisite_id in sorted(wanted - current):
+                self.add_edge(prerequisite_id, course_id)
+                added.append(prerequisite_id)
+        except PrerequisiteCycleError:
+            for prerequisite_id in added:
+                self.remove_edge(prerequisite_id, course_id)
+            for prerequisite_id in removed:
+                self.add_edge(prerequisite_id, course_id)
+            raise
+
+    def _forward_region(self, start: str, target: str, upper: int) -> List[str]:
+        """Collect dependents of `start` ordered before `upper`.
+
+        Reaching `target` means the new edge target -> start closes a cycle.
+        """
+        parent: Dict[str, Optional[str]] = {start: None}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for dependent in self._dependents[node]:
+                if dependent == target:
+                    chain = [node]
+                    while parent[chain[-1]] is not None:
+                        chain.append(parent[chain[-1]])
+                    raise PrerequisiteCycleError(chain[::-1] + [target, start])
+                if dependent not in parent and self._ord[dependent] < upper:
+                    parent[dependent] = node
+                    stack.append(dependent)
+        return list(parent)
+
+    def _backward_region(self, start: str, lower: int) -> List[str]:
+        """Collect prerequisites of `start` ordered after `lower`"""
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for prerequisite_id in self._prerequisites[node]:
+                if prerequisite_id not in seen and self._ord[prerequisite_id] > lower:
+                    seen.add(prerequisite_id)
+                    stack.append(prerequisite_id)
+        return list(seen)
+
+    def _reorder(self, backward: List[str], forward: List[str]) -> None:
+        """Move the backward region in front of the forward region"""
+        backward.sort(key=self._ord.__getitem__)
+        forward.sort(key=self._ord.__getitem__)
+        nodes = backward + forward
+        slots = sorted(self._ord[node] for node in nodes)
+        for node, slot in zip(nodes, slots):
+            self._ord[node] = slot
+
+
+def stored_dependents(db: Session, course_ids: Iterable[str]) -> Set[str]:
+    """
+    Courses that directly require one of `course_ids`, from the stored edges
+    this transaction sees. Unlike the process-wide graph these include other
+    workers' writes.
+    """
+    table = prerequisite_table
+    return set(db.scalars(select(table.c.course_id).where(table.c.prerequisite_id.in_(list(course_ids)))))
+
+
+def stored_descendants(db: Session, course_ids: Iterable[str]) -> Set[str]:
+    """Courses that require one of `course_ids` directly or transitively (one query per level)"""
+    seen: Set[str] = set()
+    frontier = set(course_ids)
+    while frontier:
+        frontier = stored_dependents(db, frontier) - seen
+        seen |= frontier
+    return seen
+
+
+def stored_ancestors(db: Session, course_ids: Iterable[str]) -> Dict[str, Set[str]]:
+    """Course -> its direct and transitive prerequisites, from the stored edges"""
+    table = prerequisite_table
+    ids = set(course_ids)
+    prerequisites: Dict[str, Set[str]] = {}
+    frontier = set(ids)
+    while frontier:
+        for course_id in frontier:
+            prerequisites[course_id] = set()
+        for row in db.execute(
+            select(table.c.course_id, table.c.prerequisite_id).where(table.c.course_id.in_(frontier))
+        ):
+            prerequisites[row.course_id].add(row.prerequisite_id)
+        frontier = {p for found in prerequisites.values() for p in found} - prerequisites.keys()
+    return {course_id: PrerequisiteGraph._reachable(course_id, prerequisites) for course_id in ids}
+
+
+def stored_dependent_counts(db: Session, course_ids: Iterable[str]) -> Dict[str, int]:
+    """Course -> number of courses that directly require it, from the stored edges"""
+    table = prerequisite_table
+    return dict(db.execute(
+        select(table.c.prerequisite_id, func.count())
+        .where(table.c.prerequisite_id.in_(list(course_ids)))
+        .group_by(table.c.prerequisite_id)
+    ).all())
+
+
+_graph: Optional[PrerequisiteGraph] = None
+_graph_lock = threading.Lock()
+
+
+def get_prerequisite_graph(db: Session) -> PrerequisiteGraph:
+    """Return the process-wide prerequisite graph, loading it on first use"""
+    global _graph
+    with _graph_lock:
+        if _graph is None:
+            rows = db.execute(
+                select(prerequisite_table.c.prerequisite_id, prerequisite_table.c.course_id)
+            ).all()
+            _graph = PrerequisiteGraph.from_edges(rows)
+        return _graph
+
+
+def reset_prerequisite_graph() -> None:
+    """Drop the cached graph so the next write reloads it from the database"""
+    global _graph
+    with _graph_lock:
+        _graph = None
@@ -0,0 +1,184 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from ..models import Course, CourseReadModel, prerequisite_table
+from ..schemas import CourseRead
+from ..shared_catalog import current_snapshot
+from .course_record import search_text
+from .prerequisite_graph import stored_ancestors, stored_dependent_counts, stored_descendants
+
+COURSE_COLUMNS = [
+    Course.id, Course.title, Course.title_english, Course.description,
+    Course.instructor, Course.credits, Course.department, Course.level,
+    Course.semester, Course.semester_mask, Course.language, Course.is_active,
+    Course.created_at, Course.updated_at, Course.exam_form,
+    Course.teaching_form, Course.weekly_hours, Course.version,
+]
+
+_built = False
+_built_lock = threading.Lock()
+
+
+def json_array(payloads: Iterable[str]) -> str:
+    """Join pre-rendered JSON documents into a JSON array"""
+    return "[" + ",".join(payloads) + "]"
+
+
+class ReadModelService:
+    """
+    Maintains `course_read_model`: one row per active course holding the
+    course rendered as JSON, so listing and detail reads are single-table
+    lookups that return ready-made JSON.
+
+    Rows are refreshed by CourseService in the same transaction as the write
+    that changed them. Which rows, and their prerequisite counts, come from
+    the stored edges rather than the per-process graph, which can lag
+    behind another worker's writes.
+    """
+
+    @staticmethod
+    def refresh(db: Session, course_ids: Iterable[str]) -> None:
+        """Re-render the rows of the given courses (does not commit)"""
+        ids = set(course_ids)
+        if not ids:
+            return
+        db.flush()
+        ancestors = stored_ancestors(db, ids)
+        dependent_counts = stored_dependent_counts(db, ids)
+
+        courses = db.execute(select(*COURSE_COLUMNS).where(Course.id.in_(ids))).mappings().all()
+        edges = db.execute(
+            select(prerequisite_table).where(prerequisite_table.c.course_id.in_(ids))
+        ).all()
+        prerequisite_ids = {edge.prerequisite_id for edge in edges}
+        titles = {
+            row.id: row for row in db.execute(
+                select(Course.id, Course.title, Course.title_english)
+                .where(Course.id.in_(prerequisite_ids))
+            )
+        } if prerequisite_ids else {}
+
+        stubs: Dict[str, List[dict]] = {}
+        for edge in sorted(edges, key=lambda e: e.prerequisite_id):
+            prerequisite = titles.get(edge.prerequisite_id)
+            if prerequisite:
+                stubs.setdefault(edge.course_id, []).append({
+                    "id": prerequisite.id,
+                    "title": prerequisite.title,
+                    "title_english": prerequisite.title_english,
+                    "type": edge.type or "mandatory",
+                })
+
+        rows = []
+        for course in courses:
+            if not course["is_active"]:
+                continue
+            rendered = CourseRead.model_validate({
+                **course,
+                "prerequisites": stubs.get(course["id"], []),
+                "dependent_count": dependent_counts.get(course["id"], 0),
+                "transitive_prerequisite_count": len(ancestors[course["id"]]),
+            })
+            rows.append({
+                "id": rendered.id,
+                "department": rendered.department,
+                "level": rendered.level.value,
+                "language": rendered.language,
+                "semester_mask": course["semester_mask"] or 0,
+                "search_text": search_text(course),
+                "payload": rendered.model_dump_json(),
+            })
+
+        db.execute(delete(CourseReadModel).where(CourseReadModel.id.in_(ids)))
+        if rows:
+            db.execute(insert(CourseReadModel), rows)
+
+    @staticmethod
+    def affected_by(db: Session, course_ids: Iterable[str], *prerequisite_sets: Iterable[str]) -> Set[str]:
+        """
+        Rows to refresh after courses or their prerequisites changed: the
+        courses themselves, every course depending on them (their stubs and
+        transitive counts), and their old and new prerequisites (their
+        dependent counts).
+        """
+        affected = set(course_ids)
+        affected |= stored_descendants(db, affected)
+        for prerequisite_ids in prerequisite_sets:
+            affected.update(prerequisite_ids)
+        return affected
+
+    @staticmethod
+    def rebuild(db: Session) -> None:
+        """Re-render every row (does not commit)"""
+        db.execute(delete(CourseReadModel))
+        ReadModelService.refresh(db, db.scalars(select(Course.id).where(Course.is_active)).all())
+
+    @staticmethod
+    def ensure_built(db: Session) -> None:
+        """Build the read model once if it was never populated for this database"""
+        global _built
+        if _built:
+            return
+        with _built_lock:
+            if _built:
+                return
+            has_rows = db.execute(select(CourseReadModel.id).limit(1)).first()
+            has_courses = db.execute(select(Course.id).where(Course.is_active).limit(1)).first()
+            if has_courses and not has_rows:
+                ReadModelService.rebuild(db)
+                db.commit()
+            _built = True
+
+    @staticmethod
+    def list_payloads(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        department: Optional[str] = None,
+        level: Optional[str] = None,
+        language: Optional[str] = None,
+        semester: Optional[str] = None,
+        search: Optional[str] = None,
+        min_credits: Optional[int] = None,
+        max_credits: Optional[int] = None,
+        sort: str = "id",
+    ) -> List[str]:
+        """Rendered courses matching the listing filters, in `sort` order"""
+        # Imported here so numpy is only loaded once listings are served
+        from .filter_engine import get_filter_engine
+
+        ids = get_filter_engine(db).query(
+            skip, limit, sort,
+            department=department, level=level, language=language, semester=semester,
+            search=search, min_credits=min_credits, max_credits=max_credits,
+        )
+        return ReadModelService.get_payloads(db, ids)
+
+    @staticmethod
+    def get_payloads(db: Session, course_ids: List[str]) -> List[str]:
+        """Rendered courses in the order of `course_ids`, skipping unknown IDs"""
+        snapshot = current_snapshot()
+        if snapshot:
+            positions = (snapshot.index_of(i) for i in course_ids)
+            return [
+                bytes(snapshot.payload(p)).decode()
+                for p in positions if p is not None and snapshot.active[p]
+            ]
+
+        ReadModelService.ensure_built(db)
+        if not course_ids:
+            return []
+        rows = dict(db.execute(
+            select(CourseReadModel.id, CourseReadModel.payload)
+            .where(CourseReadModel.id.in_(course_ids))
+        ).all())
+        return [rows[i] for i in course_ids if i in rows]
+
+    @staticmethod
+    def get_payload(db: Session, course_id: str) -> Optional[str]:
+        """Rendered course, or None if it does not exist or is inactive"""
+        payloads = ReadModelService.get_payloads(db, [course_id])
+        return payloads[0] if payloads else None
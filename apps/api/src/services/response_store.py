@@ -0,0 +1,125 @@
+import gzip
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from .swr_cache import MAX_STALENESS_ENV, refresh_pool, seconds_setting
+
+logger = logging.getLogger(__name__)
+
+# Bodies smaller than this are not worth a compressed variant
+GZIP_MIN_SIZE = 512
+
+# Renders the JSON body of a response kind for one course, or None if the
+# course does not exist
+Renderer = Callable[[Session, str], Optional[bytes]]
+
+
+class RenderedResponse:
+    __slots__ = ("body", "gzip")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.gzip = gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_SIZE else None
+
+
+class ResponseStore:
+    """
+    Serialised JSON responses per (kind, course ID), with a gzip variant.
+
+    A response is rendered once and then served as stored bytes until a
+    write invalidates the course. Invalidated entries that were cached are
+    re-rendered on the shared cache refresh pool, so the next reader usually
+    finds them ready; until then the previous bytes are served for up to
+    `max_staleness` seconds (CACHE_MAX_STALENESS, 0 by default).
+    """
+
+    def __init__(self, max_staleness: Optional[float] = None):
+        self.max_staleness = (
+            max_staleness if max_staleness is not None else seconds_setting(MAX_STALENESS_ENV, 0)
+        )
+        self._renderers: Dict[str, Renderer] = {}
+        self._entries: Dict[Tuple[str, str], RenderedResponse] = {}
+        # Invalidated entries that may still be served, with when they went stale
+        self._stale: Dict[Tuple[str, str], Tuple[RenderedResponse, float]] = {}
+        # Bumped on invalidation so a render that started earlier is discarded
+        self._versions: Dict[Tuple[str, str], int] = {}
+        self._pending: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def register(self, kind: str, renderer: Renderer) -> None:
+        self._renderers[kind] = renderer
+
+    def get(self, db: Session, kind: str, course_id: str) -> Optional[RenderedResponse]:
+        """Return the stored response, rendering it on a miss"""
+        key = (kind, course_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            stale = self._stale.get(key)
+            if stale is not None and time.monotonic() - stale[1] <= self.max_staleness:
+                # The re-render was scheduled by the invalidation
+                return stale[0]
+            entry = self._render(db, key)
+        return entry
+
+    def _render(self, db: Session, key: Tuple[str, str]) -> Optional[RenderedResponse]:
+        with self._lock:
+            version = self._versions.get(key, 0)
+        body = self._renderers[key[0]](db, key[1])
+        if body is None:
+            return None
+        entry = RenderedResponse(body)
+        with self._lock:
+            if self._versions.get(key, 0) == version:
+                self._entries[key] = entry
+                self._stale.pop(key, None)
+        return entry
+
+    def invalidate(self, course_ids: Optional[Iterable[str]] = None) -> None:
+        """
+        Drop the responses of the given courses (all when None) and schedule
+        the ones that were cached for background re-rendering
+        """
+        with self._lock:
+            if course_ids is None:
+                keys = set(self._entries)
+            else:
+                ids = set(course_ids)
+                keys = {key for key in self._entries if key[1] in ids}
+            now = time.monotonic()
+            for key in keys:
+                entry = self._entries.pop(key)
+                self._versions[key] = self._versions.get(key, 0) + 1
+                if self.max_staleness > 0 and course_ids is not None:
+                    # Keep the earliest time: the bound counts from the first invalidation
+                    self._stale.setdefault(key, (entry, now))
+            if course_ids is None:
+                # Nothing is regenerated after a full reset; entries come back on demand
+                self._stale.clear()
+                return
+            # Stale entries also need a new rendering
+            keys |= {key for key in self._stale if key[1] in ids}
+            keys -= self._pending
+            self._pending |= keys
+        if keys:
+            refresh_pool().submit(self._regenerate, keys)
+
+    def _regenerate(self, keys: Set[Tuple[str, str]]) -> None:
+        with self._lock:
+            self._pending -= keys
+        db = SessionLocal()
+        try:
+            for key in keys:
+                if key not in self._entries:
+                    self._render(db, key)
+        except Exception:
+            logger.exception("Failed to re-render cached responses")
+        finally:
+            db.close()
+
+
+response_store = ResponseStore()
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+
+T = TypeVar("T")
+
+# (endpoint, normalised params)
+FlightKey = Tuple[str, Hashable]
+
+
+def flight_key(endpoint: str, **params: Any) -> FlightKey:
+    """Key for a call: parameters left at None do not distinguish calls"""
+    return endpoint, tuple(sorted((name, value) for name, value in params.items() if value is not None))
+
+
+class SingleFlight:
+    """
+    Runs at most one computation per key at a time. Callers that arrive
+    while it runs wait for its result (or exception) instead of computing
+    the same answer again. Sync callers (threadpool routes) block on the
+    shared future; async callers await it without holding a thread.
+
+    Only in-flight calls are shared, nothing is cached afterwards.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[FlightKey, Future] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _join(self, key: FlightKey) -> Tuple[Future, bool]:
+        """The call's future, and whether this caller has to run it"""
+        with self._lock:
+            stats = self._stats.setdefault(key[0], {"executed": 0, "coalesced": 0})
+            future = self._calls.get(key)
+            if future is not None:
+                stats["coalesced"] += 1
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            stats["executed"] += 1
+            return future, True
+
+    def _run(self, key: FlightKey, future: Future, fn: Callable[[], T]) -> None:
+        try:
+            result = fn()
+        except BaseException as e:
+            self._forget(key, future)
+            future.set_exception(e)
+        else:
+            self._forget(key, future)
+            future.set_result(result)
+
+    def _forget(self, key: FlightKey, future: Future) -> None:
+        # Later callers start a new computation
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def do(self, key: FlightKey, fn: Callable[[], T]) -> T:
+        """Run `fn`, or wait for the call already running under `key`"""
+        future, leader = self._join(key)
+        if leader:
+            self._run(key, future, fn)
+        return future.result()
+
+    async def do_async(self, key: FlightKey, fn: Callable[[], T]) -> T:
+        """Like `do`, running `fn` in the threadpool"""
+        future, leader = self._join(key)
+        if leader:
+            await run_in_threadpool(self._run, key, future, fn)
+        return await asyncio.wrap_future(future)
+
+    def reset(self) -> None:
+        """
+        Detach the running calls after a write: callers arriving now start a
+        new computation instead of getting a result read before the write
+        """
+        with self._lock:
+            self._calls.clear()
+
+    def stats(self, endpoint: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Calls executed and coalesced per endpoint, with those in flight"""
+        with self._lock:
+            in_flight: Dict[str, int] = {}
+            for name, _ in self._calls:
+                in_flight[name] = in_flight.get(name, 0) + 1
+            stats = {
+                name: {**counts, "in_flight": in_flight.get(name, 0)}
+                for name, counts in self._stats.items()
+            }
+        return {endpoint: stats.get(endpoint, {})} if endpoint else stats
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,206 @@
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..models import Course, CourseStatistic
+
+DIMENSIONS = ("department", "level", "language", "semester")
+OVERVIEW = ("overview", "total")
+
+StatKey = Tuple[str, str]
+Footprint = Dict[StatKey, Tuple[int, int]]
+
+
+def _value(obj: Any, field: str) -> Any:
+    return obj.get(field) if isinstance(obj, dict) else getattr(obj, field, None)
+
+
+def _label(value: Any) -> str:
+    value = getattr(value, "value", value)
+    return str(value).lower() if value is not None else ""
+
+
+class StatisticsService:
+    """
+    Course counters per department, level, language and semester.
+
+    Counters live in the `course_statistics` table and are adjusted in the
+    same transaction as every course write, so reading them never scans
+    `courses`. They are materialised by the migration that creates the
+    table, or by `materialise` at startup for databases created without it.
+    """
+
+    @staticmethod
+    def footprint(course: Any) -> Footprint:
+        """
+        Counter contributions of a course (ORM object or dict of columns):
+        (dimension, value) -> (course count, credits). Inactive courses
+        contribute nothing.
+        """
+        if course is None or _value(course, "is_active") is False:
+            return {}
+        credits = _value(course, "credits") or 0
+        keys = [
+            OVERVIEW,
+            ("department", _value(course, "department")),
+            ("level", _label(_value(course, "level"))),
+            ("language", _value(course, "language") or "Norwegian"),
+        ]
+        semesters = {_label(s) for s in _value(course, "semester") or []}
+        keys.extend(("semester", semester) for semester in sorted(semesters))
+        return {key: (1, credits) for key in keys}
+
+    @staticmethod
+    def apply_change(db: Session, before: Footprint, after: Footprint) -> None:
+        """Adjust counters by the difference between two footprints"""
+        StatisticsService.apply_changes(db, [(before, after)])
+
+    @staticmethod
+    def apply_changes(db: Session, changes: List[Tuple[Footprint, Footprint]]) -> None:
+        """Adjust counters for many (before, after) footprint pairs at once"""
+        deltas: Dict[StatKey, Tuple[int, int]] = {}
+        for before, after in changes:
+            for sign, footprint in ((-1, before), (1, after)):
+                for key, (count, credits) in footprint.items():
+                    old_count, old_credits = deltas.get(key, (0, 0))
+                    deltas[key] = (old_count + sign * count, old_credits + sign * credits)
+        StatisticsService._apply_deltas(db, deltas)
+
+    @staticmethod
+    def _apply_deltas(db: Session, deltas: Dict[StatKey, Tuple[int, int]]) -> None:
+        # The overview row goes first: if it is missing the counters were
+        # never materialised and materialising them later counts this write
+        overview_count, overview_credits = deltas.pop(OVERVIEW, (0, 0))
+        result = db.execute(
+            update(CourseStatistic)
+            .where(CourseStatistic.dimension == OVERVIEW[0], CourseStatistic.value == OVERVIEW[1])
+            .values(
+                course_count=CourseStatistic.course_count + overview_count,
+                credits_sum=CourseStatistic.credits_sum + overview_credits,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            return
+
+        rows = [
+            {"dimension": dimension, "value": value, "course_count": count, "credits_sum": credits}
+            # Sorted, so concurrent writers lock the rows in the same order
+            for (dimension, value), (count, credits) in sorted(deltas.items())
+            if count or credits
+        ]
+        if not rows:
+            return
+        # Upsert: two writers adding the first course of a new value would
+        # otherwise both insert its row
+        dialect_insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+        statement = dialect_insert(CourseStatistic)
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[CourseStatistic.dimension, CourseStatistic.value],
+                set_={
+                    "course_count": CourseStatistic.course_count + statement.excluded.course_count,
+                    "credits_sum": CourseStatistic.credits_sum + statement.excluded.credits_sum,
+                },
+            ),
+            rows,
+        )
+
+    @staticmethod
+    def _count(db: Session) -> Dict[StatKey, Tuple[int, int]]:
+        """Counters computed from the courses table"""
+        rows = db.execute(
+            select(
+                Course.department, Course.level, Course.language,
+                Course.semester, Course.credits, Course.is_active,
+            ).where(Course.is_active)
+        ).mappings().all()
+
+        counts: Counter = Counter()
+        credits: Counter = Counter()
+        for row in rows:
+            for key, (count, course_credits) in StatisticsService.footprint(dict(row)).items():
+                counts[key] += count
+                credits[key] += course_credits
+        # The overview row marks the table as materialised, even when empty
+        counts[OVERVIEW] += 0
+        return {key: (counts[key], credits[key]) for key in counts}
+
+    @staticmethod
+    def rebuild(db: Session) -> None:
+        """Recompute all counters from the courses table (does not commit)"""
+        # Deleting first takes SQLite's write lock before the courses are read
+        db.execute(delete(CourseStatistic))
+        db.execute(insert(CourseStatistic), [
+            {"dimension": d, "value": v, "course_count": count, "credits_sum": credits}
+            for (d, v), (count, credits) in StatisticsService._count(db).items()
+        ])
+
+    @staticmethod
+    def _materialised(db: Session) -> bool:
+        return db.get(CourseStatistic, OVERVIEW) is not None
+
+    @staticmethod
+    def materialise(db: Session) -> None:
+        """Build the counters once if they were never materialised for this database (commits)"""
+        if StatisticsService._materialised(db):
+            return
+        if db.get_bind().dialect.name == "postgresql":
+            # Hold off course writes until the counters exist, so none is lost
+            # between reading the courses and writing the counters
+            db.execute(text("LOCK TABLE courses, course_statistics IN SHARE MODE"))
+        if not StatisticsService._materialised(db):
+            StatisticsService.rebuild(db)
+        db.commit()
+
+    @staticmethod
+    def _rows(db: Session, dimension: Optional[str] = None) -> Dict[StatKey, CourseStatistic]:
+        query = db.query(CourseStatistic)
+        if dimension:
+            query = query.filter(CourseStatistic.dimension.in_([dimension, OVERVIEW[0]]))
+        rows = query.all()
+        if not any((r.dimension, r.value) == OVERVIEW for r in rows):
+            # Never materialised: count from the courses, without writing on a read
+            return {
+                (d, v): CourseStatistic(dimension=d, value=v, course_count=count, credits_sum=credits)
+                for (d, v), (count, credits) in StatisticsService._count(db).items()
+                if not dimension or d in (dimension, OVERVIEW[0])
+            }
+        return {(r.dimension, r.value): r for r in rows}
+
+    @staticmethod
+    def get_dimension(db: Session, dimension: str) -> List[Dict[str, Any]]:
+        """Course counts for each value of a dimension, largest first"""
+        rows = [
+            r for (d, _), r in StatisticsService._rows(db, dimension).items()
+            if d == dimension and r.course_count > 0
+        ]
+        rows.sort(key=lambda r: (-r.course_count, r.value))
+        return [
+            {dimension: r.value, "count": r.course_count, "credits": r.credits_sum}
+            for r in rows
+        ]
+
+    @staticmethod
+    def get_overview(db: Session) -> Dict[str, Any]:
+        """Catalog totals plus counts per level, language and semester"""
+        rows = StatisticsService._rows(db)
+        total = rows.pop(OVERVIEW)
+        by_dimension: Dict[str, Dict[str, int]] = {d: {} for d in DIMENSIONS}
+        for (dimension, value), r in sorted(rows.items()):
+            if dimension in by_dimension and r.course_count > 0:
+                by_dimension[dimension][value] = r.course_count
+        return {
+            "total_courses": total.course_count,
+            "total_credits": total.credits_sum,
+            "average_credits": (
+                round(total.credits_sum / total.course_count, 2) if total.course_count else 0
+            ),
+            "departments": len(by_dimension["department"]),
+            "levels": by_dimension["level"],
+            "languages": by_dimension["language"],
+            "semesters": by_dimension["semester"],
+        }
@@ -0,0 +1,157 @@
+"""
+Stale-while-revalidate holder for process-wide derived structures.
+
+Settings (seconds, from the environment):
+  - CACHE_SOFT_TTL (default 60): an older value is still served, and one
+    background refresh is started
+  - CACHE_HARD_TTL (default 600): an older value is never served; the
+    reader rebuilds it
+  - CACHE_MAX_STALENESS (default 0): how long after an invalidation the
+    previous value may still be served while the refresh runs. 0 drops it
+    at once, so readers always see their own writes.
+  - CACHE_REFRESH_WORKERS (default 2): threads shared by all background
+    refreshes, so rebuilds cannot take over the request threadpool
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Generic, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SOFT_TTL_ENV = "CACHE_SOFT_TTL"
+HARD_TTL_ENV = "CACHE_HARD_TTL"
+MAX_STALENESS_ENV = "CACHE_MAX_STALENESS"
+REFRESH_WORKERS_ENV = "CACHE_REFRESH_WORKERS"
+
+_missing = object()
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def seconds_setting(name: str, default: float) -> float:
+    return float(os.getenv(name) or default)
+
+
+def refresh_pool() -> ThreadPoolExecutor:
+    """The bounded pool background refreshes run on"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = int(os.getenv(REFRESH_WORKERS_ENV) or 2)
+            _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cache-refresh")
+        return _pool
+
+
+class SwrCache(Generic[T]):
+    """
+    One lazily built value. Readers get the current value without waiting
+    while it is within the soft TTL, or within the soft/stale bounds with a
+    background refresh running; otherwise the reader builds it. Builds are
+    serialised, so at most one runs at a time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[Session], T],
+        soft_ttl: Optional[float] = None,
+        hard_ttl: Optional[float] = None,
+        max_staleness: Optional[float] = None,
+    ):
+        self.name = name
+        self.loader = loader
+        self.soft_ttl = soft_ttl if soft_ttl is not None else seconds_setting(SOFT_TTL_ENV, 60)
+        self.hard_ttl = hard_ttl if hard_ttl is not None else seconds_setting(HARD_TTL_ENV, 600)
+        self.max_staleness = max_staleness if max_staleness is not None else seconds_setting(MAX_STALENESS_ENV, 0)
+        self._value = _missing
+        self._built_at = 0.0
+        # When an invalidation made the value stale, None while it is current
+        self._stale_since: Optional[float] = None
+        # Bumped by invalidations so a build that started earlier stays stale
+        self._generation = 0
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    def get(self, db: Session, fresh: bool = False) -> T:
+        """
+        The value, served stale within the configured bounds. With `fresh`
+        an invalidated value is never returned (for building other caches).
+        """
+        now = time.monotonic()
+        with self._lock:
+            value = self._value
+            if value is not _missing:
+                age = now - self._built_at
+                stale_for = None if self._stale_since is None else now - self._stale_since
+                if stale_for is None and age < self.soft_ttl:
+                    return value
+                if age < self.hard_ttl and (
+                    stale_for is None or (not fresh and stale_for <= self.max_staleness)
+                ):
+                    self._schedule_refresh()
+                    return value
+        return self._build(db)
+
+    def invalidate(self) -> None:
+        """Mark the value stale after a write, keeping it within the staleness bound"""
+        with self._lock:
+            self._generation += 1
+            if self._value is _missing:
+                return
+            if self.max_staleness <= 0:
+                self._value = _missing
+                return
+            if self._stale_since is None:
+                self._stale_since = time.monotonic()
+            self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        # Called with self._lock held
+        if not self._refreshing:
+            self._refreshing = True
+            refresh_pool().submit(self._refresh)
+
+    def _refresh(self) -> None:
+        db = SessionLocal()
+        try:
+            self._build(db, force=True)
+        except Exception:
+            logger.exception("Background refresh of %s failed", self.name)
+        finally:
+            db.close()
+            with self._lock:
+                self._refreshing = False
+
+    def _build(self, db: Session, force: bool = False) -> T:
+        with self._build_lock:
+            with self._lock:
+                generation = self._generation
+                if not force and self._value is not _missing and self._stale_since is None \
+                        and time.monotonic() - self._built_at < self.soft_ttl:
+                    # Built by another reader while this one waited
+                    return self._value
+            value = self.loader(db)
+            with self._lock:
+                if generation == self._generation:
+                    self._value = value
+                    self._built_at = time.monotonic()
+                    self._stale_since = None
+                elif self.max_staleness > 0:
+                    # Invalidated while building: keep it as a stale value
+                    self._value = value
+                    self._built_at = time.monotonic()
+                    if self._stale_since is None:
+                        self._stale_since = self._built_at
+                    self._schedule_refresh()
+            return value
@@ -0,0 +1,199 @@
+import enum
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models import Course, prerequisite_table
+from ..schemas import CourseCreate, prerequisite_edges
+from .import_service import ImportService, Progress
+from .prerequisite_graph import EdgeDiff
+
+# Course columns a data file describes; anything else is the database's own
+SYNC_FIELDS = tuple(name for name in CourseCreate.model_fields if name not in ("id", "prerequisite_ids"))
+
+
+def _plain(value: Any) -> Any:
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _normalised(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Synced fields in one comparable form, whichever side they come from"""
+    row = {name: _plain(values.get(name)) for name in SYNC_FIELDS}
+    row["level"] = str(row["level"]).lower()
+    # Semesters are a set (stored as a bit mask too); order is not a change
+    row["semester"] = sorted(str(_plain(s)).lower() for s in row["semester"] or [])
+    return row
+
+
+def row_hash(row: Dict[str, Any]) -> str:
+    """Content hash of a normalised row"""
+    return hashlib.sha256(json.dumps(row, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@dataclass
+class SyncPlan:
+    """What syncing the catalog to a course list changes, and the bulk items that do it"""
+
+    inserts: List[str] = field(default_factory=list)
+    # Course -> field -> (stored, wanted)
+    updates: Dict[str, Dict[str, Tuple[Any, Any]]] = field(default_factory=dict)
+    reactivations: List[str] = field(default_factory=list)
+    deactivations: List[str] = field(default_factory=list)
+    # Active courses the source does not list; deactivated only on request
+    missing: List[str] = field(default_factory=list)
+    edges: EdgeDiff = field(default_factory=EdgeDiff)
+    unchanged: int = 0
+    # Later source rows for a course listed earlier, which are ignored
+    shadowed: List[str] = field(default_factory=list)
+    # Source rows that cannot be synced: {"id", "errors"}
+    invalid: List[Dict[str, Any]] = field(default_factory=list)
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    load_seconds: float = 0.0
+    diff_seconds: float = 0.0
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "inserts": len(self.inserts),
+            "updates": len(self.updates),
+            "reactivations": len(self.reactivations),
+            "deactivations": len(self.deactivations),
+            "missing": len(self.missing),
+            "edges_added": len(self.edges.added),
+            "edges_removed": len(self.edges.removed),
+            "edges_retyped": len(self.edges.retyped),
+            "unchanged": self.unchanged,
+            "shadowed": len(self.shadowed),
+            "invalid": len(self.invalid),
+        }
+
+    def describe(self) -> List[str]:
+        """The plan as lines for a dry run"""
+        lines = [f"  INSERT  {course_id}" for course_id in self.inserts]
+        for course_id, changes in self.updates.items():
+            for name, (stored, wanted) in changes.items():
+                lines.append(f"  UPDATE  {course_id}.{name}: {stored!r} -> {wanted!r}")
+        lines.extend(f"  ENABLE  {course_id}" for course_id in self.reactivations)
+        for (course_id, prerequisite_id), edge_type in sorted(self.edges.added.items()):
+            lines.append(f"  +EDGE   {course_id} <- {prerequisite_id} ({edge_type})")
+        for course_id, prerequisite_id in sorted(self.edges.removed):
+            lines.append(f"  -EDGE   {course_id} <- {prerequisite_id}")
+        for (course_id, prerequisite_id), edge_type in sorted(self.edges.retyped.items()):
+            lines.append(f"  ~EDGE   {course_id} <- {prerequisite_id} ({edge_type})")
+        for row in self.invalid:
+            lines.append(f"  INVALID {row['id']}: {row['errors']}")
+        # Deactivations are listed apart, so a partial source is not missed
+        if self.deactivations:
+            lines.append(
+                f"WARNING: {len(self.deactivations)} active courses are not in the source and will be deactivated:"
+            )
+            lines.extend(f"  DISABLE {course_id}" for course_id in self.deactivations)
+        elif self.missing:
+            lines.append(f"{len(self.missing)} active courses are not in the source; they stay active.")
+        counts = ", ".join(f"{n} {name}" for name, n in self.counts().items())
+        lines.append(f"{counts} (loaded in {self.load_seconds:.2f}s, diffed in {self.diff_seconds:.2f}s)")
+        return lines
+
+
+class SyncService:
+    """
+    Brings the catalog in line with a course list (usually the data files):
+    new courses are inserted, changed fields and prerequisites are written,
+    and, if asked, active courses missing from the list are deactivated.
+    Rows whose content hash matches are not touched.
+    """
+
+    @staticmethod
+    def plan(db: Session, courses: Iterable[Dict[str, Any]], deactivate_missing: bool = False) -> SyncPlan:
+        """
+        Diff `courses` against the database without writing anything. The
+        first row for a course wins, so sources are given in priority order.
+        """
+        plan = SyncPlan()
+        started = time.perf_counter()
+        stored = {
+            row["id"]: row for row in db.execute(
+                select(Course.id, Course.is_active, *(getattr(Course, name) for name in SYNC_FIELDS))
+            ).mappings()
+        }
+        stored_edges = {
+            (edge.course_id, edge.prerequisite_id): edge.type
+            for edge in db.execute(select(prerequisite_table))
+        }
+        plan.load_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        wanted: Dict[str, CourseCreate] = {}
+        for item in courses:
+            try:
+                course = CourseCreate.model_validate(item)
+            except ValidationError as e:
+                errors = e.errors(include_url=False, include_context=False)
+                plan.invalid.append({"id": item.get("id"), "errors": errors})
+                continue
+            if course.id in wanted:
+                plan.shadowed.append(course.id)
+                continue
+            wanted[course.id] = course
+
+        wanted_edges = {
+            course_id: prerequisite_edges(course.prerequisite_ids) for course_id, course in wanted.items()
+        }
+        plan.edges = EdgeDiff.between(stored_edges, wanted_edges)
+        edges_moved = {key[0] for key in [*plan.edges.added, *plan.edges.removed, *plan.edges.retyped]}
+
+        for course_id, course in wanted.items():
+            row = _normalised(course.model_dump())
+            edges = [{"id": p, "type": t} for p, t in wanted_edges[course_id].items()]
+            current = stored.get(course_id)
+            if current is None:
+                plan.inserts.append(course_id)
+                plan.items.append({
+                    "id": course_id, **course.model_dump(exclude={"prerequisite_ids"}), "prerequisite_ids": edges,
+                })
+                continue
+            item: Dict[str, Any] = {}
+            current_row = _normalised(current)
+            if row_hash(current_row) != row_hash(row):
+                changes = {
+                    name: (current_row[name], row[name])
+                    for name in SYNC_FIELDS if current_row[name] != row[name]
+                }
+                plan.updates[course_id] = changes
+                item.update((name, getattr(course, name)) for name in changes)
+            if current["is_active"] is False:
+                plan.reactivations.append(course_id)
+                item["is_active"] = True
+            if course_id in edges_moved:
+                item["prerequisite_ids"] = edges
+            if item:
+                plan.items.append({"id": course_id, **item})
+            else:
+                plan.unchanged += 1
+
+        invalid_ids = {str(row["id"]).upper() for row in plan.invalid}
+        for course_id, current in stored.items():
+            # A row that failed validation is not missing from the source
+            if current["is_active"] and course_id not in wanted and course_id not in invalid_ids:
+                plan.missing.append(course_id)
+                if deactivate_missing:
+                    plan.deactivations.append(course_id)
+                    plan.items.append({"id": course_id, "is_active": False})
+        plan.diff_seconds = time.perf_counter() - started
+        return plan
+
+    @staticmethod
+    def apply(db: Session, plan: SyncPlan, progress: Optional[Progress] = None) -> Dict[str, Any]:
+        """Write a plan's items in chunks through the bulk upsert path"""
+        if not plan:
+            return {"created": 0, "updated": 0, "failed": 0, "errors": []}
+        summary = ImportService.import_courses(db, plan.items, progress)
+        return {name: summary[name] for name in ("created", "updated", "failed", "errors")}
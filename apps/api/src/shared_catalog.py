@@ -0,0 +1,201 @@
+"""
+Catalog snapshot shared between worker processes.
+
+The snapshot is published as a file, by default on the /dev/shm tmpfs, and
+every worker maps it read-only, so all workers share one copy of the pages.
+A new generation is written to a temporary file and renamed over the old
+one. Workers notice the new inode, map it and drop their per-process caches;
+mappings of the old generation stay valid until they are released.
+
+Writes do not publish in the request: they ask for a publish, and one
+background thread publishes once for all the writes of the last
+PUBLISH_DELAY. Until it has, the writing process reads from the database.
+"""
+import fcntl
+import logging
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Iterator, List, Optional
+
+from .catalog_snapshot import CatalogSnapshot, SnapshotFormatError, build_snapshot, read_revision
+from .database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+CATALOG_SNAPSHOT_ENV = "CATALOG_SNAPSHOT_PATH"
+DEFAULT_SNAPSHOT_PATH = "/dev/shm/ifi-course-catalog.bin"
+
+# How often a worker checks whether a new generation was published
+CHECK_INTERVAL = 0.5
+# Writes requested within this many seconds are published together
+PUBLISH_DELAY = 0.1
+
+
+class SharedCatalog:
+    def __init__(self, path: str, check_interval: float = CHECK_INTERVAL, publish_delay: float = PUBLISH_DELAY):
+        self.path = path
+        self.check_interval = check_interval
+        self.publish_delay = publish_delay
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._inode: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._swap_callbacks: List[Callable[[], None]] = []
+        # Publish requests so far, and whether the mapped snapshot predates one
+        self._requested = 0
+        self._stale = False
+        self._publish_scheduled = False
+        self._publish_lock = threading.Lock()
+        self._publisher: Optional[ThreadPoolExecutor] = None
+        self._deferred = threading.local()
+
+    def on_swap(self, callback: Callable[[], None]) -> None:
+        """Register a callback run when this process maps a new generation"""
+        self._swap_callbacks.append(callback)
+
+    def publish(self, data: bytes) -> None:
+        """Atomically replace the shared snapshot with `data`"""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+    def publish_from_database(self) -> int:
+        """Build a snapshot from the database and publish it as the next generation"""
+        with open(f"{self.path}.lock", "w") as lock_file:
+            # Serialise publishers so generations are strictly increasing
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            revision = self._current_revision() + 1
+            db = SessionLocal()
+            try:
+                data = build_snapshot(db, revision)
+            finally:
+                db.close()
+            self.publish(data)
+            # The publisher already invalidated its own caches, so map the new
+            # generation without the swap callbacks, unless it skipped over
+            # generations published by other workers
+            mapped = self._snapshot.revision if self._snapshot else None
+            self._map(run_callbacks=mapped is not None and mapped != revision - 1)
+        return revision
+
+    def request_publish(self) -> None:
+        """
+        Publish the database in the background after a committed write.
+        This process reads the database instead of the snapshot until then.
+        """
+        if getattr(self._deferred, "depth", 0):
+            self._deferred.pending = True
+            return
+        with self._publish_lock:
+            self._requested += 1
+            self._stale = True
+            if self._publish_scheduled:
+                return
+            self._publish_scheduled = True
+            if self._publisher is None:
+                self._publisher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="catalog-publish")
+        self._publisher.submit(self._publish_requested)
+
+    @contextmanager
+    def deferred_publish(self) -> Iterator[None]:
+        """Publish once at the end of the block for all of this thread's writes in it"""
+        self._deferred.depth = getattr(self._deferred, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            self._deferred.depth -= 1
+            if not self._deferred.depth and getattr(self._deferred, "pending", False):
+                self._deferred.pending = False
+                self.request_publish()
+
+    def _publish_requested(self) -> None:
+        time.sleep(self.publish_delay)
+        while True:
+            with self._publish_lock:
+                seen = self._requested
+            try:
+                self.publish_from_database()
+            except Exception:
+                # Stay stale, so this process keeps reading the database; the
+                # next write tries again
+                logger.exception("Publishing the catalog snapshot failed")
+                with self._publish_lock:
+                    self._publish_scheduled = False
+                return
+            with self._publish_lock:
+                if self._requested == seen:
+                    self._stale = False
+                    self._publish_scheduled = False
+                    return
+
+    def _current_revision(self) -> int:
+        try:
+            with open(self.path, "rb") as f:
+                return read_revision(f.read(64))
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def current(self) -> Optional[CatalogSnapshot]:
+        """
+        Return the mapped snapshot, switching to a newer generation if one
+        exists; None while a write of this process is not yet published
+        """
+        if self._stale:
+            return None
+        if time.monotonic() - self._checked_at < self.check_interval:
+            return self._snapshot
+        return self._map(run_callbacks=True)
+
+    def _map(self, run_callbacks: bool) -> Optional[CatalogSnapshot]:
+        swapped = False
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                inode = os.stat(self.path).st_ino
+            except FileNotFoundError:
+                return self._snapshot
+            if inode != self._inode:
+                with open(self.path, "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    inode = os.fstat(f.fileno()).st_ino
+                self._inode = inode
+                try:
+                    snapshot = CatalogSnapshot(mapped)
+                except SnapshotFormatError:
+                    # Keep serving the previous generation (or the database)
+                    logger.exception("Ignoring unreadable catalog snapshot %s", self.path)
+                    return self._snapshot
+                # The previous mapping is unmapped once no request uses it
+                swapped = self._snapshot is not None
+                self._snapshot = snapshot
+
+        if swapped and run_callbacks:
+            for callback in self._swap_callbacks:
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("Catalog swap callback failed")
+        return self._snapshot
+
+
+def _from_environment() -> Optional[SharedCatalog]:
+    path = os.getenv(CATALOG_SNAPSHOT_ENV)
+    return SharedCatalog(path) if path else None
+
+
+# Only set when the API runs behind the multi-worker entry point (src.serve)
+shared_catalog = _from_environment()
+
+
+def current_snapshot() -> Optional[CatalogSnapshot]:
+    return shared_catalog.current() if shared_catalog else None
+
+
+def deferred_publish():
+    """SharedCatalog.deferred_publish for the shared snapshot, if there is one"""
+    return shared_catalog.deferred_publish() if shared_catalog else nullcontext()
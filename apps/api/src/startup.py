@@ -0,0 +1,119 @@
+"""
+Work done when the app starts rather than when it is imported.
+
+SCHEMA_MODE chooses what happens to the database schema:
+  - "none" (default): nothing; Alembic owns the schema
+  - "check": fail startup if tables or columns are missing (run `alembic upgrade head`)
+  - "create": create missing tables and materialise the statistics
+    counters, for local SQLite databases and tests
+
+CATALOG_WARMUP=1 loads the read caches in a background thread after
+startup; the app should not be reported ready until the warmup is done.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .database import Base, SessionLocal, get_engine
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_MODE_ENV = "SCHEMA_MODE"
+WARMUP_ENV = "CATALOG_WARMUP"
+SCHEMA_MODES = ("none", "check", "create")
+
+
+class StartupState:
+    """Progress of startup, shared with the health endpoints"""
+
+    def __init__(self):
+        self.started_at: Optional[float] = None
+        # "skipped", "running", "done" or "failed"
+        self.warmup = "skipped"
+        self.warmup_error: Optional[str] = None
+
+
+startup_state = StartupState()
+
+
+def prepare_schema(mode: Optional[str] = None, engine: Optional[Engine] = None) -> None:
+    mode = (mode or os.getenv(SCHEMA_MODE_ENV) or "none").lower()
+    if mode not in SCHEMA_MODES:
+        raise RuntimeError(f"{SCHEMA_MODE_ENV} must be one of {', '.join(SCHEMA_MODES)}")
+    if mode == "none":
+        return
+    engine = engine or get_engine()
+    if mode == "create":
+        from .services.statistics_service import StatisticsService
+
+        Base.metadata.create_all(bind=engine)
+        # The migration backfills the counters; here that happens once now
+        # rather than on the first statistics read
+        with Session(engine) as db:
+            StatisticsService.materialise(db)
+    else:
+        inspector = inspect(engine)
+        existing = set(inspector.get_table_names())
+        missing = sorted(set(Base.metadata.tables) - existing)
+        if missing:
+            raise RuntimeError(
+                f"Database schema is missing tables {', '.join(missing)}; run `alembic upgrade head`"
+            )
+        missing = [
+            f"{name}.{column}"
+            for name, table in sorted(Base.metadata.tables.items())
+            for column in sorted(set(table.columns.keys()) - {c["name"] for c in inspector.get_columns(name)})
+        ]
+        if missing:
+            raise RuntimeError(
+                f"Database schema is missing columns {', '.join(missing)}; run `alembic upgrade head`"
+            )
+
+
+def warm_caches() -> None:
+    """Load the read model, prerequisite graph and in-memory indexes"""
+    from .services.facet_index import get_facet_index
+    from .services.filter_engine import get_filter_engine
+    from .services.prerequisite_graph import get_prerequisite_graph
+    from .services.read_model_service import ReadModelService
+    from .services.statistics_service import StatisticsService
+
+    started = time.monotonic()
+    db = SessionLocal()
+    try:
+        ReadModelService.ensure_built(db)
+        get_prerequisite_graph(db)
+        get_facet_index(db)
+        get_filter_engine(db)
+        StatisticsService.get_overview(db)
+    finally:
+        db.close()
+    logger.info("Caches warmed in %.2fs", time.monotonic() - started)
+
+
+def _warm_in_background() -> None:
+    try:
+        warm_caches()
+    except Exception as e:
+        logger.exception("Cache warmup failed")
+        startup_state.warmup_error = str(e)
+        startup_state.warmup = "failed"
+    else:
+        startup_state.warmup = "done"
+
+
+def start(warmup: Optional[bool] = None) -> None:
+    """Run on app startup: prepare the schema and start the optional warmup"""
+    startup_state.started_at = time.time()
+    prepare_schema()
+    if warmup is None:
+        warmup = os.getenv(WARMUP_ENV, "").lower() in ("1", "true", "yes")
+    if warmup:
+        startup_state.warmup = "running"
+        threading.Thread(target=_warm_in_background, name="cache-warmup", daemon=True).start()
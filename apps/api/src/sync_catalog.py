@@ -0,0 +1,65 @@
+"""
+Sync the catalog with the course data files: insert new courses, write
+changed fields and prerequisites and, with --deactivate-missing, deactivate
+courses no longer listed. Unchanged rows are left alone. Without --apply
+only the plan is printed.
+
+Run with: cd apps/api && python -m src.sync_catalog [FILE ...] [--apply] [--deactivate-missing]
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.catalog_data import NEW_COURSES_FILE, SEED_FILE, read_courses
+from src.database import SessionLocal
+from src.services.sync_service import SyncService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync the course catalog with course data files")
+    parser.add_argument(
+        "files", nargs="*", default=[str(SEED_FILE), str(NEW_COURSES_FILE)],
+        help="JSON Lines course files that together make up the catalog, highest priority first "
+             "(default: the bundled files)",
+    )
+    parser.add_argument("--apply", action="store_true", help="write the changes (default: print the plan only)")
+    parser.add_argument(
+        "--deactivate-missing", action="store_true",
+        help="deactivate active courses missing from the files (default: leave them active)",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        courses = itertools.chain.from_iterable(read_courses(path) for path in args.files)
+        plan = SyncService.plan(db, courses, deactivate_missing=args.deactivate_missing)
+        for line in plan.describe():
+            print(line)
+        if not plan:
+            print("Catalog is in sync, nothing to do.")
+            return
+        if not args.apply:
+            print("Dry run; rerun with --apply to write these changes.")
+            return
+
+        started = time.perf_counter()
+        result = SyncService.apply(db, plan, progress=lambda chunk: print(f"  {chunk}"))
+        for error in result["errors"]:
+            print(f"  FAIL {error['id']} - {error['errors']}")
+        print(
+            f"Applied in {time.perf_counter() - started:.2f}s: {result['created']} created, "
+            f"{result['updated']} updated, {result['failed']} failed."
+        )
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
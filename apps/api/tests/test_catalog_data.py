@@ -0,0 +1,45 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.catalog_data import (
+    NEW_COURSES_FILE, SEED_FILE, CatalogDataError, count_courses, file_hash, read_courses,
+)
+from src.schemas import CourseCreate
+
+
+def test_bundled_files_hold_valid_courses():
+    seed = list(read_courses(SEED_FILE))
+    new = list(read_courses(NEW_COURSES_FILE))
+    assert (len(seed), len(new)) == (count_courses(SEED_FILE), count_courses(NEW_COURSES_FILE))
+
+    ids = [course["id"] for course in seed]
+    assert len(ids) == len(set(ids))
+    for course in seed:
+        CourseCreate.model_validate(course)
+        assert set(course.get("prerequisite_ids", [])) <= set(ids)
+    for course in new:
+        CourseCreate.model_validate(course)
+
+
+def test_reader_streams_and_reports_bad_lines(tmp_path):
+    path = tmp_path / "courses.jsonl"
+    path.write_text('{"id": "IN1000"}\n\n{"id": "IN1010"}\n[1, 2]\n', encoding="utf-8")
+    courses = read_courses(path)
+    assert next(courses) == {"id": "IN1000"}
+    assert next(courses) == {"id": "IN1010"}
+    with pytest.raises(CatalogDataError, match=r"courses.jsonl:4: expected a JSON object"):
+        next(courses)
+    assert count_courses(path) == 3
+
+
+def test_hash_follows_content(tmp_path):
+    first, second = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+    first.write_text('{"id": "IN1000"}\n', encoding="utf-8")
+    second.write_text('{"id": "IN1000"}\n', encoding="utf-8")
+    assert file_hash(first) == file_hash(second)
+    second.write_text('{"id": "IN1010"}\n', encoding="utf-8")
+    assert file_hash(first) != file_hash(second)
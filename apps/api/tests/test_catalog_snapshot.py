@@ -0,0 +1,123 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.catalog_snapshot import CatalogSnapshot, encode_snapshot
+from src.shared_catalog import SharedCatalog
+
+COURSES = [
+    {"id": "IN2010", "title": "Algoritmer", "credits": 10, "department": "Informatics",
+     "level": "bachelor", "language": "Norwegian", "semester_mask": 2, "is_active": True},
+    {"id": "IN1000", "title": "Programmering", "title_english": "Programming", "credits": 10,
+     "department": "Informatics", "level": "bachelor", "language": "Norwegian",
+     "semester_mask": 3, "is_active": True, "payload": '{"id":"IN1000"}'},
+    {"id": "MAT1100", "title": "Kalkulus", "credits": 10, "department": "Mathematics",
+     "level": "bachelor", "language": "Norwegian", "semester_mask": 1, "is_active": False},
+]
+EDGES = [("IN2010", "IN1000", "mandatory"), ("IN2010", "MAT1100", "recommended")]
+
+
+def test_snapshot_round_trip():
+    snapshot = CatalogSnapshot(encode_snapshot(COURSES, EDGES, revision=7))
+    assert snapshot.revision == 7
+    assert [snapshot.course_id(i) for i in range(snapshot.course_count)] == ["IN1000", "IN2010", "MAT1100"]
+
+    algorithms = snapshot.index_of("IN2010")
+    assert snapshot.field(algorithms, "title") == "Algoritmer"
+    assert snapshot.field(algorithms, "title_english") is None
+    assert snapshot.index_of("IN9999") is None
+    assert sorted(snapshot.edges()) == [("IN1000", "IN2010"), ("MAT1100", "IN2010")]
+    assert list(snapshot.prerequisite_types) == [0, 1]
+    assert snapshot.departments[snapshot.department[snapshot.index_of("MAT1100")]] == "Mathematics"
+    assert bytes(snapshot.payload(snapshot.index_of("IN1000"))) == b'{"id":"IN1000"}'
+    assert snapshot.prerequisite_counts() == {"IN1000": 0, "IN2010": 2}
+
+
+def test_shared_catalog_swaps_generations(tmp_path):
+    path = str(tmp_path / "catalog.bin")
+    publisher = SharedCatalog(path)
+    worker = SharedCatalog(path, check_interval=0)
+    swaps = []
+    worker.on_swap(lambda: swaps.append(worker.current().revision))
+
+    publisher.publish(encode_snapshot(COURSES, EDGES, revision=1))
+    first = worker.current()
+    assert first.revision == 1 and swaps == []
+
+    publisher.publish(encode_snapshot(COURSES[:2], EDGES[:1], revision=2))
+    assert worker.current().revision == 2
+    assert swaps == [2]
+    # The old generation stays readable while something still holds it
+    assert first.course_count == 3
+
+
+def test_write_publishes_are_coalesced_in_the_background(tmp_path):
+    import time
+
+    catalog = SharedCatalog(str(tmp_path / "catalog.bin"), check_interval=0, publish_delay=0.05)
+    published = []
+
+    def publish_from_database():
+        published.append(len(published) + 1)
+        catalog.publish(encode_snapshot(COURSES, EDGES, revision=len(published)))
+        catalog._map(run_callbacks=False)
+
+    catalog.publish_from_database = publish_from_database
+
+    def wait_for(count):
+        deadline = time.monotonic() + 5
+        while (len(published) < count or catalog._stale) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    for _ in range(20):
+        catalog.request_publish()
+    # Until the writes are published this process reads the database
+    assert catalog.current() is None
+    wait_for(1)
+    assert published == [1]
+    assert catalog.current().revision == 1
+
+    # An import's chunks publish once, when it ends
+    with catalog.deferred_publish():
+        for _ in range(5):
+            catalog.request_publish()
+        time.sleep(0.1)
+        assert published == [1]
+    wait_for(2)
+    assert published == [1, 2]
+    assert catalog.current().revision == 2
+
+
+def test_unsupported_format_version_is_ignored(tmp_path):
+    from src.catalog_snapshot import FORMAT_VERSION, HEADER
+
+    data = bytearray(encode_snapshot(COURSES, EDGES, revision=1))
+    HEADER.pack_into(data, 0, b"CCAT", FORMAT_VERSION + 1, 0, 1, 0, 0, 0, 0)
+    path = str(tmp_path / "catalog.bin")
+    SharedCatalog(path).publish(bytes(data))
+    assert SharedCatalog(path).current() is None
+
+
+def test_longest_course_ids_keep_the_id_column_aligned():
+    import pytest
+    from src.services.filter_engine import FilterEngine
+
+    base = {"credits": 10, "department": "Informatics", "level": "master",
+            "language": "Norwegian", "semester_mask": 1, "is_active": True}
+    courses = [
+        {**base, "id": "DIGHEL4350", "title": "Digital humaniora"},
+        {**base, "id": "IN1000", "title": "Programmering"},
+        {**base, "id": "IN2000", "title": "Prosjekt"},
+    ]
+    snapshot = CatalogSnapshot(encode_snapshot(courses, [("IN2000", "DIGHEL4350", "mandatory")], revision=1))
+    assert [snapshot.course_id(i) for i in range(snapshot.course_count)] == ["DIGHEL4350", "IN1000", "IN2000"]
+    assert [snapshot.index_of(c["id"]) for c in courses] == [0, 1, 2]
+    assert sorted(snapshot.edges()) == [("DIGHEL4350", "IN2000")]
+
+    engine = FilterEngine.from_snapshot(snapshot)
+    assert engine.query(sort="id") == ["DIGHEL4350", "IN1000", "IN2000"]
+    assert engine.query(search="humaniora") == ["DIGHEL4350"]
+
+    with pytest.raises(ValueError):
+        encode_snapshot([{**base, "id": "TOOLONG12345", "title": "x"}], [], revision=1)
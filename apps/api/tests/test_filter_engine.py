@@ -0,0 +1,107 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hypothesis import given, settings, strategies as st
+from sqlalchemy import create_engine, delete, insert
+from sqlalchemy.orm import Session
+
+from src.database import Base
+from src.models import Course, semester_mask
+from src.services.course_service import CourseService
+from src.services.course_record import load_course_records
+from src.services.filter_engine import SORT_KEYS, FilterEngine
+
+engine = create_engine("sqlite://")
+Base.metadata.create_all(bind=engine)
+
+DEPARTMENTS = ["Informatics", "Mathematics", "Physics"]
+LANGUAGES = ["Norwegian", "English"]
+# SQLite's LIKE is only case-insensitive for ASCII, and treats % and _ as wildcards
+TEXT = st.text(alphabet="abAB ", max_size=6)
+
+courses = st.lists(
+    st.fixed_dictionaries({
+        "title": TEXT,
+        "description": st.none() | TEXT,
+        "credits": st.sampled_from([0, 5, 10, 15, 20]),
+        "department": st.sampled_from(DEPARTMENTS),
+        "level": st.sampled_from(["bachelor", "master", "phd"]),
+        "language": st.sampled_from(LANGUAGES),
+        "semester": st.lists(st.sampled_from(["fall", "spring"]), unique=True),
+        "is_active": st.booleans(),
+    }),
+    max_size=25,
+)
+
+filters = st.fixed_dictionaries({}, optional={
+    "department": st.sampled_from(DEPARTMENTS + ["Chemistry"]),
+    "level": st.sampled_from(["bachelor", "master", "phd"]),
+    "language": st.sampled_from(LANGUAGES + ["German"]),
+    "semester": st.sampled_from(["fall", "spring", "summer"]),
+    "search": TEXT,
+    "min_credits": st.integers(0, 20),
+    "max_credits": st.integers(0, 20),
+})
+
+
+@settings(max_examples=200, deadline=None)
+@given(
+    courses=courses,
+    filters=filters,
+    skip=st.integers(0, 10),
+    limit=st.integers(1, 30),
+    sort=st.sampled_from(SORT_KEYS),
+)
+def test_filter_engine_matches_sql(courses, filters, skip, limit, sort):
+    rows = [
+        {**course, "id": f"PB{1000 + n}", "semester_mask": semester_mask(course["semester"])}
+        for n, course in enumerate(courses)
+    ]
+    with Session(engine) as db:
+        db.execute(delete(Course))
+        if rows:
+            db.execute(insert(Course), rows)
+
+        filter_engine = FilterEngine.from_records(load_course_records(db))
+        expected = [
+            course.id for course in CourseService.get_courses(db, skip, limit, sort=sort, **filters)
+        ]
+        assert filter_engine.query(skip, limit, sort, **filters) == expected
+        db.rollback()
+
+
+def test_course_records_are_compact():
+    rows = [
+        {"id": f"CR{1000 + n}", "title": "Record", "credits": 10, "department": "Informatics",
+         "level": "master", "language": "English", "semester": ["fall"], "semester_mask": 1}
+        for n in range(2)
+    ]
+    with Session(engine) as db:
+        db.execute(delete(Course))
+        db.execute(insert(Course), rows)
+        first, second = load_course_records(db)
+        db.rollback()
+
+    assert not hasattr(first, "__dict__")
+    assert first.department is second.department
+    assert first.level.value == "master" and [s.value for s in first.semesters] == ["fall"]
+
+
+def test_search_text_is_not_padded_to_the_longest_row():
+    rows = [
+        {"id": f"TX{1000 + n}", "title": "Text", "credits": 10, "department": "Informatics",
+         "level": "master", "language": "English", "semester": [], "semester_mask": 0,
+         "description": "long " * 20000 if n == 0 else "short"}
+        for n in range(3)
+    ]
+    with Session(engine) as db:
+        db.execute(delete(Course))
+        db.execute(insert(Course), rows)
+        filter_engine = FilterEngine.from_records(load_course_records(db))
+        db.rollback()
+
+    assert filter_engine.text.dtype == object
+    assert filter_engine.text.nbytes == 3 * filter_engine.text.itemsize
+    assert filter_engine.query(search="SHORT") == ["TX1001", "TX1002"]
@@ -0,0 +1,67 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select
+
+from src.database import Base
+from src.models import prerequisite_table
+
+engine = create_engine("sqlite://")
+Base.metadata.create_all(bind=engine)
+
+
+def query_plan(statement) -> str:
+    compiled = statement.compile(engine, compile_kwargs={"render_postcompile": True})
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + str(compiled), params).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+
+# The listing is filtered in memory (FilterEngine); the database only serves
+# the key lookups below, which must not scan their tables
+def test_listing_payload_lookup_uses_primary_key():
+    from src.models import CourseReadModel
+
+    statement = select(CourseReadModel.id, CourseReadModel.payload).where(
+        CourseReadModel.id.in_(["IN1000", "IN2010"])
+    )
+    plan = query_plan(statement)
+    assert "SEARCH course_read_model USING" in plan and "SCAN" not in plan
+
+
+def test_read_model_refresh_lookups_use_primary_keys():
+    from src.models import Course
+    from src.services.read_model_service import COURSE_COLUMNS
+
+    ids = ["IN1000", "IN2010"]
+    for statement, table in [
+        (select(*COURSE_COLUMNS).where(Course.id.in_(ids)), "courses"),
+        (select(prerequisite_table).where(prerequisite_table.c.course_id.in_(ids)), "prerequisites"),
+    ]:
+        plan = query_plan(statement)
+        assert f"SEARCH {table} USING" in plan and "SCAN" not in plan
+
+
+def test_course_records_load_in_key_order_without_sorting():
+    from src.models import Course
+    from src.services.course_record import RECORD_COLUMNS
+
+    plan = query_plan(select(*RECORD_COLUMNS).order_by(Course.id))
+    assert "TEMP B-TREE" not in plan
+
+
+def test_reverse_prerequisite_lookup_uses_index():
+    statement = select(prerequisite_table.c.course_id).where(
+        prerequisite_table.c.prerequisite_id == "IN1000"
+    )
+    assert "ix_prerequisites_prerequisite_id" in query_plan(statement)
+
+
+def test_delta_query_uses_revision_index():
+    from src.models import Course
+
+    statement = select(Course.id, Course.is_active).where(Course.revision > 10)
+    assert "ix_courses_revision" in query_plan(statement)
@@ -3,12 +3,18 @@ import os
 
 # Set test API key before importing the app
 os.environ["API_KEY"] = "test-api-key-for-tests"
+# The whole suite runs as one client
+os.environ["RATE_LIMIT_BURST"] = "1000000"
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fastapi.testclient import TestClient
+from src.database import get_engine
 from src.main import app
+from src.startup import prepare_schema
 
+# The app leaves the schema to Alembic; the test database is created here
+prepare_schema("create")
 client = TestClient(app)
 
 
@@ -41,6 +47,11 @@ def test_get_course_not_found():
 def test_invalid_course_id_format():
     response = client.get("/courses/invalid!")
     assert response.status_code == 422
+    # Six letters is the longest prefix the schema accepts
+    assert client.get("/courses/ZZZZZZ9999").status_code == 404
+    assert client.get("/courses/ZZZZZZZ9999").status_code == 422
+    # Routes take the schema's pattern in either case
+    assert client.get("/courses/zzzzzz9999").status_code == 404
 
 
 def test_create_course_requires_api_key():
@@ -77,3 +88,767 @@ def test_create_course_with_api_key():
     data = response.json()
     assert data["id"] == course_id
     assert data["title"] == "Test Course"
+
+
+def test_prerequisite_cycle_rejected():
+    import random
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second = (f"CY{n}" for n in random.sample(range(1000, 9999), 2))
+    base = {"title": "Cycle Course", "credits": 10, "department": "Test", "level": "bachelor"}
+
+    assert client.post("/courses/", json={**base, "id": first}, headers=headers).status_code == 201
+    response = client.post(
+        "/courses/", json={**base, "id": second, "prerequisite_ids": [first]}, headers=headers
+    )
+    assert response.status_code == 201
+
+    response = client.put(f"/courses/{first}", json={"prerequisite_ids": [second]}, headers=headers)
+    assert response.status_code == 409
+    assert response.json()["detail"]["path"] == [first, second, first]
+
+    response = client.get(f"/courses/{first}")
+    assert response.json()["prerequisites"] == []
+
+
+def test_bulk_upsert_courses():
+    import random
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second = (f"BU{n}" for n in random.sample(range(1000, 9999), 2))
+    base = {"title": "Bulk Course", "credits": 10, "department": "Test", "level": "bachelor"}
+
+    response = client.post("/courses:bulk", json={"items": [
+        {**base, "id": first},
+        {**base, "id": second, "prerequisite_ids": [first]},
+        {**base, "id": "BAD"},
+    ]}, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["updated"], data["failed"]) == (2, 0, 1)
+    assert data["results"][2]["status"] == "error"
+    assert [p["id"] for p in client.get(f"/courses/{second}").json()["prerequisites"]] == [first]
+
+    response = client.post("/courses:bulk?atomic=true", json={"items": [
+        {"id": first, "title": "Renamed"},
+        {"id": second, "credits": "many"},
+    ]}, headers=headers)
+    assert response.status_code == 422
+    assert client.get(f"/courses/{first}").json()["title"] == "Bulk Course"
+
+    response = client.post("/courses:bulk", json={"items": [
+        {"id": first, "title": "Renamed", "prerequisite_ids": [second]},
+    ]}, headers=headers)
+    assert response.json()["results"][0]["errors"][0]["path"] == [first, second, first]
+
+    response = client.post("/courses:bulk", json={"items": [{"id": first, "title": "Renamed"}]}, headers=headers)
+    assert response.json()["updated"] == 1
+    assert client.get(f"/courses/{first}").json()["title"] == "Renamed"
+
+
+def test_statistics_follow_writes():
+    import random
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    course_id = f"ST{random.randint(1000, 9999)}"
+    before = client.get("/statistics/overview").json()
+
+    response = client.post("/courses/", json={
+        "id": course_id,
+        "title": "Statistics Course",
+        "credits": 5,
+        "department": "Statistics Test",
+        "level": "master",
+        "semester": ["fall"],
+        "language": "English",
+    }, headers=headers)
+    assert response.status_code == 201
+
+    after = client.get("/statistics/overview").json()
+    assert after["total_courses"] == before["total_courses"] + 1
+    assert after["total_credits"] == before["total_credits"] + 5
+    assert after["levels"]["master"] == before["levels"].get("master", 0) + 1
+    assert {"department": "Statistics Test", "count": 1, "credits": 5} in client.get(
+        "/statistics/departments"
+    ).json()
+
+    client.put(f"/courses/{course_id}", json={"level": "phd"}, headers=headers)
+    levels = {row["level"]: row["count"] for row in client.get("/statistics/levels").json()}
+    assert levels.get("master", 0) == before["levels"].get("master", 0)
+
+    client.delete(f"/courses/{course_id}", headers=headers)
+    assert client.get("/statistics/overview").json() == before
+
+
+def test_search_returns_facet_counts():
+    import random
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    department = f"Facet Test {random.randint(1000, 9999)}"
+    ids = [f"FA{n}" for n in random.sample(range(1000, 9999), 3)]
+    for course_id, level, semester in zip(ids, ["bachelor", "bachelor", "master"], ["fall", "spring", "fall"]):
+        client.post("/courses/", json={
+            "id": course_id, "title": "Facet Course", "credits": 10,
+            "department": department, "level": level, "semester": [semester],
+        }, headers=headers)
+
+    response = client.get("/courses/search", params={"department": department, "level": "bachelor", "limit": 1})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert len(data["items"]) == 1
+    assert data["facets"]["level"]["bachelor"] == 2
+    assert data["facets"]["level"]["master"] == 1
+    assert data["facets"]["semester"]["fall"] == 1
+    assert data["facets"]["department"][department] == 2
+
+
+def test_semester_filter_matches_whole_values():
+    import random
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    department = f"Semester Test {random.randint(1000, 9999)}"
+    fall, spring = (f"SE{n}" for n in random.sample(range(1000, 9999), 2))
+    client.post("/courses/", json={
+        "id": fall, "title": "Fall Course", "credits": 10, "department": department,
+        "level": "bachelor", "semester": ["fall"],
+    }, headers=headers)
+    client.post("/courses:bulk", json={"items": [{
+        "id": spring, "title": "Spring Course", "credits": 10, "department": department,
+        "level": "bachelor", "semester": ["spring", "fall"],
+    }]}, headers=headers)
+
+    def ids(semester):
+        response = client.get("/courses/", params={"department": department, "semester": semester})
+        return sorted(course["id"] for course in response.json())
+
+    assert ids("fall") == sorted([fall, spring])
+    assert ids("spring") == [spring]
+    assert ids("all") == []
+
+
+def test_read_model_follows_prerequisite_changes():
+    import random
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second, third = (f"RM{n}" for n in random.sample(range(1000, 9999), 3))
+    base = {"title": "Read Model Course", "credits": 10, "department": "Test", "level": "bachelor"}
+    client.post("/courses/", json={**base, "id": first}, headers=headers)
+    client.post("/courses/", json={**base, "id": second, "prerequisite_ids": [first]}, headers=headers)
+    client.post("/courses/", json={**base, "id": third, "prerequisite_ids": [second]}, headers=headers)
+
+    data = client.get(f"/courses/{third}").json()
+    assert data["prerequisites"] == [
+        {"id": second, "title": "Read Model Course", "title_english": None, "type": "mandatory"}
+    ]
+    assert data["transitive_prerequisite_count"] == 2
+    assert client.get(f"/courses/{first}").json()["dependent_count"] == 1
+
+    client.put(f"/courses/{second}", json={"title": "Renamed"}, headers=headers)
+    assert client.get(f"/courses/{third}").json()["prerequisites"][0]["title"] == "Renamed"
+
+    client.put(f"/courses/{second}", json={"prerequisite_ids": []}, headers=headers)
+    assert client.get(f"/courses/{third}").json()["transitive_prerequisite_count"] == 1
+    assert client.get(f"/courses/{first}").json()["dependent_count"] == 0
+
+    client.delete(f"/courses/{third}", headers=headers)
+    assert client.get(f"/courses/{third}").status_code == 404
+    listed = client.get("/courses/", params={"search": "read model", "limit": 1000}).json()
+    assert first in {c["id"] for c in listed} and third not in {c["id"] for c in listed}
+
+
+def test_prerequisite_updates_write_only_changed_edges():
+    import random
+    from sqlalchemy import event
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second, third, course = (f"ED{n}" for n in random.sample(range(1000, 9999), 4))
+    base = {"title": "Edge Course", "credits": 10, "department": "Test", "level": "bachelor"}
+    for prerequisite in (first, second, third):
+        client.post("/courses/", json={**base, "id": prerequisite}, headers=headers)
+    response = client.post("/courses/", json={
+        **base, "id": course, "prerequisite_ids": [first, {"id": second, "type": "recommended"}],
+    }, headers=headers)
+    assert response.status_code == 201
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        words = statement.split()
+        if words[0] != "SELECT" and "prerequisites" in words[:5]:
+            statements.append(words[0])
+
+    event.listen(get_engine(), "before_cursor_execute", record_statement)
+    try:
+        # Keep the first edge, retype the second, drop nothing, add the third
+        client.put(f"/courses/{course}", json={"prerequisite_ids": [
+            {"id": first}, {"id": second, "type": "mandatory"}, {"id": third, "type": "recommended"},
+        ]}, headers=headers)
+        assert sorted(statements) == ["INSERT", "UPDATE"]
+        statements.clear()
+        client.put(f"/courses/{course}", json={
+            "prerequisite_ids": [second, {"id": third, "type": "recommended"}],
+        }, headers=headers)
+        assert statements == ["DELETE"]
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", record_statement)
+
+    data = client.get(f"/courses/{course}").json()
+    assert sorted((p["id"], p["type"]) for p in data["prerequisites"]) == sorted(
+        [(second, "mandatory"), (third, "recommended")]
+    )
+    assert client.get(f"/courses/{first}").json()["dependent_count"] == 0
+    assert client.put(
+        f"/courses/{course}", json={"prerequisite_ids": [{"id": first, "type": "optional"}]}, headers=headers
+    ).status_code == 422
+
+
+def test_patch_course_merges_fields_with_if_match():
+    import random
+    from sqlalchemy import event
+    headers = {"X-API-Key": "test-api-key-for-tests", "Content-Type": "application/merge-patch+json"}
+    course_id = f"PA{random.randint(1000, 9999)}"
+    client.post("/courses/", json={
+        "id": course_id, "title": "Patch Me", "description": "Old", "credits": 10,
+        "department": "Test", "level": "bachelor", "semester": ["fall"],
+    }, headers=headers)
+    assert client.get(f"/courses/{course_id}").json()["version"] == 1
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(get_engine(), "before_cursor_execute", record_statement)
+    try:
+        response = client.patch(
+            f"/courses/{course_id}", content='{"title": "Patched", "description": null}', headers=headers
+        )
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", record_statement)
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"2"'
+    data = response.json()
+    assert (data["title"], data["description"], data["semester"], data["version"]) == ("Patched", None, ["fall"], 2)
+    # Scalar fields are written by one UPDATE ... RETURNING, without loading
+    # the course and its prerequisites through the ORM
+    assert sum("RETURNING" in statement for statement in statements) == 1
+    assert not any("JOIN prerequisites" in statement for statement in statements)
+
+    stale = client.patch(f"/courses/{course_id}", json={"credits": 5}, headers={**headers, "If-Match": '"1"'})
+    assert stale.status_code == 412
+    assert stale.headers["etag"] == '"2"'
+    fresh = client.patch(f"/courses/{course_id}", json={"credits": 5}, headers={**headers, "If-Match": '"2"'})
+    assert fresh.status_code == 200 and fresh.json()["credits"] == 5 and fresh.headers["etag"] == '"3"'
+
+    assert client.patch(f"/courses/{course_id}", json={"title": None}, headers=headers).status_code == 422
+    assert client.patch(f"/courses/{course_id}", json={"colour": "red"}, headers=headers).status_code == 422
+    assert client.patch("/courses/ZZ9998", json={"title": "Nope"}, headers=headers).status_code == 404
+
+
+def test_expensive_routes_are_rate_limited_and_shed(monkeypatch):
+    from src import rate_limit
+    clock = [0.0]
+    limiter = rate_limit.RateLimiter(rate_limit.LocalBucketStore(lambda: clock[0]), rate=1, burst=12)
+    monkeypatch.setattr(rate_limit, "rate_limiter", limiter)
+
+    assert client.get("/courses/prerequisite-counts").status_code == 200
+    limited = client.get("/courses/prerequisite-counts")
+    assert limited.status_code == 429
+    assert limited.headers["retry-after"] == "8"
+    # Cheap routes still fit in what is left of the bucket
+    assert client.get("/courses/ZZ9999").status_code == 404
+
+    clock[0] += 100
+    gate = rate_limit.ConcurrencyGate(0, wait=0)
+    monkeypatch.setattr(rate_limit, "heavy_gate", gate)
+    shed = client.get("/courses/prerequisite-counts")
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "1"
+    assert client.get("/courses/ZZ9999").status_code == 404
+
+
+def test_import_job_runs_in_background_with_progress():
+    import random
+    import time
+    from src.services.import_service import ImportService
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second, third = (f"JB{n}" for n in random.sample(range(1000, 9999), 3))
+    base = {"title": "Job Course", "credits": 10, "department": "Test", "level": "bachelor"}
+    items = [
+        # Listed before its prerequisite: the import orders them
+        {**base, "id": second, "prerequisite_ids": [{"id": first, "type": "recommended"}]},
+        {**base, "id": first},
+        {**base, "id": third, "credits": -1},
+    ]
+    assert ImportService.dependency_order(items) == [1, 0, 2]
+
+    response = client.post("/jobs/import", json={"items": items}, headers=headers)
+    assert response.status_code == 202
+    job = response.json()
+    assert response.headers["location"] == f"/jobs/{job['id']}"
+    assert job["kind"] == "import" and job["total"] == 3
+
+    deadline = time.monotonic() + 10
+    while job["status"] in ("queued", "running"):
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+        job = client.get(f"/jobs/{job['id']}").json()
+
+    assert job["status"] == "succeeded"
+    assert job["processed"] == 3
+    assert job["rows_per_second"] is not None
+    assert job["result"]["created"] == 2 and job["result"]["failed"] == 1
+    assert [(e["index"], e["id"]) for e in job["result"]["errors"]] == [(2, third)]
+    assert client.get(f"/courses/{second}").json()["prerequisites"][0]["type"] == "recommended"
+    assert client.get("/jobs/0123456789abcdef").status_code == 404
+
+
+def test_interrupted_import_resumes_from_its_checkpoint(monkeypatch):
+    import random
+    from src.database import SessionLocal
+    from src.models import ImportCheckpoint
+    from src.services.course_service import CourseService
+    from src.services.import_service import ImportService
+    prefix = f"CK{random.randint(10, 99)}"
+    items = [
+        {"id": f"{prefix}{n:02d}", "title": "Chunked", "credits": 5, "department": "Test", "level": "bachelor"}
+        for n in range(25)
+    ]
+    upsert = CourseService.bulk_upsert_courses
+    chunks = []
+
+    def flaky(db, chunk, atomic=False):
+        chunks.append([item["id"] for item in chunk])
+        if len(chunks) == 2:
+            raise ConnectionError("connection lost")
+        return upsert(db, chunk, atomic)
+
+    monkeypatch.setattr(CourseService, "bulk_upsert_courses", staticmethod(flaky))
+    reports = []
+    db = SessionLocal()
+    try:
+        try:
+            ImportService.import_courses(db, items, reports.append, chunk_size=10, checkpoint=prefix)
+        except ConnectionError:
+            db.rollback()
+        assert db.get(ImportCheckpoint, prefix).position == 10
+
+        summary = ImportService.import_courses(db, items, reports.append, chunk_size=10, checkpoint=prefix)
+    finally:
+        db.close()
+
+    # The committed first chunk is not written again
+    assert summary["resumed_from"] == 10 and summary["created"] == 15
+    assert chunks[2][0] == f"{prefix}10"
+    assert [(r.start, r.rows) for r in reports] == [(0, 10), (10, 10), (20, 5)]
+    assert all(r.rows_per_second > 0 for r in reports)
+    assert client.get(f"/courses/{prefix}24").status_code == 200
+
+    db = SessionLocal()
+    try:
+        # Finished imports drop their checkpoint; a rerun only skips what exists
+        assert db.get(ImportCheckpoint, prefix) is None
+        again = ImportService.import_courses(db, items, chunk_size=10, checkpoint=prefix, merge=True)
+    finally:
+        db.close()
+    assert again["skipped"] == 25 and again["created"] == 0
+
+
+def test_unchanged_data_file_is_skipped_without_reading(tmp_path, monkeypatch):
+    import json
+    import random
+    from src.database import SessionLocal
+    from src.services import import_service
+    from src.services.import_service import ImportService
+    first, second = (f"DF{n}" for n in random.sample(range(1000, 9999), 2))
+    base = {"title": "File Course", "credits": 5, "department": "Test", "level": "master"}
+    path = tmp_path / f"{first}.jsonl"
+    path.write_text(json.dumps({**base, "id": first}) + "\n", encoding="utf-8")
+
+    db = SessionLocal()
+    try:
+        assert ImportService.import_file(db, path)["created"] == 1
+
+        # Only the hash is computed for a file that was imported in full
+        def unread(path):
+            raise AssertionError("unchanged file was parsed")
+        monkeypatch.setattr(import_service, "read_courses", unread)
+        assert ImportService.import_file(db, path)["unchanged"] is True
+        monkeypatch.undo()
+
+        path.write_text(
+            json.dumps({**base, "id": first}) + "\n"
+            + json.dumps({**base, "id": second, "prerequisite_ids": [first]}) + "\n",
+            encoding="utf-8",
+        )
+        changed = ImportService.import_file(db, path)
+        forced = ImportService.import_file(db, path, force=True)
+    finally:
+        db.close()
+
+    assert changed["unchanged"] is False
+    assert (changed["created"], changed["skipped"], changed["prerequisites_added"]) == (1, 1, 1)
+    assert (forced["unchanged"], forced["skipped"]) == (False, 2)
+    assert client.get(f"/courses/{second}").json()["prerequisites"][0]["id"] == first
+
+
+def test_sync_plans_and_applies_only_the_differences():
+    import random
+    from src.database import SessionLocal
+    from src.models import CatalogChange, Course
+    from src.services.sync_service import SyncPlan, SyncService
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second, third, fourth = (f"SY{n}" for n in random.sample(range(1000, 9999), 4))
+    base = {"title": "Synced", "credits": 10, "department": "Test", "level": "bachelor", "semester": ["fall", "spring"]}
+    client.post("/courses/", json={**base, "id": first}, headers=headers)
+    client.post("/courses/", json={**base, "id": second, "prerequisite_ids": [first]}, headers=headers)
+    client.post("/courses/", json={**base, "id": third}, headers=headers)
+    source = [
+        # Semester order is not a change
+        {**base, "id": first, "credits": 5, "semester": ["spring", "fall"]},
+        {**base, "id": second},
+        {**base, "id": fourth, "prerequisite_ids": [{"id": first, "type": "recommended"}]},
+        {**base, "id": first, "title": "Shadowed"},
+    ]
+
+    db = SessionLocal()
+    try:
+        plan = SyncService.plan(db, source)
+        assert plan.inserts == [fourth]
+        assert plan.updates == {first: {"credits": (10, 5)}}
+        assert plan.edges.removed == {(second, first)}
+        assert plan.edges.added == {(fourth, first): "recommended"}
+        assert plan.shadowed == [first] and plan.deactivations == [] and third in plan.missing
+        assert {item["id"]: set(item) for item in plan.items if item["id"] != fourth} == {
+            first: {"id", "credits"}, second: {"id", "prerequisite_ids"},
+        }
+        assert SyncService.apply(db, plan)["failed"] == 0
+
+        again = SyncService.plan(db, source)
+        assert not again and again.unchanged == 3
+
+        missing = SyncService.plan(db, source, deactivate_missing=True)
+        assert third in missing.deactivations
+        warning = missing.describe().index(
+            f"WARNING: {len(missing.deactivations)} active courses are not in the source and will be deactivated:"
+        )
+        assert f"  DISABLE {third}" in missing.describe()[warning:]
+        SyncService.apply(db, SyncPlan(items=[item for item in missing.items if item["id"] == third]))
+        assert db.get(Course, third, populate_existing=True).is_active is False
+        last = (
+            db.query(CatalogChange).filter(CatalogChange.course_id == third)
+            .order_by(CatalogChange.revision.desc()).first()
+        )
+        assert last.operation == "delete"
+    finally:
+        db.close()
+
+    assert client.get(f"/courses/{first}").json()["credits"] == 5
+    assert client.get(f"/courses/{second}").json()["prerequisites"] == []
+    assert client.get(f"/courses/{fourth}").json()["prerequisites"][0]["type"] == "recommended"
+
+
+def test_cycle_check_sees_edges_written_by_another_worker():
+    import random
+    from sqlalchemy import insert
+    from src.database import SessionLocal
+    from src.models import prerequisite_table
+    from src.services.prerequisite_graph import get_prerequisite_graph
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second, third = (f"CW{n}" for n in random.sample(range(1000, 9999), 3))
+    base = {"title": "Worker Course", "credits": 10, "department": "Test", "level": "bachelor"}
+    for course_id in (first, second, third):
+        client.post("/courses/", json={**base, "id": course_id}, headers=headers)
+
+    db = SessionLocal()
+    try:
+        # Another worker commits first <- second; this worker's graph still lacks it
+        get_prerequisite_graph(db)
+        db.execute(insert(prerequisite_table), [{"course_id": first, "prerequisite_id": second, "type": "mandatory"}])
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.put(f"/courses/{second}", json={"prerequisite_ids": [first]}, headers=headers)
+    assert response.status_code == 409
+    assert response.json()["detail"]["path"] == [second, first, second]
+
+    db = SessionLocal()
+    try:
+        # Same race for a batch: third <- first arrives behind this worker's back
+        get_prerequisite_graph(db)
+        db.execute(insert(prerequisite_table), [{"course_id": third, "prerequisite_id": first, "type": "mandatory"}])
+        db.commit()
+    finally:
+        db.close()
+
+    items = [{"id": second, "title": "Renamed"}, {"id": first, "prerequisite_ids": [third]}]
+    bulk = client.post("/courses:bulk", json={"items": items}, headers=headers).json()
+    assert bulk["failed"] == 2 and bulk["results"][1]["errors"][0]["path"] == [first, third, first]
+    assert client.get(f"/courses/{second}").json()["title"] == "Worker Course"
+    db = SessionLocal()
+    try:
+        stored = db.execute(
+            prerequisite_table.select().where(prerequisite_table.c.course_id == first)
+        ).all()
+    finally:
+        db.close()
+    assert [row.prerequisite_id for row in stored] == [second]
+
+
+def test_read_model_follows_edges_written_by_another_worker():
+    import json
+    import random
+    from sqlalchemy import insert
+    from src.database import SessionLocal
+    from src.models import CourseReadModel, prerequisite_table
+    from src.services.prerequisite_graph import get_prerequisite_graph
+    from src.services.read_model_service import ReadModelService
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second, third = (f"RW{n}" for n in random.sample(range(1000, 9999), 3))
+    base = {"title": "Worker Course", "credits": 10, "department": "Test", "level": "bachelor"}
+    for course_id in (first, second, third):
+        client.post("/courses/", json={**base, "id": course_id}, headers=headers)
+
+    db = SessionLocal()
+    try:
+        # Another worker commits second <- first with its read model row;
+        # this worker's graph still lacks the edge
+        get_prerequisite_graph(db)
+        db.execute(insert(prerequisite_table), [{"course_id": second, "prerequisite_id": first, "type": "mandatory"}])
+        ReadModelService.refresh(db, [first, second])
+        db.commit()
+    finally:
+        db.close()
+
+    assert client.put(f"/courses/{first}", json={"title": "Renamed"}, headers=headers).status_code == 200
+    assert client.put(f"/courses/{first}", json={"prerequisite_ids": [third]}, headers=headers).status_code == 200
+
+    db = SessionLocal()
+    try:
+        row = json.loads(db.get(CourseReadModel, second).payload)
+    finally:
+        db.close()
+    assert row["prerequisites"][0]["title"] == "Renamed"
+    assert row["transitive_prerequisite_count"] == 2
+
+
+def test_stored_dependency_responses_follow_writes():
+    import random
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second = (f"RS{n}" for n in random.sample(range(1000, 9999), 2))
+    base = {"title": "Stored Course", "credits": 10, "department": "Test", "level": "bachelor",
+            "description": "Long description " * 50}
+    client.post("/courses/", json={**base, "id": first}, headers=headers)
+    client.post("/courses/", json={**base, "id": second, "prerequisite_ids": [first]}, headers=headers)
+
+    response = client.get(f"/courses/{second}/dependencies", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert {node["id"] for node in response.json()["nodes"]} == {first, second}
+    response = client.get(f"/courses/{second}", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["id"] == second
+
+    client.put(f"/courses/{first}", json={"title": "Renamed"}, headers=headers)
+    nodes = client.get(f"/courses/{second}/dependencies").json()["nodes"]
+    assert {node["id"]: node["label"] for node in nodes}[first] == "Renamed"
+
+
+def test_catalog_snapshot_answers_like_database():
+    import json
+    import random
+    from src.catalog_snapshot import CatalogSnapshot, build_snapshot
+    from src.database import SessionLocal
+    from src.services.course_service import CourseService
+    from src.services.read_model_service import ReadModelService
+
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second = (f"SN{n}" for n in random.sample(range(1000, 9999), 2))
+    base = {"title": "Snapshot Course", "credits": 10, "department": "Snapshot Test", "level": "master"}
+    client.post("/courses/", json={**base, "id": first, "semester": ["fall"]}, headers=headers)
+    client.post("/courses/", json={**base, "id": second, "prerequisite_ids": [first]}, headers=headers)
+
+    db = SessionLocal()
+    try:
+        snapshot = CatalogSnapshot(build_snapshot(db))
+        for filters in (
+            {},
+            {"department": "Snapshot Test"},
+            {"level": "MASTER", "semester": "fall"},
+            {"search": "snapshot"},
+            {"language": "Klingon"},
+        ):
+            from_database = ReadModelService.list_payloads(db, 0, 1000, **filters)
+            from_snapshot = [bytes(snapshot.payload(p)).decode() for p in snapshot.matching(**filters)]
+            assert [json.loads(p) for p in from_snapshot] == [json.loads(p) for p in from_database]
+
+        expected = json.loads(json.dumps(CourseService.get_course_dependencies(db, second)))
+        assert snapshot.dependencies(second) == expected
+        assert expected["total_prerequisite_count"] == 1
+        assert snapshot.dependencies("ZZ9999") is None
+    finally:
+        db.close()
+
+
+def test_listing_filters_and_sorts_by_credits():
+    import random
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    department = f"Credits Test {random.randint(1000, 9999)}"
+    ids = sorted(f"CR{n}" for n in random.sample(range(1000, 9999), 3))
+    for course_id, credits in zip(ids, [5, 20, 10]):
+        client.post("/courses/", json={
+            "id": course_id, "title": "Credits Course", "credits": credits,
+            "department": department, "level": "bachelor",
+        }, headers=headers)
+
+    def listed(**params):
+        response = client.get("/courses/", params={"department": department, **params})
+        assert response.status_code == 200
+        return [(course["id"], course["credits"]) for course in response.json()]
+
+    assert [credits for _, credits in listed(sort="-credits")] == [20, 10, 5]
+    assert listed(min_credits=10, sort="credits") == [(ids[2], 10), (ids[1], 20)]
+    assert client.get("/courses/", params={"sort": "title"}).status_code == 422
+
+
+def test_startup_warmup_loads_caches(monkeypatch):
+    import time
+    from src.startup import WARMUP_ENV, startup_state
+
+    monkeypatch.setenv(WARMUP_ENV, "1")
+    with TestClient(app) as warm_client:
+        deadline = time.monotonic() + 10
+        while startup_state.warmup == "running" and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert startup_state.warmup == "done"
+        assert warm_client.get("/courses/").status_code == 200
+
+
+def test_health_probes_use_cached_status():
+    assert client.get("/health/live").json() == {"status": "alive"}
+
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["ready"] and data["database"]["reachable"]
+    assert {"saturation", "capacity"} <= set(data["pool"])
+
+    # Probes only read what the background monitor stored; any query made
+    # meanwhile comes from the monitor's own thread
+    import threading
+    from sqlalchemy import event
+    from src.database import get_engine
+
+    query_threads = []
+
+    def record_thread(*args):
+        query_threads.append(threading.current_thread().name)
+
+    event.listen(get_engine(), "before_cursor_execute", record_thread)
+    try:
+        for _ in range(3):
+            assert client.get("/health/ready").status_code == 200
+            assert client.get("/health").status_code == 200
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", record_thread)
+    assert set(query_threads) <= {"health-monitor"}
+
+
+def test_health_reports_catalog_revision_from_change_log():
+    import random
+    from src.services.health_monitor import health_monitor
+
+    course_id = f"HC{random.randint(1000, 9999)}"
+    client.post(
+        "/courses/",
+        json={"id": course_id, "title": "Health Course", "credits": 10, "department": "Test", "level": "bachelor"},
+        headers={"X-API-Key": "test-api-key-for-tests"},
+    )
+    revision = client.get("/changes").json()["revision"]
+
+    # No snapshot is attached in the default mode; the monitor reads the log
+    catalog = health_monitor.refresh()["catalog"]
+    assert catalog["revision"] == revision
+    assert 0 <= catalog["age_seconds"] < 60
+    assert client.get("/health/ready").json()["catalog"]["revision"] >= revision
+
+
+def test_writes_are_published_to_the_change_feed():
+    import asyncio
+    import random
+    from src.main import change_events
+
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second = (f"CH{n}" for n in random.sample(range(1000, 9999), 2))
+    base = {"title": "Change Course", "credits": 10, "department": "Test", "level": "bachelor"}
+    since = client.get("/changes").json()["revision"]
+
+    client.post("/courses/", json={**base, "id": first}, headers=headers)
+    client.post("/courses/", json={**base, "id": second, "prerequisite_ids": [first]}, headers=headers)
+    client.put(f"/courses/{first}", json={"title": "Renamed"}, headers=headers)
+    client.delete(f"/courses/{second}", headers=headers)
+
+    data = client.get("/changes", params={"since": since}).json()
+    assert [(c["course_id"], c["operation"]) for c in data["changes"]] == [
+        (first, "create"),
+        (second, "create"), (first, "refresh"),
+        (first, "update"), (second, "refresh"),
+        (second, "delete"),
+    ]
+    assert data["revision"] == data["changes"][-1]["revision"] and not data["has_more"]
+    assert len(client.get("/changes", params={"since": since, "limit": 2}).json()["changes"]) == 2
+
+    class ConnectedRequest:
+        async def is_disconnected(self):
+            return False
+
+    async def first_events(count):
+        events = change_events(ConnectedRequest(), since)
+        try:
+            return [await events.__anext__() for _ in range(count)]
+        finally:
+            await events.aclose()
+
+    events = asyncio.run(first_events(2))
+    assert events[0].startswith(f"id: {data['changes'][0]['revision']}\nevent: change\n")
+    assert f'"course_id":"{first}"' in events[0]
+
+
+def test_course_delta_returns_only_changes():
+    import random
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    first, second = (f"DL{n}" for n in random.sample(range(1000, 9999), 2))
+    base = {"title": "Delta Course", "credits": 10, "department": "Test", "level": "bachelor"}
+    client.post("/courses/", json={**base, "id": first}, headers=headers)
+
+    full = client.get("/courses/delta").json()
+    assert full["reset"] and first in {course["id"] for course in full["courses"]}
+    since = full["revision"]
+    assert client.get("/courses/delta", params={"since": since}).json() == {
+        "revision": since, "reset": False, "courses": [], "deleted": [], "prerequisites": {},
+    }
+
+    client.post("/courses/", json={**base, "id": second, "prerequisite_ids": [first]}, headers=headers)
+    delta = client.get("/courses/delta", params={"since": since}).json()
+    assert delta["revision"] > since and not delta["reset"]
+    # The new course, and its prerequisite whose dependent count changed
+    assert sorted(course["id"] for course in delta["courses"]) == sorted([first, second])
+    assert delta["prerequisites"] == {second: [{"id": first, "type": "mandatory"}]}
+
+    client.delete(f"/courses/{first}", headers=headers)
+    delta = client.get("/courses/delta", params={"since": delta["revision"]}).json()
+    assert delta["deleted"] == [first]
+    assert [course["id"] for course in delta["courses"]] == [second]
+
+
+def test_reseed_tells_delta_clients_to_reset():
+    headers = {"X-API-Key": "test-api-key-for-tests"}
+    since = client.get("/courses/delta").json()["revision"]
+
+    assert client.post("/seed", params={"force": True}, headers=headers).status_code == 200
+    changes = client.get("/changes", params={"since": since}).json()["changes"]
+    assert {"course_id": None, "operation": "seed"} in [
+        {"course_id": c["course_id"], "operation": c["operation"]} for c in changes
+    ]
+    delta = client.get("/courses/delta", params={"since": since}).json()
+    assert delta["reset"] and delta["deleted"] == []
+    assert len(delta["courses"]) == client.get("/statistics/overview").json()["total_courses"]
+
+    # Seeding an unchanged file writes nothing and needs no reset
+    since = delta["revision"]
+    assert client.post("/seed", headers=headers).json()["unchanged"]
+    assert not client.get("/courses/delta", params={"since": since}).json()["reset"]
@@ -0,0 +1,97 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.requests import Request
+
+from src.rate_limit import ConcurrencyGate, LocalBucketStore, RateLimiter, client_key, listing_cost
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_request(query: str = "", headers=None, client=("10.0.0.1", 1234)) -> Request:
+    return Request({
+        "type": "http",
+        "query_string": query.encode(),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": client,
+    })
+
+
+def test_bucket_admits_burst_then_refills_at_rate():
+    clock = FakeClock()
+    limiter = RateLimiter(LocalBucketStore(clock), rate=2, burst=10)
+
+    assert [limiter.check("a", 4) for _ in range(2)] == [0, 0]
+    # 2 tokens left; 4 more come in 1s at 2/s
+    assert limiter.check("a", 4) == 1.0
+    assert limiter.check("b", 4) == 0
+    clock.now += 1
+    assert limiter.check("a", 4) == 0
+    clock.now += 100
+    # Refilled only up to the burst
+    assert [limiter.check("a", 5) for _ in range(3)] == [0, 0, 2.5]
+
+
+def test_cost_above_burst_needs_a_full_bucket():
+    clock = FakeClock()
+    limiter = RateLimiter(LocalBucketStore(clock), rate=1, burst=10)
+    assert limiter.check("a", 50) == 0
+    assert limiter.check("a", 50) == 10
+
+
+def test_failing_store_admits():
+    class BrokenStore:
+        def take(self, key, cost, rate, burst):
+            raise ConnectionError("store down")
+
+    assert RateLimiter(BrokenStore(), rate=1, burst=1).check("a", 1) == 0
+
+
+def test_concurrency_gate_sheds_when_full():
+    gate = ConcurrencyGate(1, wait=0.01)
+    assert gate.acquire()
+    assert not gate.acquire()
+    gate.release()
+    assert gate.acquire()
+
+
+def test_client_key_and_listing_cost(monkeypatch):
+    assert client_key(make_request()) == "ip:10.0.0.1"
+    monkeypatch.setenv("API_KEY", "secret")
+    assert client_key(make_request(headers={"X-API-Key": "secret"})).startswith("key:")
+    # A wrong key does not get its own bucket
+    assert client_key(make_request(headers={"X-API-Key": "guess"})) == "ip:10.0.0.1"
+    proxied = make_request(headers={"X-Forwarded-For": "192.0.2.7, 10.0.0.1"})
+    assert client_key(proxied) == "ip:10.0.0.1"
+    monkeypatch.setenv("RATE_LIMIT_TRUST_PROXY", "1")
+    assert client_key(proxied) == "ip:192.0.2.7"
+
+    assert listing_cost(make_request()) == 1.4
+    assert listing_cost(make_request("limit=1000&search=data")) == 7
+
+
+def test_non_ascii_api_key_is_rejected_not_an_error(monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.database import Base, get_engine
+    from src.main import app
+
+    monkeypatch.setenv("API_KEY", "secret")
+    Base.metadata.create_all(bind=get_engine())
+    client = TestClient(app)
+    headers = {"X-API-Key": "nøkkel".encode("latin-1")}
+
+    assert client.get("/courses/IN1000", headers=headers).status_code in (200, 404)
+    assert client.get("/statistics/overview", headers=headers).status_code == 200
+    response = client.post(
+        "/courses/", headers=headers,
+        json={"id": "NA1000", "title": "Junk", "credits": 10, "department": "Test", "level": "bachelor"},
+    )
+    assert response.status_code == 403
@@ -0,0 +1,104 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.single_flight import SingleFlight, flight_key
+
+
+def gated(calls):
+    """A computation that blocks until released, counting its runs"""
+    started = threading.Event()
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "answer"
+
+    return compute, started, release
+
+
+def test_concurrent_threads_share_one_computation():
+    flights = SingleFlight()
+    calls = []
+    compute, started, release = gated(calls)
+    key = flight_key("counts", department=None)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        leader = pool.submit(flights.do, key, compute)
+        started.wait(5)
+        followers = [pool.submit(flights.do, key, compute) for _ in range(7)]
+        while flights.stats("counts")["counts"]["coalesced"] < 7:
+            time.sleep(0.001)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert results == ["answer"] * 8
+    assert len(calls) == 1
+    assert flights.stats() == {"counts": {"executed": 1, "coalesced": 7, "in_flight": 0}}
+
+
+def test_async_callers_join_a_threadpool_call():
+    flights = SingleFlight()
+    calls = []
+    compute, started, release = gated(calls)
+    key = flight_key("courses", limit=100)
+
+    async def main():
+        leader = asyncio.ensure_future(flights.do_async(key, compute))
+        await asyncio.to_thread(started.wait, 5)
+        followers = [asyncio.ensure_future(flights.do_async(key, compute)) for _ in range(5)]
+        # A sync caller on another thread joins the same call
+        sync_caller = asyncio.ensure_future(asyncio.to_thread(flights.do, key, compute))
+        while flights.stats("courses")["courses"]["coalesced"] < 6:
+            await asyncio.sleep(0.001)
+        release.set()
+        return await asyncio.gather(leader, *followers, sync_caller)
+
+    assert asyncio.run(main()) == ["answer"] * 7
+    assert len(calls) == 1
+
+
+def test_errors_reach_every_caller_and_are_not_kept():
+    flights = SingleFlight()
+    key = flight_key("delta", since=0)
+
+    def fail():
+        raise RuntimeError("database went away")
+
+    with pytest.raises(RuntimeError):
+        flights.do(key, fail)
+    assert flights.do(key, lambda: "recovered") == "recovered"
+
+
+def test_reset_starts_a_new_computation_for_later_callers():
+    flights = SingleFlight()
+    calls = []
+    compute, started, release = gated(calls)
+    key = flight_key("counts")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        before = pool.submit(flights.do, key, compute)
+        started.wait(5)
+        flights.reset()
+        release.set()
+        after = flights.do(key, lambda: "after the write")
+
+    assert before.result() == "answer"
+    assert after == "after the write"
+    assert flights.stats("counts")["counts"]["coalesced"] == 0
+
+
+def test_flight_key_ignores_unset_params_and_order():
+    assert flight_key("courses", level="master", department=None, skip=0) == flight_key(
+        "courses", skip=0, level="master"
+    )
+    assert flight_key("courses", level="master") != flight_key("courses", level="bachelor")
@@ -0,0 +1,41 @@
+import sys
+import os
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from src.startup import prepare_schema
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_importing_the_app_does_not_touch_the_database():
+    result = subprocess.run(
+        [sys.executable, "-c", "import src.main, src.database as d; assert d._engine is None"],
+        cwd=API_DIR, capture_output=True, text=True,
+        env={**os.environ, "DATABASE_URL": "postgresql://nobody@unreachable.invalid/courses"},
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_schema_check_and_create():
+    engine = create_engine("sqlite://")
+    prepare_schema("none", engine)
+    with pytest.raises(RuntimeError, match="alembic upgrade head"):
+        prepare_schema("check", engine)
+
+    prepare_schema("create", engine)
+    assert "courses" in inspect(engine).get_table_names()
+    prepare_schema("check", engine)
+
+    # A table built by an older migration is caught too
+    with engine.begin() as connection:
+        connection.exec_driver_sql("ALTER TABLE prerequisites DROP COLUMN type")
+    with pytest.raises(RuntimeError, match="missing columns prerequisites.type"):
+        prepare_schema("check", engine)
+
+    with pytest.raises(RuntimeError):
+        prepare_schema("sometimes", engine)
@@ -0,0 +1,49 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from src.database import Base
+from src.models import Course, CourseStatistic
+from src.services.statistics_service import StatisticsService
+from src.startup import prepare_schema
+
+
+def make_course(course_id, department, credits=10):
+    return Course(id=course_id, title=course_id, credits=credits, department=department, level="bachelor")
+
+
+def test_counters_are_materialised_at_startup_not_on_reads():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add_all([make_course("ST1000", "Informatics"), make_course("ST1010", "Mathematics", 5)])
+        db.commit()
+
+        # A read counts the courses but leaves the table alone
+        assert StatisticsService.get_overview(db)["total_credits"] == 15
+        assert db.scalar(select(func.count()).select_from(CourseStatistic)) == 0
+
+    prepare_schema("create", engine)
+    with Session(engine) as db:
+        departments = StatisticsService.get_dimension(db, "department")
+        assert {row["department"]: row["count"] for row in departments} == {"Informatics": 1, "Mathematics": 1}
+
+
+def test_deltas_upsert_new_and_existing_counters():
+    engine = create_engine("sqlite://")
+    prepare_schema("create", engine)
+    with Session(engine) as db:
+        first = StatisticsService.footprint(make_course("ST2000", "Physics"))
+        second = StatisticsService.footprint(make_course("ST2010", "Physics", 5))
+        # The first course of a department creates its row, later ones add to it
+        StatisticsService.apply_change(db, {}, first)
+        StatisticsService.apply_changes(db, [({}, second), (first, {})])
+        db.commit()
+        assert StatisticsService.get_dimension(db, "department") == [
+            {"department": "Physics", "count": 1, "credits": 5},
+        ]
+        assert StatisticsService.get_overview(db)["total_courses"] == 1
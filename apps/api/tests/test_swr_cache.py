@@ -0,0 +1,115 @@
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.swr_cache import SwrCache
+
+
+class Loader:
+    """Returns 1, 2, 3, ... and records which threads built the values"""
+
+    def __init__(self):
+        self.calls = 0
+        self.threads = []
+
+    def __call__(self, db):
+        self.calls += 1
+        self.threads.append(threading.current_thread().name)
+        return self.calls
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_soft_ttl_serves_the_old_value_while_refreshing():
+    loader = Loader()
+    cache = SwrCache("test", loader, soft_ttl=0.05, hard_ttl=60, max_staleness=0)
+    assert cache.get(None) == 1
+    time.sleep(0.06)
+    # Past the soft TTL: no waiting, the refresh runs on the pool
+    assert cache.get(None) == 1
+    wait_for(lambda: cache.get(None) == 2)
+    assert loader.threads[1].startswith("cache-refresh")
+
+
+def test_hard_ttl_rebuilds_in_the_reader():
+    loader = Loader()
+    cache = SwrCache("test", loader, soft_ttl=0.01, hard_ttl=0.02, max_staleness=0)
+    cache.get(None)
+    time.sleep(0.03)
+    assert cache.get(None) == 2
+    assert loader.threads[1] == threading.current_thread().name
+
+
+def test_invalidation_is_served_stale_within_the_bound():
+    loader = Loader()
+    cache = SwrCache("test", loader, soft_ttl=60, hard_ttl=600, max_staleness=0.2)
+    cache.get(None)
+    cache.invalidate()
+    # Readers may see the previous value, but a dependent rebuild may not
+    assert cache.get(None) in (1, 2)
+    assert cache.get(None, fresh=True) >= 2
+    wait_for(lambda: not cache._refreshing)
+    assert loader.calls <= 3
+
+
+def test_staleness_bound_is_enforced():
+    release = threading.Event()
+    calls = []
+
+    def slow_loader(db):
+        calls.append(threading.current_thread().name)
+        if len(calls) == 2:
+            # The background refresh hangs past the bound
+            release.wait(5)
+        return len(calls)
+
+    cache = SwrCache("test", slow_loader, soft_ttl=60, hard_ttl=600, max_staleness=0.05)
+    cache.get(None)
+    cache.invalidate()
+    assert cache.get(None) == 1
+    time.sleep(0.06)
+    release.set()
+    # Too stale to serve: the reader waits for a build to finish
+    assert cache.get(None) >= 2
+
+
+def test_zero_staleness_drops_the_value_on_invalidation():
+    loader = Loader()
+    cache = SwrCache("test", loader, soft_ttl=60, hard_ttl=600, max_staleness=0)
+    cache.get(None)
+    cache.invalidate()
+    assert cache.get(None) == 2
+    assert loader.threads == [threading.current_thread().name] * 2
+
+
+def test_build_that_raced_an_invalidation_is_not_kept():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader(db):
+        calls.append(1)
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+        return len(calls)
+
+    cache = SwrCache("test", loader, soft_ttl=60, hard_ttl=600, max_staleness=0)
+    first = []
+    builder = threading.Thread(target=lambda: first.append(cache.get(None)))
+    builder.start()
+    started.wait(5)
+    cache.invalidate()
+    release.set()
+    builder.join(5)
+    assert first == [1]
+    # Value 1 was read before the write, so the next reader builds again
+    assert cache.get(None) == 2
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import { api } from '../services/api';
+import { syncCourses } from '../services/courseCache';
 import { DependencyVisualization } from '../components/dependency/DependencyVisualization';
 import type { Course } from '../types';
 
@@ -14,7 +15,7 @@ export const CourseMap = () => {
     const fetchData = async () => {
       try {
         const [coursesData, counts] = await Promise.all([
-          api.getCourses(),
+          syncCourses(),
           api.getPrerequisiteCounts(),
         ]);
 
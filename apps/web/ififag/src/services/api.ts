@@ -1,5 +1,5 @@
 import axios from "axios";
-import type { Course, FilterOptions, DependencyGraph } from "../types";
+import type { Course, CourseDelta, FilterOptions, DependencyGraph } from "../types";
 
 // VITE_API_URL allows overriding for local dev (e.g. http://localhost:8000)
 // In production, nginx proxies /coursecatalog/api/ to the FastAPI container
@@ -34,6 +34,11 @@ export const api = {
     return response.data;
   },
 
+  getCourseDelta: async (since: number): Promise<CourseDelta> => {
+    const response = await apiClient.get('/courses/delta', { params: { since } });
+    return response.data;
+  },
+
   getPrerequisiteCounts: async (): Promise<Record<string, number>> => {
     const response = await apiClient.get('/courses/prerequisite-counts');
     return response.data;
@@ -0,0 +1,42 @@
+import { api } from "./api";
+import type { Course } from "../types";
+
+// The full catalog is kept in localStorage and brought up to date with
+// /courses/delta, so a returning visitor only downloads what changed
+const STORAGE_KEY = 'coursecatalog:courses';
+
+interface CachedCatalog {
+  revision: number;
+  courses: Record<string, Course>;
+}
+
+const loadCache = (): CachedCatalog | null => {
+  try {
+    const stored = localStorage.getItem(STORAGE_KEY);
+    return stored ? JSON.parse(stored) : null;
+  } catch {
+    return null;
+  }
+};
+
+const saveCache = (cache: CachedCatalog) => {
+  try {
+    localStorage.setItem(STORAGE_KEY, JSON.stringify(cache));
+  } catch {
+    // Storage full or unavailable: the next load does a full sync
+  }
+};
+
+export const syncCourses = async (): Promise<Course[]> => {
+  const cached = loadCache();
+  const delta = await api.getCourseDelta(cached?.revision ?? 0);
+
+  const courses = delta.reset || !cached ? {} : { ...cached.courses };
+  delta.deleted.forEach((id) => delete courses[id]);
+  delta.courses.forEach((course) => {
+    courses[course.id] = course;
+  });
+  saveCache({ revision: delta.revision, courses });
+
+  return Object.values(courses).sort((a, b) => a.id.localeCompare(b.id));
+};
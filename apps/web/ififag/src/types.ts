@@ -43,3 +43,16 @@ export interface DependencyGraph {
   nodes: DependencyNode[];
   edges: DependencyEdge[];
 }
+
+export interface PrerequisiteEdge {
+  id: string;
+  type: string;
+}
+
+export interface CourseDelta {
+  revision: number;
+  reset: boolean;
+  courses: Course[];
+  deleted: string[];
+  prerequisites: Record<string, PrerequisiteEdge[]>;
+}